@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark de bout en bout d'un cycle de collecte, sans accès réseau.
+Usage: python benchmarks/bench_cycle.py [--feeds 20] [--items 50] [--cycles 5]
+                                        [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from fakes import FakeAirtable, FeedServer
+from common import git_commit
+
+# Métriques comparées avec --compare (sens : plus haut est meilleur ?)
+COMPARED_METRICS = {
+    "throughput_articles_per_s": True,
+    "cycle_p50_s": False,
+    "cycle_p99_s": False,
+    "peak_rss_mb": False,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Percentile par interpolation linéaire."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus (None si indisponible)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : kilo-octets, macOS : octets
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_config(workdir: str, feed_urls: List[str], args) -> str:
+    """Écrit la configuration du benchmark (RSS local, Airtable simulé)."""
+    config = {
+        "app": {"name": "InfoWatchdog benchmark", "state_dir": os.path.join(workdir, "data")},
+        "collectors": {
+            "reddit": {"enabled": False},
+            "rss": {
+                "enabled": True,
+                "timeout": 10,
+                "max_workers": args.workers,
+                # Le serveur local simule des sites distincts sur un seul hôte
+                "per_host": {"max_connections": args.workers, "min_interval": args.host_interval},
+                "feeds": [{"url": url, "name": f"Bench {index}"} for index, url in enumerate(feed_urls)],
+            },
+        },
+        "storage": {"type": "airtable", "enabled": True},
+        "monitoring": {"trace_file": os.path.join(workdir, "cycle_trace.jsonl")},
+        "schedule": {"interval": 3600, "cycle_timeout": args.cycle_timeout},
+    }
+    path = os.path.join(workdir, "config.yml")
+    with open(path, "w", encoding="utf-8") as file:
+        yaml.safe_dump(config, file)
+    return path
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    """
+    Exécute les cycles et mesure débit, durées et mémoire.
+
+    Returns:
+        Résultats sérialisables en JSON
+    """
+    import storage.airtable_storage as airtable_storage
+    from main import InfoWatchdog
+
+    FakeAirtable.configure(latency=args.airtable_latency, rate_limit_ratio=args.rate_limit, seed=args.seed)
+    airtable_storage.Airtable = FakeAirtable
+    os.environ.setdefault("AIRTABLE_API_KEY", "bench")
+    os.environ.setdefault("AIRTABLE_BASE_ID", "bench")
+
+    server = FeedServer(
+        feeds=args.feeds, items=args.items, feed_format=args.format,
+        new_ratio=args.new_ratio, relevant_ratio=args.relevant_ratio, latency=args.feed_latency
+    ).start()
+
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="infowatchdog-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            config_path = write_config(workdir, server.urls, args)
+            watchdog = InfoWatchdog(config_path)
+            logging.getLogger().setLevel(logging.WARNING)
+
+            durations, collected, stored_before = [], [], 0
+            for cycle in range(args.warmup + args.cycles):
+                if cycle:
+                    server.next_generation()
+
+                start = time.perf_counter()
+                report = watchdog.run_collection_cycle()
+                duration = time.perf_counter() - start
+
+                if cycle >= args.warmup:
+                    durations.append(duration)
+                    collected.append(report["articles_collected"])
+                else:
+                    stored_before = len(FakeAirtable.tables.get(watchdog.storage.table_name, []))
+
+            stored = len(FakeAirtable.tables.get(watchdog.storage.table_name, [])) - stored_before
+            watchdog.close()
+        finally:
+            os.chdir(previous_dir)
+            server.stop()
+
+    total_time = sum(durations)
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "params": {
+            "feeds": args.feeds, "items": args.items, "format": args.format,
+            "cycles": args.cycles, "warmup": args.warmup, "new_ratio": args.new_ratio,
+            "relevant_ratio": args.relevant_ratio, "feed_latency": args.feed_latency,
+            "airtable_latency": args.airtable_latency, "rate_limit": args.rate_limit, "seed": args.seed,
+            "workers": args.workers, "host_interval": args.host_interval,
+        },
+        "results": {
+            "articles_collected": sum(collected),
+            "articles_stored": stored,
+            "throughput_articles_per_s": round(sum(collected) / total_time, 2) if total_time else 0.0,
+            "cycle_p50_s": round(percentile(durations, 0.50), 4),
+            "cycle_p99_s": round(percentile(durations, 0.99), 4),
+            "cycle_durations_s": [round(duration, 4) for duration in durations],
+            "feed_requests": server.requests,
+            "feed_bytes": server.bytes_served,
+            "airtable_requests": FakeAirtable.requests,
+            "airtable_rate_limited": FakeAirtable.rate_limited,
+            "peak_rss_mb": round(peak_rss_mb(), 1) if peak_rss_mb() is not None else None,
+        },
+    }
+
+
+def compare(results: Dict[str, Any], baseline_path: str) -> bool:
+    """
+    Affiche l'écart avec un résultat de référence.
+
+    Args:
+        results: Résultats courants
+        baseline_path: Fichier JSON produit par --output
+
+    Returns:
+        False si les paramètres des deux exécutions diffèrent
+    """
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("params") != results["params"]:
+        print("⚠️  Parameters differ from the baseline, comparison is not meaningful")
+
+    print(f"\nComparison with {baseline.get('commit') or baseline_path}:")
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        before = baseline["results"].get(metric)
+        after = results["results"].get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        better = change > 0 if higher_is_better else change < 0
+        if abs(change) < 0.02:
+            marker = "➖"
+        else:
+            marker = "✅" if better else "❌"
+        print(f"  {marker} {metric:<28} {before:>10} -> {after:>10} ({change:+.1%})")
+
+    return baseline.get("params") == results["params"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InfoWatchdog end-to-end cycle benchmark (offline)")
+    parser.add_argument("--feeds", type=int, default=20, help="Nombre de flux servis")
+    parser.add_argument("--items", type=int, default=50, help="Entrées par flux")
+    parser.add_argument("--format", choices=["rss", "atom", "mixed"], default="mixed", help="Format des flux")
+    parser.add_argument("--cycles", type=int, default=5, help="Cycles mesurés")
+    parser.add_argument("--warmup", type=int, default=1, help="Cycles d'échauffement non mesurés")
+    parser.add_argument("--new-ratio", type=float, default=0.5, help="Part des entrées renouvelées à chaque cycle")
+    parser.add_argument("--relevant-ratio", type=float, default=0.8, help="Part des entrées pertinentes")
+    parser.add_argument("--feed-latency", type=float, default=0.0, help="Latence du serveur de flux (s)")
+    parser.add_argument("--airtable-latency", type=float, default=0.0, help="Latence par requête Airtable simulée (s)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Part des requêtes Airtable rejetées (429)")
+    parser.add_argument("--workers", type=int, default=4, help="Flux téléchargés simultanément")
+    parser.add_argument("--host-interval", type=float, default=0.0, help="Espacement des requêtes vers l'hôte local (s)")
+    parser.add_argument("--cycle-timeout", type=float, default=3600, help="Budget de chaque cycle (s)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine des tirages aléatoires")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", help="Résultats de référence (JSON) à comparer")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+
+    summary = results["results"]
+    print(f"Commit: {results['commit']}")
+    print(f"Articles collected: {summary['articles_collected']} (stored: {summary['articles_stored']})")
+    print(f"Throughput: {summary['throughput_articles_per_s']} articles/s")
+    print(f"Cycle time: p50 {summary['cycle_p50_s']} s, p99 {summary['cycle_p99_s']} s")
+    print(f"Airtable requests: {summary['airtable_requests']} ({summary['airtable_rate_limited']} rate limited)")
+    print(f"Peak RSS: {summary['peak_rss_mb']} MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark du parseur rapide (fast_feed_parser) face à feedparser, sans accès réseau.
+Usage: python benchmarks/bench_feed_parser.py [--items 50 500 5000] [--repeat 5] [--output results.json]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict
+
+import feedparser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from fakes import build_feed
+from collectors import fast_feed_parser
+from collectors.rss_collector import RSSCollector, parse_feed
+from common import git_commit
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """Meilleure durée (secondes) de `repeat` exécutions."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def same_articles(content: bytes) -> bool:
+    """Vérifie que les deux parseurs produisent les mêmes articles (hash, dates, auteurs, tags)."""
+    collector = RSSCollector({"feeds": []})
+
+    def summary(parser: str):
+        _, _, rows, _ = parse_feed(content, parser)
+        articles = [collector._article_from_fields(fields, "", "") for fields in rows]
+        return [(a["hash"], a["author"], sorted(a["tags"]), a["content"]) for a in articles], \
+            [a["published_date"] for a in articles]
+
+    slow, slow_dates = summary("feedparser")
+    fast, fast_dates = summary("fast")
+    # Les entrées sans date reçoivent l'heure courante : tolérance de quelques secondes
+    return slow == fast and len(slow_dates) == len(fast_dates) and all(
+        abs(a - b) < 5 for a, b in zip(slow_dates, fast_dates)
+    )
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    """
+    Mesure les deux parseurs sur des flux synthétiques et enregistrés.
+
+    Returns:
+        Résultats sérialisables en JSON
+    """
+    documents = {}
+    for items in args.items:
+        for feed_format in ("rss", "atom"):
+            documents[f"{feed_format}-{items}"] = build_feed(0, items, 0, feed_format=feed_format)
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.xml"))):
+        documents[os.path.basename(path)] = open(path, "rb").read()
+
+    results = {}
+    for name, content in documents.items():
+        entries = len(fast_feed_parser.parse(content).entries)
+        slow = best_time(lambda: feedparser.parse(content), args.repeat)
+        fast = best_time(lambda: fast_feed_parser.parse(content), args.repeat)
+        results[name] = {
+            "bytes": len(content),
+            "entries": entries,
+            "feedparser_s": round(slow, 5),
+            "fast_s": round(fast, 5),
+            "speedup": round(slow / fast, 1) if fast else None,
+            "same_articles": same_articles(content),
+        }
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "params": {"items": args.items, "repeat": args.repeat},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InfoWatchdog feed parser benchmark (offline)")
+    parser.add_argument("--items", type=int, nargs="+", default=[50, 500, 5000], help="Tailles des flux synthétiques")
+    parser.add_argument("--repeat", type=int, default=5, help="Exécutions par mesure (la meilleure est retenue)")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+
+    print(f"Commit: {results['commit']}")
+    print(f"\n  {'feed':<20} {'size':>10} {'entries':>8} {'feedparser':>11} {'fast':>9} {'speedup':>8}  same articles")
+    for name, result in results["results"].items():
+        print(f"  {name:<20} {result['bytes']:>10} {result['entries']:>8} {result['feedparser_s']:>10.4f}s "
+              f"{result['fast_s']:>8.4f}s {result['speedup']:>7}x  {'✅' if result['same_articles'] else '❌'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks du traitement par entrée RSS (pertinence, extraction, nettoyage, hash).
+Usage: python benchmarks/bench_hot_path.py [--repeat 7] [--output results.json]
+                                           [--baseline results.json] [--threshold 0.10]
+       python benchmarks/bench_hot_path.py --record URL NAME
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import feedparser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from collectors.rss_collector import RSSCollector
+from common import git_commit
+
+
+def load_fixtures(pattern: str) -> Dict[str, List[Any]]:
+    """
+    Parse les flux enregistrés.
+
+    Args:
+        pattern: Motif glob des fichiers de flux
+
+    Returns:
+        Entrées feedparser par fichier
+    """
+    fixtures = {}
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "rb") as file:
+            fixtures[os.path.basename(path)] = feedparser.parse(file.read()).entries
+    return fixtures
+
+
+def build_cases(collector: RSSCollector, entries: List[Any]) -> Dict[str, Tuple[Callable, List[Any]]]:
+    """
+    Associe chaque étape du traitement par entrée à ses entrées pré-calculées.
+
+    Les entrées de chaque étape sont celles qu'elle reçoit lors d'une vraie
+    collecte, afin de mesurer l'étape seule.
+
+    Args:
+        collector: Collecteur RSS mesuré
+        entries: Entrées feedparser
+
+    Returns:
+        Fonction et liste d'arguments par étape
+    """
+    texts = [f"{entry.get('title', '')} {entry.get('summary', '')}" for entry in entries]
+    contents = [collector._extract_content(entry) for entry in entries]
+    title_links = [(entry.get('title', 'No title'), entry.get('link', '')) for entry in entries]
+
+    return {
+        "is_relevant": (collector._is_relevant, texts),
+        "extract_content": (collector._extract_content, entries),
+        "parse_date": (collector._parse_date, entries),
+        "extract_author": (collector._extract_author, entries),
+        "extract_tags": (collector._extract_tags_from_entry, entries),
+        "clean_text": (collector._clean_text, [title for title, _ in title_links] + contents),
+        "generate_hash": (lambda pair: collector._generate_hash(*pair), title_links),
+        "entry_to_article": (
+            lambda entry: collector._entry_to_article(entry, "https://bench.invalid/feed", "Bench"),
+            entries
+        ),
+    }
+
+
+def measure_time(function: Callable, inputs: List[Any], repeat: int) -> float:
+    """
+    Mesure le coût par appel (meilleure de `repeat` séries).
+
+    Returns:
+        Durée par appel en nanosecondes
+    """
+    def run():
+        for value in inputs:
+            function(value)
+
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / (number * len(inputs)) * 1e9
+
+
+def measure_allocations(function: Callable, inputs: List[Any]) -> Dict[str, float]:
+    """
+    Mesure les allocations d'un passage sur les entrées.
+
+    Returns:
+        Pic d'octets alloués et blocs conservés (résultats), par appel
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        results = [function(value) for value in inputs]
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del results
+    return {
+        "peak_bytes_per_entry": round((peak - baseline) / len(inputs), 1),
+        "retained_blocks_per_entry": round(retained / len(inputs), 2),
+    }
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    """
+    Mesure chaque étape sur l'ensemble des flux enregistrés.
+
+    Returns:
+        Résultats sérialisables en JSON
+    """
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        raise SystemExit(f"No fixtures matching {args.fixtures}")
+
+    collector = RSSCollector({"feeds": []})
+    entries = [entry for feed_entries in fixtures.values() for entry in feed_entries]
+
+    results = {}
+    for name, (function, inputs) in build_cases(collector, entries).items():
+        results[name] = {"ns_per_entry": round(measure_time(function, inputs, args.repeat), 1)}
+        results[name].update(measure_allocations(function, inputs))
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "params": {
+            "fixtures": {name: len(feed_entries) for name, feed_entries in fixtures.items()},
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def check_regressions(results: Dict[str, Any], baseline_path: str, threshold: float) -> List[str]:
+    """
+    Compare le coût par entrée avec une référence.
+
+    Args:
+        results: Résultats courants
+        baseline_path: Fichier JSON produit par --output
+        threshold: Hausse relative tolérée (0.10 = 10 %)
+
+    Returns:
+        Étapes dont le coût a dépassé le seuil
+    """
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("params") != results["params"]:
+        print("⚠️  Fixtures differ from the baseline, comparison is not meaningful")
+
+    regressions = []
+    print(f"\nComparison with {baseline.get('commit') or baseline_path} (threshold {threshold:.0%}):")
+    for name, current in results["results"].items():
+        before = baseline["results"].get(name, {}).get("ns_per_entry")
+        if not before:
+            continue
+        change = (current["ns_per_entry"] - before) / before
+        if change > threshold:
+            marker = "❌"
+            regressions.append(name)
+        else:
+            marker = "✅" if change < -threshold else "➖"
+        print(f"  {marker} {name:<18} {before:>10.1f} -> {current['ns_per_entry']:>10.1f} ns ({change:+.1%})")
+
+    return regressions
+
+
+def record_fixture(url: str, name: str):
+    """
+    Enregistre un flux réel comme fixture.
+
+    Args:
+        url: URL du flux
+        name: Nom du fichier (sans extension)
+    """
+    import requests
+
+    response = requests.get(url, headers={"User-Agent": "InfoWatchdog RSS Collector/1.0"}, timeout=30)
+    response.raise_for_status()
+    path = os.path.join(FIXTURES_DIR, f"{name}.xml")
+    with open(path, "wb") as file:
+        file.write(response.content)
+    print(f"Recorded {len(feedparser.parse(response.content).entries)} entries to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InfoWatchdog per-entry hot path micro-benchmarks")
+    parser.add_argument("--fixtures", default=os.path.join(FIXTURES_DIR, "*.xml"), help="Motif glob des flux enregistrés")
+    parser.add_argument("--repeat", type=int, default=7, help="Séries mesurées (la meilleure est retenue)")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--baseline", help="Résultats de référence (JSON) : échoue en cas de régression")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Hausse tolérée du coût par entrée")
+    parser.add_argument("--record", nargs=2, metavar=("URL", "NAME"), help="Enregistre un flux réel dans fixtures/")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixture(*args.record)
+        return
+
+    results = run_benchmark(args)
+
+    print(f"Commit: {results['commit']}")
+    print(f"Fixtures: {', '.join(f'{name} ({count})' for name, count in results['params']['fixtures'].items())}")
+    print(f"\n  {'stage':<18} {'ns/entry':>10} {'peak B/entry':>13} {'blocks/entry':>13}")
+    for name, stage in results["results"].items():
+        print(f"  {name:<18} {stage['ns_per_entry']:>10.1f} {stage['peak_bytes_per_entry']:>13.1f} "
+              f"{stage['retained_blocks_per_entry']:>13.2f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = check_regressions(results, args.baseline, args.threshold)
+        if regressions:
+            print(f"Regression above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
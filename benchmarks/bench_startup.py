@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark du temps de démarrage (import, initialisation, --stats), sans accès réseau.
+Usage: python benchmarks/bench_startup.py [--runs 10] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import yaml
+
+from common import git_commit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Scénarios mesurés, chacun dans un interpréteur neuf
+SCENARIOS = ["import", "init", "stats", "collectors"]
+
+# Dépendances lourdes dont le chargement est signalé
+HEAVY_MODULES = ["praw", "feedparser", "requests", "airtable", "http.server", "pandas", "bs4"]
+
+
+def write_config(workdir: str) -> str:
+    """Écrit une configuration avec tous les collecteurs activés et Airtable simulé."""
+    config = {
+        "app": {"name": "InfoWatchdog benchmark", "state_dir": os.path.join(workdir, "data")},
+        "collectors": {
+            "reddit": {"enabled": True, "subreddits": ["environment", "climate"]},
+            "rss": {"enabled": True, "feeds": [{"url": "http://127.0.0.1:9/feed.xml", "name": "Bench"}]},
+        },
+        "storage": {"type": "airtable", "enabled": True},
+        "monitoring": {"trace_file": os.path.join(workdir, "cycle_trace.jsonl")},
+    }
+    path = os.path.join(workdir, "config.yml")
+    with open(path, "w", encoding="utf-8") as file:
+        yaml.safe_dump(config, file)
+    return path
+
+
+def run_child(scenario: str, config_path: str):
+    """
+    Exécute un scénario dans le processus courant et affiche sa mesure (JSON).
+
+    Args:
+        scenario: Nom du scénario (voir SCENARIOS)
+        config_path: Configuration du benchmark
+    """
+    # Outillage du benchmark chargé hors mesure (fakes importe http.server)
+    import logging
+    sys.path.insert(0, BENCH_DIR)
+    from fakes import FakeAirtable
+    logging.disable(logging.CRITICAL)
+    preloaded = set(sys.modules)
+
+    start = time.perf_counter()
+    sys.path.insert(0, os.path.join(ROOT, 'src'))
+    import main
+
+    if scenario != "import":
+        # Airtable simulé : l'initialisation du stockage ne doit pas toucher le réseau
+        import storage.airtable_storage as airtable_storage
+        airtable_storage.Airtable = FakeAirtable
+
+        watchdog = main.InfoWatchdog(config_path)
+
+        if scenario == "stats":
+            watchdog.get_stats()
+        elif scenario == "collectors":
+            watchdog.collectors
+
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "elapsed_s": elapsed,
+        "loaded": [name for name in HEAVY_MODULES if name in sys.modules and name not in preloaded],
+    }))
+
+
+def measure(scenario: str, config_path: str, workdir: str) -> Dict[str, Any]:
+    """
+    Lance un scénario dans un interpréteur neuf.
+
+    Le temps total inclut le démarrage de l'interpréteur et l'outillage du
+    benchmark ; le temps interne ne couvre que l'import et l'initialisation.
+
+    Returns:
+        Temps total du processus, temps mesuré en interne et modules lourds chargés
+    """
+    env = dict(os.environ)
+    env.update({
+        "AIRTABLE_API_KEY": "bench", "AIRTABLE_BASE_ID": "bench",
+        "REDDIT_CLIENT_ID": "bench", "REDDIT_CLIENT_SECRET": "bench",
+    })
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", scenario, config_path],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+    child = json.loads(result.stdout.strip().splitlines()[-1])
+    return {"wall_s": wall, "elapsed_s": child["elapsed_s"], "loaded": child["loaded"]}
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    """
+    Mesure chaque scénario `runs` fois (après une exécution d'échauffement).
+
+    Returns:
+        Résultats sérialisables en JSON
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="infowatchdog-startup-") as workdir:
+        config_path = write_config(workdir)
+        for scenario in args.scenarios:
+            measure(scenario, config_path, workdir)
+            samples = [measure(scenario, config_path, workdir) for _ in range(args.runs)]
+            results[scenario] = {
+                "wall_median_s": round(statistics.median(s["wall_s"] for s in samples), 4),
+                "wall_min_s": round(min(s["wall_s"] for s in samples), 4),
+                "in_process_median_s": round(statistics.median(s["elapsed_s"] for s in samples), 4),
+                "heavy_modules": samples[-1]["loaded"],
+            }
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "params": {"runs": args.runs, "scenarios": args.scenarios},
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline_path: str):
+    """
+    Affiche l'écart de temps de démarrage avec un résultat de référence.
+
+    Args:
+        results: Résultats courants
+        baseline_path: Fichier JSON produit par --output
+    """
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    print(f"\nComparison with {baseline.get('commit') or baseline_path}:")
+    for scenario, current in results["results"].items():
+        before = baseline["results"].get(scenario, {}).get("wall_median_s")
+        if not before:
+            continue
+        change = (current["wall_median_s"] - before) / before
+        if abs(change) < 0.02:
+            marker = "➖"
+        else:
+            marker = "✅" if change < 0 else "❌"
+        print(f"  {marker} {scenario:<12} {before:>8.3f} s -> {current['wall_median_s']:>8.3f} s ({change:+.1%})")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description="InfoWatchdog startup time benchmark (offline)")
+    parser.add_argument("--runs", type=int, default=10, help="Exécutions mesurées par scénario")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS, help="Scénarios mesurés")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", help="Résultats de référence (JSON) à comparer")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+
+    print(f"Commit: {results['commit']}")
+    print(f"\n  {'scenario':<12} {'wall p50':>10} {'wall min':>10} {'in-process':>11}  heavy modules loaded")
+    for scenario, result in results["results"].items():
+        print(f"  {scenario:<12} {result['wall_median_s']:>9.3f}s {result['wall_min_s']:>9.3f}s "
+              f"{result['in_process_median_s']:>10.3f}s  {', '.join(result['heavy_modules']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Doublures locales pour les benchmarks : serveur de flux RSS/Atom synthétiques
+et API Airtable simulée en mémoire. Aucun accès réseau n'est nécessaire.
+"""
+
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+import requests
+
+RELEVANT_WORDS = ["climate", "renewable", "carbon", "sustainability", "pollution"]
+OTHER_WORDS = ["markets", "football", "cinema", "travel", "gadgets"]
+
+
+def build_feed(feed_index: int, items: int, generation: int, new_ratio: float = 0.5,
+               relevant_ratio: float = 0.8, feed_format: str = "rss") -> bytes:
+    """
+    Génère un flux synthétique déterministe.
+
+    Une part new_ratio des entrées est renouvelée à chaque génération, le
+    reste reprend les entrées les plus récentes de la génération précédente
+    (doublons à l'identique).
+
+    Args:
+        feed_index: Numéro du flux
+        items: Nombre d'entrées
+        generation: Numéro de génération (cycle) du flux
+        new_ratio: Part des entrées nouvelles à chaque génération
+        relevant_ratio: Part des entrées contenant un mot-clé environnemental
+        feed_format: "rss" ou "atom"
+
+    Returns:
+        Document XML du flux
+    """
+    new_items = max(int(items * new_ratio), 1)
+    base_time = time.time() - 86400
+
+    # Les entrées sont numérotées en continu : chaque génération en publie
+    # new_items nouvelles et conserve les plus récentes des précédentes
+    newest = generation * new_items + items - 1
+    entries = []
+    for sequence in range(newest, newest - items, -1):
+        rng = random.Random(feed_index * 1_000_003 + sequence)
+        item_id = f"{feed_index}-{sequence}"
+        words = RELEVANT_WORDS if rng.random() < relevant_ratio else OTHER_WORDS
+        title = f"{rng.choice(words).title()} report {item_id}"
+        summary = " ".join(rng.choice(words + OTHER_WORDS) for _ in range(60))
+        published = base_time + sequence * 600 - feed_index * 60
+        link = f"https://bench.invalid/{feed_index}/{item_id}"
+        entries.append((item_id, title, summary, published, link))
+
+    if feed_format == "atom":
+        body = "".join(
+            f"<entry><id>urn:bench:{item_id}</id><title>{escape(title)}</title>"
+            f"<link href=\"{link}\"/><updated>{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(published))}</updated>"
+            f"<author><name>Bench {feed_index}</name></author>"
+            f"<summary>{escape(summary)}</summary><category term=\"bench\"/></entry>"
+            for item_id, title, summary, published, link in entries
+        )
+        document = (
+            f"<?xml version=\"1.0\" encoding=\"utf-8\"?>"
+            f"<feed xmlns=\"http://www.w3.org/2005/Atom\"><title>Bench feed {feed_index}</title>"
+            f"<id>urn:bench:{feed_index}</id><updated>{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(entries[0][3]))}</updated>"
+            f"{body}</feed>"
+        )
+    else:
+        body = "".join(
+            f"<item><guid>{item_id}</guid><title>{escape(title)}</title><link>{link}</link>"
+            f"<pubDate>{formatdate(published, usegmt=True)}</pubDate>"
+            f"<author>bench{feed_index}@bench.invalid</author><category>bench</category>"
+            f"<description>{escape(summary)}</description></item>"
+            for item_id, title, summary, published, link in entries
+        )
+        document = (
+            f"<?xml version=\"1.0\" encoding=\"utf-8\"?>"
+            f"<rss version=\"2.0\"><channel><title>Bench feed {feed_index}</title>"
+            f"<link>https://bench.invalid/{feed_index}</link><description>Synthetic</description>"
+            f"{body}</channel></rss>"
+        )
+
+    return document.encode("utf-8")
+
+
+class FeedServer:
+    """
+    Serveur HTTP local servant /feeds/<n>.xml.
+
+    Les documents sont générés une fois par génération ; next_generation()
+    renouvelle une partie des entrées comme le ferait un vrai site entre
+    deux cycles.
+    """
+
+    def __init__(self, feeds: int = 10, items: int = 50, feed_format: str = "rss",
+                 new_ratio: float = 0.5, relevant_ratio: float = 0.8, latency: float = 0.0):
+        """
+        Initialise le serveur (sans le démarrer).
+
+        Args:
+            feeds: Nombre de flux
+            items: Nombre d'entrées par flux
+            feed_format: "rss", "atom" ou "mixed" (alternance)
+            new_ratio: Part des entrées renouvelées à chaque génération
+            relevant_ratio: Part des entrées pertinentes
+            latency: Délai de réponse simulé en secondes
+        """
+        self.feeds = feeds
+        self.items = items
+        self.feed_format = feed_format
+        self.new_ratio = new_ratio
+        self.relevant_ratio = relevant_ratio
+        self.latency = latency
+        self.generation = 0
+        self.requests = 0
+        self.bytes_served = 0
+
+        self._documents: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _format_for(self, feed_index: int) -> str:
+        if self.feed_format == "mixed":
+            return "atom" if feed_index % 2 else "rss"
+        return self.feed_format
+
+    def document(self, feed_index: int) -> bytes:
+        """Retourne le document courant d'un flux (généré au besoin)."""
+        with self._lock:
+            if feed_index not in self._documents:
+                self._documents[feed_index] = build_feed(
+                    feed_index, self.items, self.generation, self.new_ratio,
+                    self.relevant_ratio, self._format_for(feed_index)
+                )
+            return self._documents[feed_index]
+
+    def next_generation(self):
+        """Renouvelle une partie des entrées de tous les flux."""
+        with self._lock:
+            self.generation += 1
+            self._documents.clear()
+        for feed_index in range(self.feeds):
+            self.document(feed_index)
+
+    @property
+    def urls(self) -> List[str]:
+        host, port = self._server.server_address[:2]
+        return [f"http://{host}:{port}/feeds/{index}.xml" for index in range(self.feeds)]
+
+    def start(self) -> "FeedServer":
+        """Démarre le serveur sur un port libre."""
+        feed_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                try:
+                    feed_index = int(self.path.rsplit("/", 1)[-1].split(".")[0])
+                except ValueError:
+                    self.send_error(404)
+                    return
+                if not 0 <= feed_index < feed_server.feeds:
+                    self.send_error(404)
+                    return
+
+                if feed_server.latency:
+                    time.sleep(feed_server.latency)
+
+                body = feed_server.document(feed_index)
+                feed_server.requests += 1
+                feed_server.bytes_served += len(body)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="bench-feeds", daemon=True).start()
+        for feed_index in range(self.feeds):
+            self.document(feed_index)
+        return self
+
+    def stop(self):
+        """Arrête le serveur."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class _FakeResponse:
+    """Réponse minimale attachée aux erreurs HTTP simulées."""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.headers = {"Retry-After": "1"}
+
+
+class _FakeSession:
+    def close(self):
+        pass
+
+
+class FakeAirtable:
+    """
+    Remplaçant en mémoire du client airtable.Airtable.
+
+    Les enregistrements sont partagés entre instances (une table par nom).
+    Chaque requête subit la latence configurée et peut être rejetée avec
+    une erreur HTTP 429 selon rate_limit_ratio.
+    """
+
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    latency = 0.0
+    rate_limit_ratio = 0.0
+    page_size = 100
+    requests = 0
+    rate_limited = 0
+    _rng = random.Random(0)
+    _lock = threading.Lock()
+
+    def __init__(self, base_id, table_name, api_key=None, timeout=None):
+        self.base_id = base_id
+        self.table_name = table_name
+        self.timeout = timeout
+        self.session = _FakeSession()
+        with FakeAirtable._lock:
+            self.records = FakeAirtable.tables.setdefault(table_name, [])
+
+    @classmethod
+    def configure(cls, latency: float = 0.0, rate_limit_ratio: float = 0.0, seed: int = 0):
+        """
+        Réinitialise la table simulée et ses paramètres.
+
+        Args:
+            latency: Délai par requête HTTP simulée (secondes)
+            rate_limit_ratio: Probabilité qu'une requête soit rejetée avec 429
+            seed: Graine du tirage des 429
+        """
+        cls.tables = {}
+        cls.latency = latency
+        cls.rate_limit_ratio = rate_limit_ratio
+        cls.requests = 0
+        cls.rate_limited = 0
+        cls._rng = random.Random(seed)
+
+    def _request(self):
+        """Simule un aller-retour HTTP."""
+        with FakeAirtable._lock:
+            FakeAirtable.requests += 1
+            limited = FakeAirtable._rng.random() < FakeAirtable.rate_limit_ratio
+            if limited:
+                FakeAirtable.rate_limited += 1
+        if FakeAirtable.latency:
+            time.sleep(FakeAirtable.latency)
+        if limited:
+            raise requests.HTTPError("429 Client Error: Too Many Requests", response=_FakeResponse(429))
+
+    @staticmethod
+    def _project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        if not fields:
+            return record
+        return {"id": record["id"], "fields": {k: v for k, v in record["fields"].items() if k in fields}}
+
+    def insert(self, fields: Dict[str, Any], typecast: bool = False) -> Dict[str, Any]:
+        self._request()
+        with FakeAirtable._lock:
+            record = {"id": f"rec{len(self.records):08d}", "fields": dict(fields)}
+            self.records.append(record)
+        return record
+
+    def batch_insert(self, records: List[Dict[str, Any]], typecast: bool = False) -> List[Dict[str, Any]]:
+        inserted = []
+        for start in range(0, len(records), 10):
+            self._request()
+            with FakeAirtable._lock:
+                for fields in records[start:start + 10]:
+                    record = {"id": f"rec{len(self.records):08d}", "fields": dict(fields)}
+                    self.records.append(record)
+                    inserted.append(record)
+        return inserted
+
+    def update(self, record_id: str, fields: Dict[str, Any], typecast: bool = False) -> Dict[str, Any]:
+        self._request()
+        with FakeAirtable._lock:
+            for record in self.records:
+                if record["id"] == record_id:
+                    record["fields"].update(fields)
+                    return record
+        raise requests.HTTPError("404 Client Error: Not Found", response=_FakeResponse(404))
+
+    def batch_update(self, records: List[Dict[str, Any]], typecast: bool = False) -> List[Dict[str, Any]]:
+        updated = []
+        by_id = {record["id"]: record for record in self.records}
+        for start in range(0, len(records), 10):
+            self._request()
+            with FakeAirtable._lock:
+                for change in records[start:start + 10]:
+                    record = by_id.get(change["id"])
+                    if record is not None:
+                        record["fields"].update(change["fields"])
+                        updated.append(record)
+        return updated
+
+    def search(self, field_name: str, field_value: Any, **options) -> List[Dict[str, Any]]:
+        self._request()
+        with FakeAirtable._lock:
+            return [
+                self._project(record, options.get("fields"))
+                for record in self.records if record["fields"].get(field_name) == field_value
+            ]
+
+    def get_all(self, **options) -> List[Dict[str, Any]]:
+        """Retourne tous les enregistrements (les formules ne sont pas évaluées)."""
+        with FakeAirtable._lock:
+            records = list(self.records)
+        max_records = options.get("max_records")
+        if max_records:
+            records = records[:max_records]
+
+        # Une requête simulée par page, comme l'API réelle
+        for _ in range(max(1, -(-len(records) // self.page_size))):
+            self._request()
+        return [self._project(record, options.get("fields")) for record in records]
\ No newline at end of file
@@ -5,14 +5,12 @@ Surveillance en temps réel des données collectées dans Airtable
 """
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 import sys
 from pathlib import Path
-import numpy as np
 from collections import Counter
 import time
 
@@ -25,7 +23,10 @@ st.set_page_config(
 )
 
 # Ajoute le chemin src pour les imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from processors.snapshot import ArticleSnapshot, utc_now
+from processors.transforms import count_recent, render_articles_markdown, sort_recent
 
 # CSS personnalisé pour le thème InfoWatchdog
 st.markdown("""
@@ -68,56 +69,62 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=300)  # Cache pendant 5 minutes
-def load_airtable_data():
-    """Charge les données depuis Airtable avec cache"""
+# Délai entre deux synchronisations incrémentales
+REFRESH_TTL = timedelta(minutes=5)
+
+# Snapshots locaux persistés entre les redémarrages (un par période)
+SNAPSHOT_DIR = Path(os.getenv("DASHBOARD_SNAPSHOT_DIR", str(Path(__file__).parent / "data")))
+
+# Configuration partagée avec l'agent de collecte
+CONFIG_PATH = Path(__file__).parent / "config" / "config.yml"
+
+@st.cache_resource
+def get_storage():
+    """Crée le système de stockage configuré, partagé entre les sessions"""
+    import yaml
+    from dotenv import load_dotenv
+    from storage import create_storage
+    
+    load_dotenv()
+    
+    storage_config = {}
+    if CONFIG_PATH.exists():
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as file:
+            storage_config = (yaml.safe_load(file) or {}).get("storage", {})
+    
+    return create_storage(storage_config)
+
+@st.cache_resource
+def get_article_snapshot(days):
+    """Crée le snapshot local d'une période, partagé entre les sessions"""
+    snapshot = ArticleSnapshot(
+        get_storage(),
+        days=days,
+        path=str(SNAPSHOT_DIR / f"dashboard_snapshot_{days or 'all'}.feather")
+    )
+    snapshot.load()
+    return snapshot
+
+def load_snapshot(days):
+    """Charge le snapshot local de la période, synchronisé en arrière-plan"""
     try:
-        from dotenv import load_dotenv
-        from airtable import Airtable
+        snapshot = get_article_snapshot(days)
         
-        load_dotenv()
-        
-        airtable = Airtable(
-            base_id=os.getenv("AIRTABLE_BASE_ID"),
-            table_name=os.getenv("AIRTABLE_TABLE_NAME", "Environmental_News"),
-            api_key=os.getenv("AIRTABLE_API_KEY")
-        )
+        # Premier démarrage sans fichier local : chargement bloquant
+        if not snapshot.is_loaded and snapshot.refresh() is None:
+            st.error("Impossible de récupérer les articles depuis le stockage")
         
-        records = airtable.get_all()
-        
-        # Conversion en DataFrame
-        data = []
-        for record in records:
-            fields = record.get('fields', {})
-            data.append({
-                'id': record.get('id'),
-                'title': fields.get('Title', ''),
-                'url': fields.get('URL', ''),
-                'source': fields.get('Source', 'Unknown'),
-                'content': fields.get('Content', ''),
-                'author': fields.get('Author', ''),
-                'published_date': fields.get('Published_Date', ''),
-                'collected_date': fields.get('Collected_Date', ''),
-                'collector': fields.get('Collector', 'Unknown'),
-                'hash': fields.get('Hash', ''),
-                'tags': fields.get('Tags', ''),
-                'reddit_score': fields.get('Reddit_Score', 0),
-                'reddit_comments': fields.get('Reddit_Comments', 0),
-                'subreddit': fields.get('Subreddit', '')
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Conversion des dates
-        if not df.empty:
-            df['collected_date'] = pd.to_datetime(df['collected_date'], errors='coerce')
-            df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce')
-            
-        return df
+        snapshot.start_background_refresh(REFRESH_TTL)
+        return snapshot
         
     except Exception as e:
         st.error(f"Erreur lors du chargement des données: {str(e)}")
-        return pd.DataFrame()
+        return None
+
+@st.cache_resource(max_entries=4)
+def get_recent_view(_snapshot, days, version):
+    """Articles triés par date, calculés une fois par version des données"""
+    return sort_recent(_snapshot.frame)
 
 def display_watchdog_header():
     """Affiche l'en-tête avec logo ASCII"""
@@ -142,25 +149,25 @@ def display_watchdog_header():
         </div>
         """, unsafe_allow_html=True)
 
-def display_metrics(df):
+def display_metrics(rollups, after=None):
     """Affiche les métriques principales"""
-    if df.empty:
+    daily = rollups.daily_counts(after)
+    if daily.empty:
         st.warning("Aucune donnée disponible")
         return
     
     # Calculs des métriques
-    total_articles = len(df)
-    reddit_articles = len(df[df['collector'] == 'reddit'])
-    rss_articles = len(df[df['collector'] == 'rss'])
+    total_articles = int(daily['articles'].sum())
+    by_collector = daily.groupby('collector')['articles'].sum()
+    reddit_articles = int(by_collector.get('reddit', 0))
+    rss_articles = int(by_collector.get('rss', 0))
     
     # Articles des 24 dernières heures
-    now = datetime.now()
-    yesterday = now - timedelta(days=1)
-    recent_articles = len(df[df['collected_date'] > yesterday])
+    now = utc_now()
+    recent_articles = rollups.count_since(now - timedelta(days=1), after)
     
     # Articles des 7 derniers jours
-    week_ago = now - timedelta(days=7)
-    week_articles = len(df[df['collected_date'] > week_ago])
+    week_articles = rollups.count_since(now - timedelta(days=7), after)
     
     # Affichage des métriques
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -194,21 +201,21 @@ def display_metrics(df):
         )
     
     with col5:
-        unique_sources = df['source'].nunique()
+        unique_sources = daily['source'].nunique()
         st.metric(
             label="🌐 Sources uniques",
             value=f"{unique_sources}",
             delta="Active"
         )
 
-def create_daily_collection_chart(df):
+def create_daily_collection_chart(rollups, after=None):
     """Graphique des collectes quotidiennes"""
-    if df.empty:
+    daily = rollups.daily_counts(after)
+    if daily.empty:
         return
     
     # Grouper par jour
-    df_daily = df.groupby(df['collected_date'].dt.date).size().reset_index()
-    df_daily.columns = ['date', 'articles']
+    df_daily = daily.groupby('date')['articles'].sum().sort_index().reset_index()
     
     # Graphique avec Plotly
     fig = px.line(
@@ -233,12 +240,13 @@ def create_daily_collection_chart(df):
     
     st.plotly_chart(fig, use_container_width=True)
 
-def create_sources_pie_chart(df):
+def create_sources_pie_chart(rollups, after=None):
     """Graphique en secteurs des sources"""
-    if df.empty:
+    daily = rollups.daily_counts(after)
+    if daily.empty:
         return
     
-    source_counts = df['source'].value_counts()
+    source_counts = daily.groupby('source')['articles'].sum().sort_values(ascending=False)
     
     fig = px.pie(
         values=source_counts.values,
@@ -252,21 +260,13 @@ def create_sources_pie_chart(df):
     
     st.plotly_chart(fig, use_container_width=True)
 
-def create_hourly_heatmap(df):
+def create_hourly_heatmap(rollups, after=None):
     """Heatmap des collectes par heure et jour"""
-    if df.empty:
+    if rollups.is_empty:
         return
     
-    # Extraction heure et jour de la semaine
-    df['hour'] = df['collected_date'].dt.hour
-    df['day_name'] = df['collected_date'].dt.day_name()
-    
-    # Pivot table pour heatmap
-    heatmap_data = df.groupby(['day_name', 'hour']).size().unstack(fill_value=0)
-    
-    # Ordre des jours
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    heatmap_data = heatmap_data.reindex(day_order)
+    # Matrice jour de la semaine × heure pré-calculée
+    heatmap_data = rollups.heatmap(after)
     
     fig = px.imshow(
         heatmap_data,
@@ -279,42 +279,25 @@ def create_hourly_heatmap(df):
     fig.update_layout(height=300)
     st.plotly_chart(fig, use_container_width=True)
 
-def display_recent_articles(df, limit=10):
-    """Affiche les articles récents"""
-    if df.empty:
+def display_recent_articles(recent_df, count, page_size=15):
+    """Affiche les articles récents, page par page"""
+    if count == 0:
         st.info("Aucun article récent")
         return
     
-    recent_df = df.nlargest(limit, 'collected_date')
-    
     st.subheader("📰 Articles récents")
     
-    for _, article in recent_df.iterrows():
-        with st.container():
-            col1, col2 = st.columns([4, 1])
-            
-            with col1:
-                # Icône selon la source
-                icon = "🔴" if article['collector'] == 'reddit' else "🟠"
-                
-                st.markdown(f"""
-                **{icon} [{article['title'][:100]}...]({article['url']})**
-                
-                📰 *{article['source']}* • 📅 {article['collected_date'].strftime('%d/%m/%Y %H:%M') if pd.notna(article['collected_date']) else 'N/A'}
-                """)
-                
-                if article['collector'] == 'reddit' and article['reddit_score'] > 0:
-                    st.caption(f"⬆️ {article['reddit_score']} points • 💬 {article['reddit_comments']} commentaires • r/{article['subreddit']}")
-                
-            with col2:
-                if article['reddit_score'] > 0:
-                    st.metric("Score Reddit", article['reddit_score'])
-            
-            st.divider()
+    # Seule la page affichée est mise en forme
+    total_pages = (count + page_size - 1) // page_size
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+    start = (page - 1) * page_size
+    
+    st.markdown(render_articles_markdown(recent_df.iloc[start:min(start + page_size, count)]))
+    st.caption(f"Page {page}/{total_pages} • {count:,} articles")
 
-def display_trending_analysis(df):
+def display_trending_analysis(rollups, after=None):
     """Analyse des tendances"""
-    if df.empty:
+    if rollups.is_empty:
         return
     
     st.subheader("🔥 Analyse des tendances")
@@ -323,11 +306,11 @@ def display_trending_analysis(df):
     
     with col1:
         st.write("**🏆 Top sources (7 derniers jours)**")
-        week_ago = datetime.now() - timedelta(days=7)
-        recent_df = df[df['collected_date'] > week_ago]
+        week_after = (utc_now() - timedelta(days=7)).date()
+        recent_daily = rollups.daily_counts(max(after, week_after) if after else week_after)
         
-        if not recent_df.empty:
-            top_sources = recent_df['source'].value_counts().head(10)
+        if not recent_daily.empty:
+            top_sources = recent_daily.groupby('source')['articles'].sum().nlargest(10)
             for source, count in top_sources.items():
                 st.write(f"• {source}: **{count}** articles")
         else:
@@ -335,19 +318,18 @@ def display_trending_analysis(df):
     
     with col2:
         st.write("**📈 Top subreddits Reddit**")
-        reddit_df = df[df['collector'] == 'reddit']
+        subreddit_stats = rollups.subreddit_stats(after)
         
-        if not reddit_df.empty:
-            top_subreddits = reddit_df['subreddit'].value_counts().head(10)
-            for subreddit, count in top_subreddits.items():
-                if subreddit:  # Évite les valeurs vides
-                    st.write(f"• r/{subreddit}: **{count}** articles")
+        if not subreddit_stats.empty:
+            for subreddit, count in subreddit_stats.head(10)[['subreddit', 'articles']].itertuples(index=False):
+                st.write(f"• r/{subreddit}: **{count}** articles")
         else:
             st.info("Pas de données Reddit")
 
-def display_collection_stats(df):
+def display_collection_stats(rollups, after=None):
     """Statistiques de collecte"""
-    if df.empty:
+    daily = rollups.daily_counts(after)
+    if daily.empty:
         return
     
     st.subheader("📊 Statistiques de collecte")
@@ -358,7 +340,7 @@ def display_collection_stats(df):
         st.write("**⏱️ Activité par période**")
         
         # Articles par période
-        now = datetime.now()
+        now = utc_now()
         periods = {
             "Aujourd'hui": now - timedelta(days=1),
             "Cette semaine": now - timedelta(days=7),
@@ -366,24 +348,25 @@ def display_collection_stats(df):
         }
         
         for period_name, cutoff_date in periods.items():
-            count = len(df[df['collected_date'] > cutoff_date])
+            count = rollups.count_since(cutoff_date, after)
             st.metric(period_name, f"{count:,}")
     
     with col2:
         st.write("**🎯 Performance par collecteur**")
         
-        collector_stats = df['collector'].value_counts()
+        collector_stats = daily.groupby('collector')['articles'].sum().sort_values(ascending=False)
+        total_articles = collector_stats.sum()
         for collector, count in collector_stats.items():
-            percentage = (count / len(df)) * 100
-            st.write(f"• {collector.title()}: {count:,} ({percentage:.1f}%)")
+            percentage = (count / total_articles) * 100
+            st.write(f"• {str(collector).title()}: {count:,} ({percentage:.1f}%)")
     
     with col3:
         st.write("**📈 Scores Reddit moyens**")
         
-        reddit_df = df[df['collector'] == 'reddit']
-        if not reddit_df.empty and reddit_df['reddit_score'].notna().any():
-            avg_score = reddit_df['reddit_score'].mean()
-            max_score = reddit_df['reddit_score'].max()
+        subreddit_stats = rollups.subreddit_stats(after)
+        if not subreddit_stats.empty:
+            avg_score = subreddit_stats['score_sum'].sum() / subreddit_stats['articles'].sum()
+            max_score = int(subreddit_stats['score_max'].max())
             
             st.metric("Score moyen", f"{avg_score:.1f}")
             st.metric("Score maximum", f"{max_score:,}")
@@ -399,10 +382,6 @@ def main():
         st.markdown("### 🎛️ Contrôles Dashboard")
         
         # Bouton de rafraîchissement
-        if st.button("🔄 Actualiser les données", type="primary"):
-            st.cache_data.clear()
-            st.rerun()
-        
         # Sélection de la période
         period_options = {
             "Toutes les données": None,
@@ -417,12 +396,18 @@ def main():
             index=1  # 7 derniers jours par défaut
         )
         
+        if st.button("🔄 Actualiser les données", type="primary"):
+            if get_article_snapshot(period_options[selected_period]).refresh() is None:
+                st.error("Échec de l'actualisation, données précédentes conservées")
+            else:
+                st.rerun()
+        
         # Auto-refresh
         auto_refresh = st.checkbox("🔄 Actualisation automatique (30s)")
         
         st.markdown("---")
         st.markdown("### 📊 Informations")
-        st.info("Dashboard temps réel pour InfoWatchdog. Les données sont mises en cache pendant 5 minutes.")
+        st.info("Dashboard temps réel pour InfoWatchdog. Les données sont servies depuis un snapshot local, synchronisé en arrière-plan toutes les 5 minutes.")
         
         # Statut de connexion
         st.markdown("### 🌐 Statut")
@@ -443,43 +428,51 @@ def main():
     
     # Chargement des données
     with st.spinner("🔍 Chargement des données depuis Airtable..."):
-        df = load_airtable_data()
+        snapshot = load_snapshot(period_options[selected_period])
     
-    if df.empty:
+    if snapshot is None or snapshot.frame.empty:
         st.error("❌ Impossible de charger les données. Vérifiez votre configuration Airtable.")
         st.stop()
     
-    # Filtrage par période
+    rollups = snapshot.rollups
+    recent_df = get_recent_view(snapshot, period_options[selected_period], snapshot.version)
+    
+    # Le snapshot ne contient que la période ; les agrégats sont filtrés à la journée près
+    after = None
+    cutoff_date = None
     if period_options[selected_period] is not None:
-        cutoff_date = datetime.now() - timedelta(days=period_options[selected_period])
-        df = df[df['collected_date'] > cutoff_date]
+        cutoff_date = utc_now() - timedelta(days=period_options[selected_period])
+        after = cutoff_date.date()
+    
+    # Les articles de la période forment le début de la vue triée
+    period_count = count_recent(recent_df, cutoff_date)
     
     # Affichage des métriques principales
-    display_metrics(df)
+    display_metrics(rollups, after)
     
     # Graphiques principaux
     col1, col2 = st.columns(2)
     
     with col1:
-        create_daily_collection_chart(df)
+        create_daily_collection_chart(rollups, after)
     
     with col2:
-        create_sources_pie_chart(df)
+        create_sources_pie_chart(rollups, after)
     
     # Heatmap d'activité
-    create_hourly_heatmap(df)
+    create_hourly_heatmap(rollups, after)
     
     # Sections d'analyse
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        display_recent_articles(df, limit=15)
+        display_recent_articles(recent_df, period_count, page_size=15)
     
     with col2:
-        display_trending_analysis(df)
+        display_trending_analysis(rollups, after)
     
     # Statistiques détaillées
-    display_collection_stats(df)
+    display_collection_stats(rollups, after)
     
     # Footer avec informations
     st.markdown("---")
@@ -489,7 +482,7 @@ def main():
         st.caption(f"📊 Dernière mise à jour: {datetime.now().strftime('%H:%M:%S')}")
     
     with col2:
-        st.caption(f"📰 Total articles analysés: {len(df):,}")
+        st.caption(f"📰 Total articles analysés: {period_count:,}")
     
     with col3:
         st.caption("🐕‍🦺 InfoWatchdog Environmental Guardian")
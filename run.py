@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Script principal pour lancer InfoWatchdog.
-Usage: python run.py [--test-only] [--config path/to/config.yml]
+Usage: python run.py [--test-only] [--daemon] [--config path/to/config.yml]
 """
 
 import argparse
@@ -19,9 +19,6 @@ from src.utils.logo import (
 
 def main():
     """Fonction principale."""
-    # Affiche le logo watchdog au démarrage
-    print(display_watchdog_logo())
-    
     parser = argparse.ArgumentParser(description="InfoWatchdog - Agent de veille environnementale")
     parser.add_argument(
         "--test-only", 
@@ -43,6 +40,16 @@ def main():
         action="store_true", 
         help="Désactive l'affichage du logo"
     )
+    parser.add_argument(
+        "--daemon", 
+        action="store_true", 
+        help="Reste actif et exécute un cycle de collecte à chaque intervalle (schedule.interval)"
+    )
+    parser.add_argument(
+        "--interval", 
+        type=int, 
+        help="Intervalle entre deux cycles en mode démon (secondes)"
+    )
     parser.add_argument(
         "--alert-mode", 
         action="store_true", 
@@ -51,6 +58,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Affiche le logo watchdog au démarrage (après l'analyse : --help reste instantané)
+    if not args.no_logo:
+        print(display_watchdog_logo())
+    
     try:
         # Initialise InfoWatchdog
         config_file = args.config if args.config else "config/config.yml"
@@ -95,6 +106,17 @@ def main():
             
             return 0
         
+        elif args.daemon:
+            # Mode démon : l'agent reste résident entre les cycles
+            print("\n🐕‍🦺 InfoWatchdog is now on permanent patrol (Ctrl+C to stop)...")
+            if not args.no_logo:
+                print(display_working_banner())
+            
+            watchdog.run_daemon(args.interval)
+            
+            print("\n💤 Patrol ended - InfoWatchdog going to sleep...")
+            return 0
+        
         else:
             # Exécute un cycle de collecte complet
             print("\n🐕‍🦺 Starting InfoWatchdog patrol mission...")
@@ -104,7 +126,8 @@ def main():
                 print(display_working_banner())
             
             # Lance la collecte
-            success = watchdog.run_collection_cycle()
+            report = watchdog.run_collection_cycle()
+            success = report["storage_success"]
             
             # Récupère les métriques
             duration = getattr(watchdog, '_last_cycle_duration', 0)
@@ -142,6 +142,50 @@ WantedBy=timers.target
     print("sudo systemctl status infowatchdog.timer")
 
 
+def setup_systemd_daemon():
+    """Configure un service systemd permanent en mode démon (Linux)"""
+    project_path = get_project_path()
+    python_path = get_python_path()
+    user = os.getenv('USER', 'infowatchdog')
+    
+    service_content = f"""[Unit]
+Description=InfoWatchdog - Agent de veille environnementale (mode démon)
+After=network-online.target
+Wants=network-online.target
+
+[Service]
+Type=simple
+User={user}
+WorkingDirectory={project_path}
+ExecStart={python_path} {project_path}/run.py --daemon --no-logo
+Environment=PATH={Path(python_path).parent}:$PATH
+Restart=on-failure
+RestartSec=30
+KillSignal=SIGTERM
+# SIGTERM interrompt le cycle en cours : seules les requêtes déjà lancées
+# (timeout de 30 s au plus) et l'écriture de la file d'attente restent à terminer
+TimeoutStopSec=180
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+    print("🔧 Configuration systemd (mode démon)")
+    print("💡 L'agent reste résident et collecte selon schedule.interval de config.yml")
+    print("📄 Contenu du fichier service (/etc/systemd/system/infowatchdog-daemon.service):")
+    print("="*60)
+    print(service_content)
+    print("="*60)
+    
+    print("\n📋 Commandes à exécuter (en tant que root ou avec sudo):")
+    print("sudo nano /etc/systemd/system/infowatchdog-daemon.service")
+    print("sudo systemctl daemon-reload")
+    print("sudo systemctl enable infowatchdog-daemon.service")
+    print("sudo systemctl start infowatchdog-daemon.service")
+    print("sudo systemctl status infowatchdog-daemon.service")
+    print("\n⚠️  Désactivez le cron ou le timer existant pour éviter les cycles en double")
+
+
 def setup_windows_task():
     """Configure une tâche planifiée Windows"""
     project_path = get_project_path()
@@ -219,8 +263,9 @@ def main():
         print("1. Cron job (recommandé)")
         print("2. Service systemd (Linux uniquement)")
         print("3. Afficher les deux options")
+        print("4. Service systemd permanent en mode démon (Linux uniquement)")
         
-        choice = input("\nChoisissez une option (1-3): ").strip()
+        choice = input("\nChoisissez une option (1-4): ").strip()
         
         if choice == "1":
             interval = input("Intervalle (hourly/daily/twice_daily/every_6h) [hourly]: ").strip() or "hourly"
@@ -233,6 +278,8 @@ def main():
             print("\n" + "="*60 + "\n")
             if system == "linux":
                 setup_systemd_service()
+        elif choice == "4" and system == "linux":
+            setup_systemd_daemon()
         else:
             print("❌ Option invalide")
             
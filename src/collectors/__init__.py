@@ -1,14 +1,36 @@
 """
 Module collectors pour InfoWatchdog.
 Contient les collecteurs de données pour différentes sources.
+
+Les collecteurs sont importés à la première utilisation (PEP 562) : importer
+le paquet ne charge ni praw ni feedparser.
 """
 
+import importlib
+
 from .base_collector import BaseCollector
-from .reddit_collector import RedditCollector
-from .rss_collector import RSSCollector
+
+# Nom exporté -> sous-module qui le définit
+_LAZY_EXPORTS = {
+    'RedditCollector': '.reddit_collector',
+    'RSSCollector': '.rss_collector',
+}
 
 __all__ = [
     'BaseCollector',
     'RedditCollector', 
     'RSSCollector'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Importe un collecteur lors du premier accès."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+import time
 import logging
 
+from monitoring import ConnectionHealth, SourceHealthTracker, span
+from monitoring.metrics import FETCH_ERRORS, FETCH_LATENCY
+from utils.dates import now_epoch, to_epoch
+from utils.deadline import Deadline
+
+# Mots-clés de pertinence utilisés par défaut
+DEFAULT_KEYWORDS = (
+    "climate", "environment", "sustainability", "renewable",
+    "carbon", "green", "eco", "pollution", "conservation"
+)
+
 class BaseCollector(ABC):
     """
     Classes abstraites pour tous les collecteurs de données.
@@ -22,18 +33,103 @@ class BaseCollector(ABC):
         self.logger = logging.getLogger(f"collector.{name}")
         self.is_enabled = self.config.get("enabled", True)
         
+        # Santé et disjoncteur par source (état persisté via health.attach)
+        self.health = SourceHealthTracker(self.config.get("circuit_breaker", {}))
+        
+        # État de connexion global, alimenté par les collectes réelles
+        self.connection_health = ConnectionHealth(self.config.get("health_ttl", 300))
+        
+        # Sources effectivement interrogées lors de la dernière collecte
+        self.polled_sources: List[str] = []
+        
     @abstractmethod
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, sources: Optional[List[str]] = None,
+                deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         Collecte les données depuis la source.
         
+        Les sources non interrogées avant l'échéance sont ignorées : le
+        résultat est alors partiel et polled_sources indique celles qui ont
+        été traitées.
+        
+        Args:
+            sources: Identifiants des sources à collecter (None pour toutes)
+            deadline: Échéance du cycle (None pour illimitée)
+        
         Returns:
             Liste de dictionnaires contenant les données collectées
         """
         pass
     
+    def get_sources(self) -> List[str]:
+        """
+        Retourne les identifiants des sources configurées (flux, subreddits...).
+        
+        Returns:
+            Liste des identifiants de sources
+        """
+        return []
+    
+    def get_source_id(self, article: Dict[str, Any]) -> str:
+        """
+        Retourne l'identifiant de la source d'un article collecté.
+        
+        Args:
+            article: Article collecté
+            
+        Returns:
+            Identifiant de la source, tel que retourné par get_sources()
+        """
+        return article.get("source", "")
+    
+    def _collect_source(self, source: str, label: str,
+                        collect_fn: Callable[[], List[Dict[str, Any]]],
+                        deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """
+        Collecte une source sous le contrôle du disjoncteur.
+        
+        Les sources dont le circuit est ouvert sont ignorées sans requête ;
+        le résultat et la durée de chaque tentative mettent à jour leur santé.
+        
+        Args:
+            source: Identifiant de la source
+            label: Nom de la source pour les logs
+            collect_fn: Fonction de collecte, qui lève une exception en cas d'échec
+            deadline: Échéance du cycle (un échec dû à l'échéance n'est pas imputé à la source)
+            
+        Returns:
+            Articles de la source (liste vide en cas d'échec ou de circuit ouvert)
+        """
+        self.polled_sources.append(source)
+        
+        with span("source", source=label) as source_span:
+            if not self.health.allow(source):
+                self.logger.info(f"Skipping {label}: circuit open")
+                source_span.set(status="circuit_open", items=0)
+                return []
+            
+            start = time.monotonic()
+            try:
+                articles = collect_fn()
+            except Exception as e:
+                latency = time.monotonic() - start
+                source_span.set(status="error", items=0, error=str(e)[:200])
+                FETCH_LATENCY.labels(self.name, label).observe(latency)
+                FETCH_ERRORS.labels(self.name, label).inc()
+                if deadline is None or not deadline.expired:
+                    self.health.record_failure(source, str(e), latency)
+                    self.connection_health.record_failure(str(e), latency)
+                return []
+            
+            latency = time.monotonic() - start
+            source_span.set(status="ok", items=len(articles))
+            FETCH_LATENCY.labels(self.name, label).observe(latency)
+            self.health.record_success(source, latency)
+            self.connection_health.record_success(latency)
+            return articles
+    
     def _create_article_dict(self, title: str, url: str, source: str,
-                           content: str = "", published_date: datetime = None,
+                           content: str = "", published_date: Any = None,
                            author: str = "", tags: List[str] = None) -> Dict[str, Any]:
         """
         Crée un dictionnaire standardisé pour un article.
@@ -43,20 +139,21 @@ class BaseCollector(ABC):
             url: URL de l'article
             source: Source de l'article
             content: Contenu/résumé de l'article
-            published_date: Date de publication
+            published_date: Date de publication (horodatage, datetime, struct_time ou chaîne)
             author: Auteur de l'article
             tags: Mots-clés/tags associés
             
         Returns:
-            Dictionnaire standardisé
+            Dictionnaire standardisé (dates en horodatages Unix UTC)
         """
+        collected_date = now_epoch()
         return {
             "title": self._clean_text(title),
             "url": url,
             "source": source,
             "content": self._clean_text(content),
-            "published_date": published_date or datetime.now(),
-            "collected_date": datetime.now(),
+            "published_date": to_epoch(published_date) or collected_date,
+            "collected_date": collected_date,
             "author": author,
             "tags": tags or [],
             "collector": self.name,
@@ -95,26 +192,63 @@ class BaseCollector(ABC):
         content = f"{title}{url}".encode('utf-8')
         return hashlib.md5(content).hexdigest()
     
-    def _is_relevant(self, text: str, keywords: List[str] = None) -> bool:
+    @staticmethod
+    def _is_relevant(text: str, keywords: List[str] = None) -> bool:
         """
         Vérifie si le contenu est pertinent selon les mots-clés.
         
         Args:
             text: Texte à analyser
-            keywords: Liste de mots-clés environnementaux
+            keywords: Liste de mots-clés environnementaux (par défaut DEFAULT_KEYWORDS)
             
         Returns:
             True si pertinent, False sinon
         """
         if not keywords:
-            keywords = [
-                "climate", "environment", "sustainability", "renewable", 
-                "carbon", "green", "eco", "pollution", "conservation"
-            ]
+            keywords = DEFAULT_KEYWORDS
             
         text_lower = text.lower()
         return any(keyword in text_lower for keyword in keywords)
     
+    def attach_state(self, state_dir: str):
+        """
+        Associe au collecteur ses fichiers d'état propres (aucun par défaut).
+        
+        Args:
+            state_dir: Répertoire des états persistés
+        """
+        pass
+    
+    def refresh(self, deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """
+        Relit les métadonnées variables des articles déjà collectés.
+        
+        Args:
+            deadline: Échéance du cycle (None pour illimitée)
+        
+        Returns:
+            Mises à jour partielles identifiées par "hash" (aucune par défaut)
+        """
+        return []
+    
+    def confirm_refresh(self, updates: List[Dict[str, Any]]):
+        """
+        Reçoit les mises à jour de refresh() effectivement écrites dans le stockage.
+        
+        Les mises à jour non confirmées doivent être retournées de nouveau
+        par le refresh() suivant.
+        
+        Args:
+            updates: Mises à jour écrites
+        """
+        pass
+    
+    def close(self):
+        """
+        Libère les ressources du collecteur (connexions, sessions).
+        """
+        pass
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Retourne l'état du collecteur.
@@ -125,7 +259,9 @@ class BaseCollector(ABC):
         return {
             "name": self.name,
             "enabled": self.is_enabled,
-            "config": self.config
+            "config": self.config,
+            "connection": self.connection_health.get_status(),
+            "sources_health": self.health.get_status()
         }
         
     def __str__(self) -> str:
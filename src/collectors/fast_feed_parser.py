@@ -0,0 +1,265 @@
+"""
+Parseur RSS/Atom rapide, en flux, limité aux champs utilisés par RSSCollector.
+
+Le document est lu par xml.etree.ElementTree.XMLPullParser : chaque entrée
+est extraite puis libérée dès sa balise fermante, et le contenu peut être
+fourni par morceaux (feed) au fil du téléchargement. Contrairement à
+feedparser, aucun document mal formé n'est toléré : le résultat est alors
+marqué bozo et l'appelant doit se rabattre sur feedparser.
+"""
+
+import time
+from typing import Any, List, Optional
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from utils.dates import parse_epoch
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+
+# Éléments racines acceptés (RSS 0.9x/2.0, RSS 1.0, Atom 1.0)
+ROOT_TAGS = {"rss", RDF_NS + "RDF", ATOM_NS + "feed"}
+ENTRY_TAGS = {"item", RSS1_NS + "item", ATOM_NS + "entry"}
+
+
+class FastEntry(dict):
+    """
+    Entrée de flux : dictionnaire dont les clés sont aussi des attributs,
+    comme les entrées feedparser (entry.get('title'), entry.summary...).
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "description" and "summary" in self:
+            return self["summary"]
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class FastFeed:
+    """
+    Résultat du parsing : entrées et indicateur d'anomalie (bozo).
+    """
+
+    def __init__(self):
+        self.entries: List[FastEntry] = []
+        self.bozo = False
+        self.bozo_exception: Optional[Exception] = None
+
+
+class FastFeedParser:
+    """
+    Parseur incrémental : feed(données) autant que nécessaire, puis close().
+    """
+
+    def __init__(self):
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._root_checked = False
+        self._parent = None
+        self.result = FastFeed()
+
+    def feed(self, data: bytes):
+        """
+        Fournit un morceau du document et extrait les entrées complètes.
+
+        Args:
+            data: Morceau du document brut
+        """
+        if self.result.bozo:
+            return
+        try:
+            self._parser.feed(data)
+            self._process_events()
+        except (ElementTree.ParseError, ValueError) as e:
+            self._fail(e)
+
+    def close(self) -> FastFeed:
+        """
+        Termine le parsing.
+
+        Returns:
+            Flux parsé (bozo si le document est mal formé ou d'un format inconnu)
+        """
+        if not self.result.bozo:
+            try:
+                self._parser.close()
+                self._process_events()
+            except (ElementTree.ParseError, ValueError) as e:
+                self._fail(e)
+        if not self.result.bozo and not self._root_checked:
+            self._fail(ValueError("Empty document"))
+        return self.result
+
+    def _process_events(self):
+        """Traite les événements disponibles du parseur."""
+        for event, element in self._parser.read_events():
+            if not self._root_checked:
+                if element.tag not in ROOT_TAGS:
+                    raise ValueError(f"Unsupported feed root element: {element.tag}")
+                self._root_checked = True
+
+            if event == "start":
+                if element.tag in ("channel", RDF_NS + "RDF", ATOM_NS + "feed"):
+                    self._parent = element
+            elif element.tag in ENTRY_TAGS:
+                if element.tag == ATOM_NS + "entry":
+                    entry = _atom_entry(element)
+                else:
+                    entry = _rss_entry(element)
+                self.result.entries.append(entry)
+                # Libère l'entrée : la mémoire reste bornée quelle que soit la taille du flux
+                element.clear()
+                if self._parent is not None:
+                    self._parent.remove(element)
+
+    def _fail(self, error: Exception):
+        """Marque le flux comme mal formé."""
+        self.result.bozo = True
+        self.result.bozo_exception = error
+        self.result.entries = []
+
+
+def parse(content: bytes) -> FastFeed:
+    """
+    Parse un document complet.
+
+    Args:
+        content: Document brut
+
+    Returns:
+        Flux parsé (bozo si feedparser doit prendre le relais)
+    """
+    parser = FastFeedParser()
+    parser.feed(content)
+    return parser.close()
+
+
+def _rss_entry(item) -> FastEntry:
+    """Extrait les champs d'un <item> RSS 0.9x/1.0/2.0."""
+    entry = FastEntry()
+    tags = []
+    content = None
+
+    for child in item:
+        tag = child.tag
+        local = tag.rsplit("}", 1)[-1] if tag.startswith(RSS1_NS) else tag
+        text = (child.text or "").strip()
+
+        if local == "title":
+            entry["title"] = text
+        elif local == "link":
+            entry["link"] = text
+        elif local == "description":
+            entry["summary"] = text
+        elif tag == CONTENT_NS + "encoded":
+            content = text
+        elif local == "pubDate":
+            _set_date(entry, "published", text)
+        elif tag == DC_NS + "date":
+            _set_date(entry, "updated", text)
+        elif local == "author" or tag == DC_NS + "creator":
+            entry.setdefault("author", text)
+        elif local == "category" or tag == DC_NS + "subject":
+            tags.append(FastEntry(term=text, scheme=child.get("domain"), label=None))
+        elif local == "guid":
+            entry["id"] = text
+
+    if "id" not in entry and item.get(RDF_NS + "about"):
+        entry["id"] = item.get(RDF_NS + "about")
+    _finish(entry, tags, content)
+    return entry
+
+
+def _atom_entry(element) -> FastEntry:
+    """Extrait les champs d'une <entry> Atom 1.0."""
+    entry = FastEntry()
+    tags = []
+    content = None
+
+    for child in element:
+        tag = child.tag
+        if tag == ATOM_NS + "title":
+            entry["title"] = _atom_text(child)
+        elif tag == ATOM_NS + "link":
+            if child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = (child.get("href") or "").strip()
+        elif tag == ATOM_NS + "summary":
+            entry["summary"] = _atom_text(child)
+        elif tag == ATOM_NS + "content":
+            content = _atom_text(child)
+        elif tag == ATOM_NS + "published":
+            _set_date(entry, "published", (child.text or "").strip())
+        elif tag == ATOM_NS + "updated":
+            _set_date(entry, "updated", (child.text or "").strip())
+        elif tag == ATOM_NS + "author" and "author" not in entry:
+            name = (child.findtext(ATOM_NS + "name") or "").strip()
+            email = (child.findtext(ATOM_NS + "email") or "").strip()
+            entry["author"] = f"{name} ({email})" if name and email else name or email
+        elif tag == ATOM_NS + "category":
+            tags.append(FastEntry(term=child.get("term"), scheme=child.get("scheme"), label=child.get("label")))
+        elif tag == ATOM_NS + "id":
+            entry["id"] = (child.text or "").strip()
+
+    _finish(entry, tags, content)
+    return entry
+
+
+def _finish(entry: FastEntry, tags: List[FastEntry], content: Optional[str]):
+    """Complète une entrée comme le fait feedparser (contenu, résumé par défaut, tags)."""
+    if content is not None:
+        entry["content"] = [FastEntry(type="text/html", value=content)]
+        entry.setdefault("summary", content)
+    if tags:
+        entry["tags"] = tags
+
+
+def _atom_text(element) -> str:
+    """Texte d'une construction Atom (text, html ou xhtml)."""
+    if element.get("type") == "xhtml":
+        div = element.find("{http://www.w3.org/1999/xhtml}div")
+        if div is not None:
+            return _inner_xml(div).strip()
+    return (element.text or "").strip()
+
+
+def _inner_xml(element) -> str:
+    """Sérialise le contenu d'un élément XHTML sans préfixes d'espace de noms."""
+    parts = [escape(element.text or "")]
+    for child in element:
+        name = child.tag.rsplit("}", 1)[-1]
+        attributes = "".join(f" {key.rsplit('}', 1)[-1]}={quoteattr(value)}" for key, value in child.items())
+        parts.append(f"<{name}{attributes}>{_inner_xml(child)}</{name}>")
+        parts.append(escape(child.tail or ""))
+    return "".join(parts)
+
+
+def _set_date(entry: FastEntry, field: str, value: str):
+    """Renseigne une date brute et sa version analysée (struct_time UTC, None si inconnue)."""
+    if not value or field in entry:
+        return
+    entry[field] = value
+    entry[f"{field}_parsed"] = parse_date(value)
+
+
+def parse_date(value: str) -> Optional[time.struct_time]:
+    """
+    Analyse une date RFC 822 (RSS) ou ISO 8601 (Atom, Dublin Core).
+
+    Args:
+        value: Date brute
+
+    Returns:
+        Date en UTC (None si le format n'est pas reconnu)
+    """
+    epoch = parse_epoch(value)
+    if epoch is None:
+        return None
+    try:
+        return time.gmtime(epoch)
+    except (OverflowError, ValueError, OSError):
+        return None
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Politesse envers les sites collectés : limite de connexions simultanées,
+espacement minimal des requêtes et respect de Retry-After, par hôte.
+"""
+
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    """
+    Retourne l'hôte d'une URL (clé de limitation).
+
+    Args:
+        url: URL de la ressource
+
+    Returns:
+        Nom d'hôte en minuscules (chaîne vide si absent)
+    """
+    return (urlsplit(url).hostname or "").lower()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Interprète un en-tête Retry-After (secondes ou date HTTP).
+
+    Args:
+        value: Valeur de l'en-tête
+
+    Returns:
+        Délai en secondes (None si absent ou illisible)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HostLimiter:
+    """
+    Limiteur de requêtes par hôte, partagé par les threads de collecte.
+
+    Un hôte est disponible lorsqu'il a moins de max_connections requêtes en
+    cours, que min_interval s'est écoulé depuis la dernière requête lancée
+    et qu'aucun Retry-After n'est en cours. Le répartiteur interroge
+    wait_time() pour servir les autres hôtes pendant qu'un hôte patiente.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialise le limiteur.
+
+        Args:
+            config: Configuration (max_connections, min_interval, max_retry_after)
+        """
+        config = config or {}
+        self.max_connections = config.get("max_connections", 2)
+        self.min_interval = config.get("min_interval", 1.0)  # Secondes entre deux requêtes d'un hôte
+        self.max_retry_after = config.get("max_retry_after", 3600)  # Plafond des Retry-After honorés
+        self._hosts: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> Dict[str, float]:
+        """État d'un hôte (créé au premier usage)."""
+        return self._hosts.setdefault(host, {"active": 0, "last_start": -math.inf, "blocked_until": 0.0})
+
+    def wait_time(self, host: str, now: Optional[float] = None) -> float:
+        """
+        Retourne le délai avant qu'une requête vers l'hôte soit permise.
+
+        Args:
+            host: Hôte visé
+            now: Horloge monotone de référence (par défaut maintenant)
+
+        Returns:
+            Délai en secondes (0 si disponible, inf si toutes ses connexions sont occupées)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._state(host)
+            if state["active"] >= self.max_connections:
+                return math.inf
+            return max(state["blocked_until"] - now, state["last_start"] + self.min_interval - now, 0.0)
+
+    def throttled_for(self, host: str, now: Optional[float] = None) -> float:
+        """
+        Retourne le temps restant d'un Retry-After sur l'hôte.
+
+        Args:
+            host: Hôte visé
+            now: Horloge monotone de référence (par défaut maintenant)
+
+        Returns:
+            Délai en secondes (0 si l'hôte n'est pas ralenti)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return max(self._state(host)["blocked_until"] - now, 0.0)
+
+    def try_acquire(self, host: str) -> bool:
+        """
+        Réserve une connexion vers l'hôte s'il est disponible.
+
+        Args:
+            host: Hôte visé
+
+        Returns:
+            True si la requête peut partir (release() à appeler ensuite)
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host)
+            if (state["active"] >= self.max_connections or state["blocked_until"] > now
+                    or state["last_start"] + self.min_interval > now):
+                return False
+            state["active"] += 1
+            state["last_start"] = now
+            return True
+
+    def release(self, host: str):
+        """
+        Libère une connexion réservée par try_acquire().
+
+        Args:
+            host: Hôte visé
+        """
+        with self._lock:
+            state = self._state(host)
+            state["active"] = max(state["active"] - 1, 0)
+
+    def throttle(self, host: str, seconds: float):
+        """
+        Suspend les requêtes vers l'hôte (Retry-After).
+
+        Args:
+            host: Hôte visé
+            seconds: Durée de la suspension (plafonnée à max_retry_after)
+        """
+        until = time.monotonic() + min(max(seconds, 0.0), self.max_retry_after)
+        with self._lock:
+            state = self._state(host)
+            state["blocked_until"] = max(state["blocked_until"], until)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état des hôtes actifs ou ralentis.
+
+        Returns:
+            Connexions en cours et suspension restante par hôte
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {"active": int(state["active"]), "throttled_for": round(max(state["blocked_until"] - now, 0.0))}
+                for host, state in self._hosts.items()
+                if state["active"] or state["blocked_until"] > now
+            }
\ No newline at end of file
@@ -1,7 +1,12 @@
+import os
+import time
 import praw
-from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base_collector import BaseCollector
+from .reddit_engagement import EngagementTracker
+from monitoring import span
+from monitoring.metrics import ARTICLES_FETCHED, ARTICLES_KEPT
+from utils.deadline import Deadline
 
 class RedditCollector(BaseCollector):
     """
@@ -14,29 +19,42 @@ class RedditCollector(BaseCollector):
         Initialise le collecteur Reddit.
         
         Args:
-            config: Configuration avec client_id, client_secret, user_agent, subreddits, etc.
+            config: Configuration avec subreddits, limit, etc. (client_id, client_secret et
+                    user_agent, par défaut REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET et REDDIT_USER_AGENT)
         """
         super().__init__("reddit", config)
         
+        # Identifiants : configuration, sinon variables d'environnement
         self.reddit = praw.Reddit(
-            client_id=config.get("client_id"),
-            client_secret=config.get("client_secret"),
-            user_agent=config.get("user_agent", "InfoWatchdog/1.0")
+            client_id=config.get("client_id") or os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=config.get("client_secret") or os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=config.get("user_agent") or os.getenv("REDDIT_USER_AGENT", "InfoWatchdog/1.0"),
+            timeout=config.get("timeout", 16)  # Borne chaque requête à l'API
         )
         
         self.subreddits = config.get("subreddits", ["environment"])
         self.limit = config.get("limit", 50)
         self.time_filter = config.get("time_filter", "day")  # hour, day, week, month, year
         self.sort_type = config.get("sort_type", "hot")  # hot, new, top, rising
+        
+        # Suivi du score des posts récents (désactivé par défaut)
+        engagement_config = config.get("engagement", {}) or {}
+        self.engagement = EngagementTracker(engagement_config) if engagement_config.get("enabled", False) else None
     
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, sources: Optional[List[str]] = None,
+                deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         Collecte les posts depuis les subreddits configurés.
         
+        Args:
+            sources: Subreddits à collecter (None pour tous)
+            deadline: Échéance du cycle (interrompt le parcours des posts)
+        
         Returns:
             Liste d'articles formatés
         """
         articles = []
+        self.polled_sources = []
         
         if not self.is_enabled:
             self.logger.info("Reddit collector is disabled")
@@ -44,8 +62,19 @@ class RedditCollector(BaseCollector):
         
         try:
             for subreddit_name in self.subreddits:
+                if sources is not None and subreddit_name not in sources:
+                    continue
+                
+                if deadline and deadline.expired:
+                    self.logger.warning("Cycle deadline reached, skipping remaining subreddits")
+                    break
+                
                 self.logger.info(f"Collecting from r/{subreddit_name}")
-                subreddit_articles = self._collect_from_subreddit(subreddit_name)
+                subreddit_articles = self._collect_source(
+                    subreddit_name, f"r/{subreddit_name}",
+                    lambda: self._collect_from_subreddit(subreddit_name, deadline),
+                    deadline
+                )
                 articles.extend(subreddit_articles)
                 
             self.logger.info(f"Collected {len(articles)} articles from Reddit")
@@ -55,15 +84,41 @@ class RedditCollector(BaseCollector):
             self.logger.error(f"Error collecting from Reddit: {str(e)}")
             return articles
     
-    def _collect_from_subreddit(self, subreddit_name: str) -> List[Dict[str, Any]]:
+    def get_sources(self) -> List[str]:
+        """
+        Retourne les subreddits configurés.
+        
+        Returns:
+            Liste des noms de subreddits
+        """
+        return list(self.subreddits)
+    
+    def get_source_id(self, article: Dict[str, Any]) -> str:
+        """
+        Retourne le subreddit d'origine d'un article.
+        
+        Args:
+            article: Article collecté
+            
+        Returns:
+            Nom du subreddit
+        """
+        return article.get("subreddit", "")
+    
+    def _collect_from_subreddit(self, subreddit_name: str,
+                                deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         Collecte les posts d'un subreddit spécifique.
         
         Args:
             subreddit_name: Nom du subreddit
+            deadline: Échéance du cycle (les posts déjà traités sont conservés)
             
         Returns:
             Liste d'articles du subreddit
+            
+        Raises:
+            Exception: En cas d'erreur de l'API Reddit (après journalisation)
         """
         articles = []
         
@@ -82,22 +137,35 @@ class RedditCollector(BaseCollector):
             else:
                 posts = subreddit.hot(limit=self.limit)
             
-            for post in posts:
-                # Filtre les posts épinglés et supprimés
-                if post.stickied or post.removed_by_category:
-                    continue
-                
-                # Vérifie la pertinence du contenu
-                full_text = f"{post.title} {post.selftext}"
-                if not self._is_relevant(full_text):
-                    continue
-                
+            # Récupère les posts (requêtes paginées pendant le parcours)
+            with span("fetch") as fetch_span:
+                fetched = []
+                for post in posts:
+                    if deadline and deadline.expired:
+                        self.logger.warning(f"Cycle deadline reached while reading r/{subreddit_name}")
+                        break
+                    fetched.append(post)
+                fetch_span.set(items=len(fetched))
+            
+            # Filtre les posts épinglés, supprimés et non pertinents
+            with span("filter", items_in=len(fetched)) as filter_span:
+                relevant = [
+                    post for post in fetched
+                    if not (post.stickied or post.removed_by_category)
+                    and self._is_relevant(f"{post.title} {post.selftext}")
+                ]
+                filter_span.set(items_out=len(relevant))
+            
+            ARTICLES_FETCHED.labels(self.name, f"r/{subreddit_name}").inc(len(fetched))
+            ARTICLES_KEPT.labels(self.name, f"r/{subreddit_name}").inc(len(relevant))
+            
+            for post in relevant:
                 article = self._create_article_dict(
                     title=post.title,
                     url=post.url if not post.is_self else f"https://reddit.com{post.permalink}",
                     source=f"r/{subreddit_name}",
                     content=post.selftext[:500] if post.selftext else "",  # Limite à 500 caractères
-                    published_date=datetime.fromtimestamp(post.created_utc, tz=timezone.utc),
+                    published_date=post.created_utc,
                     author=str(post.author) if post.author else "Unknown",
                     tags=self._extract_tags_from_post(post)
                 )
@@ -110,14 +178,90 @@ class RedditCollector(BaseCollector):
                     "is_self_post": post.is_self,
                     "subreddit": subreddit_name
                 })
+                # Reddit_ID n'est écrit que si le suivi d'engagement est configuré :
+                # les tables antérieures n'ont pas cette colonne
+                if self.engagement:
+                    article["reddit_id"] = post.id
                 
                 articles.append(article)
+            
+            if self.engagement:
+                self.engagement.track(articles)
                 
         except Exception as e:
             self.logger.error(f"Error collecting from r/{subreddit_name}: {str(e)}")
+            raise
         
         return articles
     
+    def attach_state(self, state_dir: str):
+        """
+        Associe le suivi d'engagement à son fichier d'état.
+        
+        Args:
+            state_dir: Répertoire des états persistés
+        """
+        if self.engagement:
+            self.engagement.attach(os.path.join(state_dir, f"engagement_{self.name}.json"))
+    
+    def refresh(self, deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """
+        Relit le score et les commentaires des posts récents (/api/info, 100 par requête).
+        
+        Args:
+            deadline: Échéance du cycle
+            
+        Returns:
+            Mises à jour des articles dont l'engagement diffère du stockage,
+            y compris celles dont l'écriture n'a pas été confirmée
+        """
+        if not self.engagement or not self.is_enabled:
+            return []
+        
+        start = time.monotonic()
+        try:
+            self.engagement.refresh(self.reddit, deadline)
+            self.connection_health.record_success(time.monotonic() - start)
+        except Exception as e:
+            # Les relevés des lots déjà lus sont conservés
+            self.connection_health.record_failure(str(e), time.monotonic() - start)
+            self.logger.error(f"Error refreshing Reddit engagement: {str(e)}")
+        
+        self.engagement.save()
+        updates = self.engagement.pending_updates()
+        if updates:
+            self.logger.info(f"Engagement changed for {len(updates)} Reddit posts")
+        
+        trending = self.engagement.trending(3)
+        if trending:
+            self.logger.info("Trending Reddit posts: " + ", ".join(
+                f"{post['url']} (+{post['velocity']:.0f}/h)" for post in trending
+            ))
+        return updates
+    
+    def confirm_refresh(self, updates: List[Dict[str, Any]]):
+        """
+        Marque comme synchronisées les mises à jour écrites par le stockage.
+        
+        Args:
+            updates: Mises à jour retournées par refresh() et effectivement écrites
+        """
+        if self.engagement and updates:
+            self.engagement.confirm(updates)
+            self.engagement.save()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du collecteur, avec le suivi d'engagement.
+        
+        Returns:
+            Dictionnaire avec le statut du collecteur
+        """
+        status = super().get_status()
+        if self.engagement:
+            status["engagement"] = self.engagement.get_status()
+        return status
+    
     def _extract_tags_from_post(self, post) -> List[str]:
         """
         Extrait les tags/mots-clés d'un post Reddit.
@@ -155,12 +299,15 @@ class RedditCollector(BaseCollector):
         Returns:
             True si la connexion fonctionne, False sinon
         """
+        start = time.monotonic()
         try:
             # Test simple en récupérant les infos utilisateur
             user = self.reddit.user.me()
+            self.connection_health.record_success(time.monotonic() - start)
             self.logger.info("Reddit connection test successful")
             return True
         except Exception as e:
+            self.connection_health.record_failure(str(e), time.monotonic() - start)
             self.logger.error(f"Reddit connection test failed: {str(e)}")
             return False
     
@@ -0,0 +1,353 @@
+"""
+Suivi de l'engagement des posts Reddit déjà collectés.
+
+Le score et le nombre de commentaires d'un post évoluent après sa collecte.
+Plutôt que de relister les subreddits, les posts récents sont relus en masse
+par l'endpoint /api/info (100 identifiants par requête) ; chaque relevé est
+ajouté à une série temporelle compacte. Les dernières valeurs écrites dans
+le stockage sont suivies à part : un post reste à synchroniser tant que
+son écriture n'a pas été confirmée.
+"""
+
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from monitoring import span
+from utils.deadline import Deadline
+from utils.state import load_state, save_state
+
+# Nombre maximal d'identifiants acceptés par /api/info
+INFO_BATCH_SIZE = 100
+
+
+class EngagementSeries:
+    """
+    Série temporelle (horodatage, score, commentaires) d'un post.
+
+    Les relevés sont stockés en écarts successifs dans des tableaux d'entiers
+    (array) : quelques octets par point, sérialisables tels quels en JSON.
+    Seuls les max_points derniers relevés sont conservés.
+    """
+
+    __slots__ = ("_times", "_scores", "_comments", "max_points")
+
+    def __init__(self, max_points: int = 96):
+        """
+        Initialise une série vide.
+
+        Args:
+            max_points: Nombre maximal de relevés conservés
+        """
+        self.max_points = max_points
+        self._times = array("q")
+        self._scores = array("q")
+        self._comments = array("q")
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def append(self, timestamp: float, score: int, comments: int) -> bool:
+        """
+        Ajoute un relevé.
+
+        Args:
+            timestamp: Horodatage Unix du relevé
+            score: Score du post
+            comments: Nombre de commentaires
+
+        Returns:
+            True si le score ou le nombre de commentaires a changé
+        """
+        last = self.latest()
+        timestamp, score, comments = int(timestamp), int(score), int(comments)
+        if last is None:
+            self._times.append(timestamp)
+            self._scores.append(score)
+            self._comments.append(comments)
+            return True
+
+        self._times.append(timestamp - last[0])
+        self._scores.append(score - last[1])
+        self._comments.append(comments - last[2])
+        if len(self._times) > self.max_points:
+            self._drop_oldest()
+        return (score, comments) != last[1:]
+
+    def _drop_oldest(self):
+        """Retire le premier relevé en reportant sa valeur sur le suivant."""
+        for values in (self._times, self._scores, self._comments):
+            values[1] += values[0]
+            del values[0]
+
+    def latest(self) -> Optional[Tuple[int, int, int]]:
+        """Dernier relevé (horodatage, score, commentaires), None si la série est vide."""
+        if not self._times:
+            return None
+        return sum(self._times), sum(self._scores), sum(self._comments)
+
+    def points(self) -> List[Tuple[int, int, int]]:
+        """Relevés décodés, du plus ancien au plus récent."""
+        points = []
+        timestamp = score = comments = 0
+        for dt, ds, dc in zip(self._times, self._scores, self._comments):
+            timestamp, score, comments = timestamp + dt, score + ds, comments + dc
+            points.append((timestamp, score, comments))
+        return points
+
+    def velocity(self, window: float = 3600) -> float:
+        """
+        Variation du score par heure sur la fenêtre la plus récente.
+
+        Args:
+            window: Durée minimale couverte (secondes)
+
+        Returns:
+            Points de score gagnés par heure (0 sans au moins deux relevés)
+        """
+        points = self.points()
+        if len(points) < 2:
+            return 0.0
+        end = points[-1]
+        start = points[0]
+        for point in reversed(points[:-1]):
+            start = point
+            if end[0] - point[0] >= window:
+                break
+        elapsed = end[0] - start[0]
+        return (end[1] - start[1]) * 3600 / elapsed if elapsed > 0 else 0.0
+
+    def to_state(self) -> List[List[int]]:
+        """Représentation JSON (tableaux d'écarts)."""
+        return [self._times.tolist(), self._scores.tolist(), self._comments.tolist()]
+
+    @classmethod
+    def from_state(cls, state: List[List[int]], max_points: int = 96) -> "EngagementSeries":
+        """Reconstruit une série depuis sa représentation JSON."""
+        series = cls(max_points)
+        times, scores, comments = state
+        series._times.extend(times)
+        series._scores.extend(scores)
+        series._comments.extend(comments)
+        return series
+
+
+class EngagementTracker:
+    """
+    Relevés périodiques de l'engagement des posts Reddit récents.
+
+    Les posts sont suivis max_age_hours heures après leur publication et
+    relus au plus toutes les min_interval secondes. L'état (posts suivis,
+    valeurs synchronisées et séries) est persisté dans un fichier JSON via
+    attach().
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialise le suivi.
+
+        Args:
+            config: Configuration (max_age_hours, min_interval, max_points)
+        """
+        config = config or {}
+        self.max_age = config.get("max_age_hours", 48) * 3600
+        self.min_interval = config.get("min_interval", 3600)
+        self.max_points = config.get("max_points", 96)
+        self.state_path: Optional[str] = None
+        self._posts: Dict[str, Dict[str, Any]] = {}
+        self._series: Dict[str, EngagementSeries] = {}
+        self._last_refresh: Optional[float] = None
+
+    def attach(self, path: str):
+        """
+        Associe un fichier d'état et restaure les posts suivis.
+
+        Args:
+            path: Fichier JSON d'état
+        """
+        self.state_path = path
+        state = load_state(path, {}) or {}
+        self._last_refresh = state.get("last_refresh")
+        for reddit_id, post in state.get("posts", {}).items():
+            try:
+                self._series[reddit_id] = EngagementSeries.from_state(post.pop("series"), self.max_points)
+            except (KeyError, TypeError, ValueError):
+                continue
+            # États antérieurs sans valeurs synchronisées : le dernier relevé fait foi
+            post.setdefault("synced", list(self._series[reddit_id].latest()[1:]))
+            self._posts[reddit_id] = post
+
+    def save(self) -> bool:
+        """Persiste les posts suivis et leurs séries."""
+        posts = {
+            reddit_id: dict(post, series=self._series[reddit_id].to_state())
+            for reddit_id, post in self._posts.items()
+        }
+        return save_state(self.state_path, {"last_refresh": self._last_refresh, "posts": posts})
+
+    def track(self, articles: Iterable[Dict[str, Any]], now: Optional[float] = None):
+        """
+        Ajoute les nouveaux posts collectés au suivi, avec leur relevé de collecte.
+
+        Args:
+            articles: Articles Reddit (reddit_id, hash, published_date, scores)
+            now: Horodatage du relevé (par défaut maintenant)
+        """
+        now = now or time.time()
+        for article in articles:
+            reddit_id = article.get("reddit_id")
+            if not reddit_id or not article.get("hash"):
+                continue
+            # Un post déjà suivi n'est relu que par refresh() : la série reste
+            # alignée sur les valeurs écrites dans le stockage
+            if reddit_id in self._posts:
+                continue
+            score, comments = article.get("reddit_score") or 0, article.get("reddit_comments") or 0
+            # Les valeurs de collecte sont celles écrites avec l'article
+            self._posts[reddit_id] = {
+                "hash": article["hash"],
+                "published": article.get("published_date") or now,
+                "last_check": now,
+                "synced": [score, comments],
+            }
+            series = EngagementSeries(self.max_points)
+            series.append(now, score, comments)
+            self._series[reddit_id] = series
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """
+        Retourne les posts à relire et oublie ceux qui ont dépassé l'âge de suivi.
+
+        Args:
+            now: Horodatage courant (par défaut maintenant)
+
+        Returns:
+            Identifiants des posts dont le dernier relevé date de min_interval secondes
+        """
+        now = now or time.time()
+        for reddit_id in [i for i, post in self._posts.items() if now - post["published"] > self.max_age]:
+            del self._posts[reddit_id]
+            del self._series[reddit_id]
+        return [
+            reddit_id for reddit_id, post in self._posts.items()
+            if now - post["last_check"] >= self.min_interval
+        ]
+
+    def refresh(self, reddit, deadline: Optional[Deadline] = None,
+                now: Optional[float] = None) -> int:
+        """
+        Relit le score des posts dus, par lots de 100 identifiants.
+
+        Les relevés des lots déjà lus sont conservés si un lot suivant lève
+        une exception (propagée).
+
+        Args:
+            reddit: Client praw.Reddit
+            deadline: Échéance du cycle (les lots restants attendent le cycle suivant)
+            now: Horodatage du relevé (par défaut maintenant)
+
+        Returns:
+            Nombre de posts relus
+        """
+        due = self.due(now)
+        if not due:
+            return 0
+
+        read = 0
+        with span("engagement", items=len(due)) as engagement_span:
+            try:
+                for start in range(0, len(due), INFO_BATCH_SIZE):
+                    if deadline and deadline.expired:
+                        break
+                    batch = due[start:start + INFO_BATCH_SIZE]
+                    fetched_at = now or time.time()
+                    for submission in reddit.info(fullnames=[f"t3_{reddit_id}" for reddit_id in batch]):
+                        post = self._posts.get(submission.id)
+                        if post is None:
+                            continue
+                        post["last_check"] = fetched_at
+                        self._series[submission.id].append(fetched_at, submission.score, submission.num_comments)
+                        read += 1
+            finally:
+                engagement_span.set(read=read)
+
+        self._last_refresh = now or time.time()
+        return read
+
+    def pending_updates(self) -> List[Dict[str, Any]]:
+        """
+        Retourne les posts dont le dernier relevé n'est pas encore écrit dans le stockage.
+
+        Les écritures non confirmées (voir confirm) sont ainsi retentées au
+        cycle suivant, sans nouvelle lecture.
+
+        Returns:
+            Mises à jour (hash, reddit_score, reddit_comments)
+        """
+        updates = []
+        for reddit_id, post in self._posts.items():
+            _, score, comments = self._series[reddit_id].latest()
+            if [score, comments] != post["synced"]:
+                updates.append({"hash": post["hash"], "reddit_score": score, "reddit_comments": comments})
+        return updates
+
+    def confirm(self, updates: Iterable[Dict[str, Any]]):
+        """
+        Enregistre les valeurs effectivement écrites dans le stockage.
+
+        Args:
+            updates: Mises à jour confirmées par le stockage
+        """
+        written = {update["hash"]: update for update in updates}
+        if not written:
+            return
+        for post in self._posts.values():
+            update = written.get(post["hash"])
+            if update is not None:
+                post["synced"] = [update["reddit_score"], update["reddit_comments"]]
+
+    def trending(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Posts suivis dont le score progresse le plus vite.
+
+        Args:
+            limit: Nombre de posts retournés
+
+        Returns:
+            Posts en progression (reddit_id, hash, url, score, velocity) par
+            vitesse décroissante
+        """
+        ranked = sorted(
+            ((series.velocity(), reddit_id) for reddit_id, series in self._series.items()),
+            reverse=True
+        )[:limit]
+        return [
+            {
+                "reddit_id": reddit_id,
+                "hash": self._posts[reddit_id]["hash"],
+                "url": f"https://redd.it/{reddit_id}",
+                "score": self._series[reddit_id].latest()[1],
+                "velocity": round(velocity, 2),
+            }
+            for velocity, reddit_id in ranked
+            if velocity > 0
+        ]
+
+    def get_status(self, trending: int = 5) -> Dict[str, Any]:
+        """
+        Retourne l'état du suivi.
+
+        Args:
+            trending: Nombre de posts en progression inclus
+
+        Returns:
+            Nombre de posts suivis, relevés stockés, mises à jour en attente,
+            dernier rafraîchissement et posts en progression
+        """
+        return {
+            "tracked_posts": len(self._posts),
+            "pending_updates": len(self.pending_updates()),
+            "snapshots": sum(len(series) for series in self._series.values()),
+            "last_refresh": self._last_refresh,
+            "trending": self.trending(trending),
+        }
\ No newline at end of file
@@ -1,8 +1,75 @@
+import multiprocessing
+import re
+import threading
+import time
 import feedparser
 import requests
-from datetime import datetime
-from typing import List, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Tuple
 from .base_collector import BaseCollector
+from . import fast_feed_parser
+from .politeness import HostLimiter, host_of, parse_retry_after
+from monitoring import attach, current_span, span
+from monitoring.metrics import ARTICLES_FETCHED, ARTICLES_KEPT, FETCH_BYTES
+from utils.dates import to_epoch
+from utils.deadline import Deadline
+
+# Mots-clés du titre ajoutés aux tags de l'article
+TAG_KEYWORDS = (
+    "climate", "renewable", "solar", "wind", "carbon", "emission",
+    "sustainability", "green", "eco", "pollution", "conservation",
+    "biodiversity", "recycling", "plastic", "ocean", "forest"
+)
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+# Taille des morceaux lus pendant le téléchargement d'un flux
+CHUNK_SIZE = 65536
+
+
+class FeedTooLargeError(Exception):
+    """Flux dépassant le volume maximal autorisé (max_bytes)."""
+
+
+def parse_feed(content: bytes, parser: str = "feedparser") -> Tuple[int, bool, List[tuple], str]:
+    """
+    Parse un flux et extrait les champs de ses entrées pertinentes.
+    
+    Fonction de module : exécutable dans un processus de parsing, ses
+    arguments et son résultat sont sérialisables.
+    
+    Args:
+        content: Contenu brut du flux
+        parser: "feedparser" ou "fast" (repli sur feedparser si le flux est mal formé)
+        
+    Returns:
+        Nombre d'entrées, anomalie de parsing (bozo), champs des entrées
+        pertinentes (voir RSSCollector._entry_fields) et parseur utilisé
+    """
+    feed = fast_feed_parser.parse(content) if parser == "fast" else None
+    if feed is None or feed.bozo:
+        parser = "feedparser"
+        feed = feedparser.parse(content)
+    return len(feed.entries), bool(feed.bozo), relevant_fields(feed.entries), parser
+
+
+def relevant_fields(entries: List[Any]) -> List[tuple]:
+    """
+    Extrait les champs des entrées pertinentes.
+    
+    Args:
+        entries: Entrées parsées (feedparser ou fast_feed_parser)
+        
+    Returns:
+        Champs des entrées pertinentes (voir RSSCollector._entry_fields)
+    """
+    return [
+        RSSCollector._entry_fields(entry) for entry in entries
+        if RSSCollector._is_relevant(f"{entry.get('title', '')} {entry.get('summary', '')}")
+    ]
+
 
 class RSSCollector(BaseCollector):
     """
@@ -21,28 +88,56 @@ class RSSCollector(BaseCollector):
         self.feeds = config.get("feeds", [])
         self.timeout = config.get("timeout", 30)
         self.user_agent = config.get("user_agent", "InfoWatchdog RSS Collector/1.0")
+        self.max_bytes = config.get("max_bytes", 10485760)  # Volume maximal par flux (None : illimité)
+        
+        # Téléchargements simultanés, limités par hôte (connexions, espacement, Retry-After)
+        self.max_workers = max(config.get("max_workers", 4), 1)
+        self.host_limiter = HostLimiter(config.get("per_host", {}))
+        
+        # Session partagée entre les cycles (connexions keep-alive réutilisées)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Parseur : "feedparser" (tolérant) ou "fast" (flux bien formés, repli sur feedparser)
+        self.parser = config.get("parser", "feedparser")
+        
+        # Parsing des gros flux dans des processus dédiés (None pour toujours parser sur place)
+        self.parse_process_threshold = config.get("parse_process_threshold", 1048576)
+        self.parse_workers = config.get("parse_workers")  # Par défaut : nombre de cœurs
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
     
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, sources: Optional[List[str]] = None,
+                deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
-        Collecte les articles depuis tous les flux RSS configurés.
+        Collecte les articles depuis les flux RSS configurés.
+        
+        Args:
+            sources: URLs des flux à collecter (None pour tous)
+            deadline: Échéance du cycle (borne le timeout de chaque flux)
         
         Returns:
             Liste d'articles formatés
         """
         articles = []
+        self.polled_sources = []
         
         if not self.is_enabled:
             self.logger.info("RSS collector is disabled")
             return articles
         
         try:
-            for feed_config in self.feeds:
-                feed_url = feed_config.get("url")
-                feed_name = feed_config.get("name", feed_url)
-                
-                self.logger.info(f"Collecting from RSS feed: {feed_name}")
-                feed_articles = self._collect_from_feed(feed_url, feed_name)
-                articles.extend(feed_articles)
+            pending = [
+                feed_config for feed_config in self.feeds
+                if sources is None or feed_config.get("url") in sources
+            ]
+            results = self._dispatch(pending, deadline)
+            
+            # Conserve l'ordre de la configuration
+            for feed_config in pending:
+                articles.extend(results.get(id(feed_config), []))
                 
             self.logger.info(f"Collected {len(articles)} articles from RSS feeds")
             return articles
@@ -51,18 +146,145 @@ class RSSCollector(BaseCollector):
             self.logger.error(f"Error collecting from RSS feeds: {str(e)}")
             return articles
     
-    def _collect_from_feed(self, feed_url: str, feed_name: str) -> List[Dict[str, Any]]:
+    def _dispatch(self, pending: List[Dict[str, Any]],
+                  deadline: Optional[Deadline] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Répartit les flux entre les threads de téléchargement.
+        
+        Un flux part dès que son hôte est disponible (voir HostLimiter) ; les
+        flux d'un hôte qui patiente laissent passer ceux des autres hôtes. Les
+        flux d'un hôte suspendu (Retry-After) au-delà du timeout sont reportés.
+        
+        Args:
+            pending: Configurations des flux à collecter
+            deadline: Échéance du cycle (plus aucun flux lancé une fois atteinte)
+            
+        Returns:
+            Articles par flux (clé : id de la configuration du flux)
+        """
+        results = {}
+        pending = list(pending)
+        parent_span = current_span()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="rss-fetch") as pool:
+            running = {}
+            while pending or running:
+                if pending and deadline and deadline.expired:
+                    self.logger.warning("Cycle deadline reached, skipping remaining RSS feeds")
+                    pending = []
+                
+                # Lance les flux dont l'hôte est disponible, dans l'ordre de la configuration
+                next_wait = None
+                for feed_config in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    
+                    host = host_of(feed_config.get("url", ""))
+                    throttled = self.host_limiter.throttled_for(host)
+                    if throttled > self.timeout:
+                        self.logger.info(f"Skipping {feed_config.get('name', feed_config.get('url'))}: "
+                                         f"{host} throttled for {throttled:.0f}s")
+                        pending.remove(feed_config)
+                        continue
+                    
+                    if self.host_limiter.try_acquire(host):
+                        pending.remove(feed_config)
+                        future = pool.submit(self._fetch_feed, feed_config, host, deadline, parent_span)
+                        running[future] = feed_config
+                    else:
+                        wait_time = self.host_limiter.wait_time(host)
+                        if wait_time != float("inf"):
+                            next_wait = wait_time if next_wait is None else min(next_wait, wait_time)
+                
+                if running:
+                    timeout = next_wait if pending and len(running) < self.max_workers else None
+                    done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[id(running.pop(future))] = future.result()
+                elif pending:
+                    # Tous les hôtes restants patientent : attend le premier disponible
+                    delay = next_wait if next_wait is not None else 0.05
+                    remaining = deadline.remaining() if deadline else None
+                    time.sleep(delay if remaining is None else min(delay, remaining))
+        
+        return results
+    
+    def _fetch_feed(self, feed_config: Dict[str, Any], host: str,
+                    deadline: Optional[Deadline], parent_span=None) -> List[Dict[str, Any]]:
+        """
+        Collecte un flux dans un thread de téléchargement, puis libère son hôte.
+        
+        Args:
+            feed_config: Configuration du flux
+            host: Hôte réservé par le répartiteur
+            deadline: Échéance du cycle (borne le timeout du flux)
+            parent_span: Span du collecteur, sous lequel rattacher la trace du flux
+            
+        Returns:
+            Articles du flux (liste vide en cas d'échec)
+        """
+        feed_url = feed_config.get("url")
+        feed_name = feed_config.get("name", feed_url)
+        timeout = deadline.timeout(self.timeout) if deadline else self.timeout
+        max_bytes = feed_config.get("max_bytes", self.max_bytes)
+        
+        try:
+            with attach(parent_span):
+                self.logger.info(f"Collecting from RSS feed: {feed_name}")
+                return self._collect_source(
+                    feed_url, feed_name,
+                    lambda: self._collect_from_feed(feed_url, feed_name, timeout, max_bytes),
+                    deadline
+                )
+        finally:
+            self.host_limiter.release(host)
+    
+    def get_sources(self) -> List[str]:
+        """
+        Retourne les URLs des flux configurés.
+        
+        Returns:
+            Liste des URLs de flux
+        """
+        return [feed_config.get("url") for feed_config in self.feeds]
+    
+    def get_source_id(self, article: Dict[str, Any]) -> str:
+        """
+        Retourne l'URL du flux d'origine d'un article.
+        
+        Args:
+            article: Article collecté
+            
+        Returns:
+            URL du flux
+        """
+        return article.get("feed_url", "")
+    
+    def _collect_from_feed(self, feed_url: str, feed_name: str,
+                           timeout: Optional[float] = None,
+                           max_bytes: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Collecte les articles d'un flux RSS spécifique.
         
+        Le flux est téléchargé par morceaux : le téléchargement s'arrête dès
+        que max_bytes est dépassé, et avec le parseur "fast" chaque morceau
+        est parsé dès sa réception.
+        
         Args:
             feed_url: URL du flux RSS
             feed_name: Nom du flux pour identification
+            timeout: Timeout de la requête (par défaut self.timeout)
+            max_bytes: Volume maximal du flux (None : illimité)
             
         Returns:
             Liste d'articles du flux
+            
+        Raises:
+            FeedTooLargeError: Si le flux dépasse max_bytes (après journalisation)
+            Exception: En cas d'erreur réseau ou de parsing (après journalisation)
         """
         articles = []
+        timeout = timeout or self.timeout
         
         try:
             # Configuration pour les requêtes
@@ -71,49 +293,251 @@ class RSSCollector(BaseCollector):
                 'Accept': 'application/rss+xml, application/xml, text/xml'
             }
             
-            # Récupère le flux RSS
-            response = requests.get(feed_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
+            # Récupère le flux RSS (parsé au fil de l'eau par le parseur rapide)
+            stream_parser = fast_feed_parser.FastFeedParser() if self.parser == "fast" else None
+            with span("fetch", max_bytes=max_bytes) as fetch_span:
+                content = self._download(feed_url, headers, timeout, max_bytes, stream_parser, fetch_span)
+            FETCH_BYTES.labels(self.name, feed_name).inc(len(content))
             
-            # Parse le flux RSS
-            feed = feedparser.parse(response.content)
+            # Parse le flux et ne garde que les entrées pertinentes
+            with span("parse", bytes=len(content)) as parse_span:
+                feed = stream_parser.close() if stream_parser else None
+                if feed is not None and not feed.bozo:
+                    total, bozo, rows, parser, offloaded = (
+                        len(feed.entries), False, relevant_fields(feed.entries), "fast", False
+                    )
+                else:
+                    total, bozo, rows, parser, offloaded = self._parse(content, timeout, "feedparser")
+                parse_span.set(items=total, items_out=len(rows), bozo=bozo, parser=parser, process=offloaded)
             
-            if feed.bozo:
+            if bozo:
                 self.logger.warning(f"RSS feed may have issues: {feed_name}")
+            elif parser != self.parser:
+                self.logger.debug(f"Fast parser rejected {feed_name}, parsed with feedparser")
             
-            for entry in feed.entries:
-                # Vérifie la pertinence du contenu
-                full_text = f"{entry.get('title', '')} {entry.get('summary', '')}"
-                if not self._is_relevant(full_text):
-                    continue
-                
-                article = self._create_article_dict(
-                    title=entry.get('title', 'No title'),
-                    url=entry.get('link', ''),
-                    source=feed_name,
-                    content=self._extract_content(entry),
-                    published_date=self._parse_date(entry),
-                    author=self._extract_author(entry),
-                    tags=self._extract_tags_from_entry(entry)
-                )
-                
-                # Ajoute des métadonnées RSS spécifiques
-                article.update({
-                    "feed_url": feed_url,
-                    "categories": entry.get('tags', []),
-                    "guid": entry.get('id', entry.get('guid', ''))
-                })
-                
-                articles.append(article)
+            ARTICLES_FETCHED.labels(self.name, feed_name).inc(total)
+            ARTICLES_KEPT.labels(self.name, feed_name).inc(len(rows))
+            
+            articles = [self._article_from_fields(fields, feed_url, feed_name) for fields in rows]
                 
         except requests.RequestException as e:
             self.logger.error(f"Network error fetching RSS feed {feed_name}: {str(e)}")
+            raise
+        except FeedTooLargeError as e:
+            self.logger.error(f"RSS feed {feed_name} aborted: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error parsing RSS feed {feed_name}: {str(e)}")
+            raise
         
         return articles
     
-    def _extract_content(self, entry) -> str:
+    def _download(self, feed_url: str, headers: Dict[str, str], timeout: float,
+                  max_bytes: Optional[int], stream_parser=None, fetch_span=None) -> bytes:
+        """
+        Télécharge un flux par morceaux, dans la limite de max_bytes et de timeout.
+        
+        Args:
+            feed_url: URL du flux RSS
+            headers: En-têtes de la requête
+            timeout: Durée maximale du téléchargement complet (secondes)
+            max_bytes: Volume maximal (None : illimité)
+            stream_parser: Parseur incrémental alimenté à chaque morceau (optionnel)
+            fetch_span: Span du téléchargement (statut et volumes transférés)
+            
+        Returns:
+            Contenu du flux
+            
+        Raises:
+            FeedTooLargeError: Si le volume annoncé ou reçu dépasse max_bytes
+            requests.Timeout: Si le téléchargement dépasse timeout
+        """
+        started = time.monotonic()
+        chunks = []
+        received = 0
+        
+        with self.session.get(feed_url, headers=headers, timeout=timeout, stream=True) as response:
+            if fetch_span is not None:
+                fetch_span.set(status=response.status_code)
+            
+            # Respecte le ralentissement demandé par le site (les autres hôtes continuent)
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is None and response.status_code == 429:
+                    retry_after = 60.0
+                if retry_after is not None:
+                    self.logger.warning(f"{host_of(feed_url)} asked to retry after {retry_after:.0f}s")
+                    self.host_limiter.throttle(host_of(feed_url), retry_after)
+            response.raise_for_status()
+            
+            # Rejette d'emblée un flux annoncé trop volumineux
+            declared = response.headers.get("Content-Length", "")
+            if max_bytes and declared.isdigit() and int(declared) > max_bytes:
+                raise FeedTooLargeError(f"Content-Length {declared} exceeds max_bytes ({max_bytes})")
+            
+            try:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    received += len(chunk)
+                    if max_bytes and received > max_bytes:
+                        raise FeedTooLargeError(f"more than max_bytes ({max_bytes}) received")
+                    if time.monotonic() - started > timeout:
+                        raise requests.Timeout(f"Download exceeded {timeout:.0f}s")
+                    
+                    chunks.append(chunk)
+                    if stream_parser is not None:
+                        stream_parser.feed(chunk)
+            finally:
+                if fetch_span is not None:
+                    # Octets décodés et octets reçus sur le réseau (compressés)
+                    wire_bytes = response.raw.tell() if hasattr(response.raw, "tell") else received
+                    fetch_span.set(bytes=received, wire_bytes=wire_bytes)
+        
+        return b"".join(chunks)
+    
+    def _parse(self, content: bytes, timeout: float,
+               parser: Optional[str] = None) -> Tuple[int, bool, List[tuple], str, bool]:
+        """
+        Parse un flux, dans un processus dédié au-delà de parse_process_threshold.
+        
+        Args:
+            content: Contenu brut du flux
+            timeout: Attente maximale du processus de parsing
+            parser: Parseur à utiliser (par défaut self.parser)
+            
+        Returns:
+            Résultat de parse_feed et indicateur de parsing hors processus
+        """
+        parser = parser or self.parser
+        if self.parse_process_threshold is not None and len(content) >= self.parse_process_threshold:
+            pool = self._get_parse_pool()
+            if pool is not None:
+                try:
+                    return (*pool.submit(parse_feed, content, parser).result(timeout=timeout), True)
+                except BrokenProcessPool:
+                    self.logger.warning("RSS parse process pool is broken, parsing in-process")
+                    self._shutdown_parse_pool(pool)
+                except FutureTimeoutError:
+                    # Un processus bloqué occuperait le pool pour tous les flux suivants
+                    self.logger.warning(f"RSS parse process timed out after {timeout}s, restarting the pool")
+                    self._shutdown_parse_pool(pool, terminate=True)
+                except CancelledError:
+                    # Pool arrêté par un autre thread pendant l'attente
+                    pass
+        
+        return (*parse_feed(content, parser), False)
+    
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Retourne le pool de processus de parsing, créé au premier gros flux.
+        
+        Le pool est créé depuis les threads de téléchargement : ses processus
+        sont lancés par un serveur dédié (forkserver, ou spawn à défaut) et
+        non par fork du processus multi-threadé, dont un verrou tenu par un
+        autre thread bloquerait l'enfant.
+        
+        Returns:
+            Pool de processus (None si la plateforme ne le permet pas)
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None and self.parse_process_threshold is not None:
+                try:
+                    methods = multiprocessing.get_all_start_methods()
+                    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                    self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=context)
+                except (OSError, NotImplementedError, ValueError) as e:
+                    self.logger.warning(f"RSS parse process pool unavailable, parsing in-process: {e}")
+                    self.parse_process_threshold = None
+            return self._parse_pool
+    
+    def _shutdown_parse_pool(self, pool: Optional[ProcessPoolExecutor] = None, terminate: bool = False):
+        """
+        Arrête le pool de processus de parsing ; le suivant est créé à la demande.
+        
+        Args:
+            pool: Pool à arrêter, s'il est toujours le pool courant (None pour le pool courant)
+            terminate: Termine aussi les processus en cours (processus bloqué)
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None or (pool is not None and pool is not self._parse_pool):
+                return
+            pool, self._parse_pool = self._parse_pool, None
+        
+        # Le pool n'expose pas ses processus : un processus bloqué ne s'arrête qu'ainsi
+        processes = list((getattr(pool, "_processes", None) or {}).values()) if terminate else []
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+    
+    @staticmethod
+    def _entry_fields(entry) -> tuple:
+        """
+        Extrait les champs d'une entrée RSS sous forme compacte.
+        
+        Args:
+            entry: Entrée RSS
+            
+        Returns:
+            (titre, lien, contenu, date de publication, auteur, tags, catégories, guid)
+        """
+        return (
+            entry.get('title', 'No title'),
+            entry.get('link', ''),
+            RSSCollector._extract_content(entry),
+            RSSCollector._parse_date(entry),
+            RSSCollector._extract_author(entry),
+            RSSCollector._extract_tags_from_entry(entry),
+            [dict(tag) for tag in entry.get('tags', [])],
+            entry.get('id', entry.get('guid', ''))
+        )
+    
+    def _article_from_fields(self, fields: tuple, feed_url: str, feed_name: str) -> Dict[str, Any]:
+        """
+        Construit un article à partir des champs extraits d'une entrée.
+        
+        Args:
+            fields: Champs retournés par _entry_fields
+            feed_url: URL du flux RSS
+            feed_name: Nom du flux pour identification
+            
+        Returns:
+            Article formaté
+        """
+        title, url, content, published_date, author, tags, categories, guid = fields
+        article = self._create_article_dict(
+            title=title,
+            url=url,
+            source=feed_name,
+            content=content,
+            published_date=published_date,
+            author=author,
+            tags=tags
+        )
+        
+        # Ajoute des métadonnées RSS spécifiques
+        article.update({
+            "feed_url": feed_url,
+            "categories": categories,
+            "guid": guid
+        })
+        
+        return article
+    
+    def _entry_to_article(self, entry, feed_url: str, feed_name: str) -> Dict[str, Any]:
+        """
+        Convertit une entrée RSS pertinente en article.
+        
+        Args:
+            entry: Entrée RSS
+            feed_url: URL du flux RSS
+            feed_name: Nom du flux pour identification
+            
+        Returns:
+            Article formaté
+        """
+        return self._article_from_fields(self._entry_fields(entry), feed_url, feed_name)
+    
+    @staticmethod
+    def _extract_content(entry) -> str:
         """
         Extrait le contenu d'une entrée RSS.
         
@@ -133,13 +557,13 @@ class RSSCollector(BaseCollector):
                     content = content[0].get('value', '')
                 if content:
                     # Supprime les balises HTML basiques
-                    import re
-                    content = re.sub(r'<[^>]+>', '', str(content))
+                    content = _HTML_TAG.sub('', str(content))
                     return content[:1000]  # Limite à 1000 caractères
         
         return ""
     
-    def _parse_date(self, entry) -> datetime:
+    @staticmethod
+    def _parse_date(entry) -> Optional[float]:
         """
         Parse la date de publication d'une entrée RSS.
         
@@ -147,34 +571,28 @@ class RSSCollector(BaseCollector):
             entry: Entrée RSS
             
         Returns:
-            Date de publication ou date actuelle si non trouvée
+            Horodatage Unix de publication (None si non trouvée)
         """
-        date_fields = ['published_parsed', 'updated_parsed']
+        # Dates déjà décomposées (UTC) par le parseur
+        for field in ('published_parsed', 'updated_parsed'):
+            date_tuple = entry.get(field)
+            if date_tuple:
+                published = to_epoch(date_tuple)
+                if published is not None:
+                    return published
         
-        for field in date_fields:
-            if hasattr(entry, field):
-                date_tuple = getattr(entry, field)
-                if date_tuple:
-                    try:
-                        return datetime(*date_tuple[:6])
-                    except (TypeError, ValueError):
-                        continue
-        
-        # Essaie de parser les dates string
-        date_string_fields = ['published', 'updated']
-        for field in date_string_fields:
-            if hasattr(entry, field):
-                date_string = getattr(entry, field)
-                if date_string:
-                    try:
-                        from dateutil import parser
-                        return parser.parse(date_string)
-                    except Exception:
-                        continue
+        # Dates brutes non reconnues par le parseur
+        for field in ('published', 'updated'):
+            date_string = entry.get(field)
+            if date_string:
+                published = to_epoch(date_string)
+                if published is not None:
+                    return published
         
-        return datetime.now()
+        return None
     
-    def _extract_author(self, entry) -> str:
+    @staticmethod
+    def _extract_author(entry) -> str:
         """
         Extrait l'auteur d'une entrée RSS.
         
@@ -194,7 +612,8 @@ class RSSCollector(BaseCollector):
         
         return "Unknown"
     
-    def _extract_tags_from_entry(self, entry) -> List[str]:
+    @staticmethod
+    def _extract_tags_from_entry(entry) -> List[str]:
         """
         Extrait les tags/catégories d'une entrée RSS.
         
@@ -215,14 +634,8 @@ class RSSCollector(BaseCollector):
                     tags.append(tag)
         
         # Ajoute des tags basés sur le contenu
-        environmental_keywords = [
-            "climate", "renewable", "solar", "wind", "carbon", "emission",
-            "sustainability", "green", "eco", "pollution", "conservation",
-            "biodiversity", "recycling", "plastic", "ocean", "forest"
-        ]
-        
         title = entry.get('title', '').lower()
-        for keyword in environmental_keywords:
+        for keyword in TAG_KEYWORDS:
             if keyword in title:
                 tags.append(keyword)
         
@@ -240,7 +653,7 @@ class RSSCollector(BaseCollector):
         """
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=self.timeout)
+            response = self.session.get(feed_url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             
             feed = feedparser.parse(response.content)
@@ -253,4 +666,22 @@ class RSSCollector(BaseCollector):
                 
         except Exception as e:
             self.logger.error(f"RSS feed test failed {feed_url}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du collecteur, avec les hôtes en cours de collecte ou ralentis.
+        
+        Returns:
+            Dictionnaire avec le statut du collecteur
+        """
+        status = super().get_status()
+        status["hosts"] = self.host_limiter.get_status()
+        return status
+    
+    def close(self):
+        """
+        Ferme la session HTTP et le pool de parsing du collecteur.
+        """
+        self.session.close()
+        self._shutdown_parse_pool()
\ No newline at end of file
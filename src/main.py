@@ -1,12 +1,20 @@
 import os
+import time
 import yaml
+import signal
 import logging
+import threading
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
-from collectors import RedditCollector, RSSCollector
-from storage import AirtableStorage
+from registry import COLLECTORS
+from storage import create_storage
+from scheduling import AdaptivePollingScheduler
+from utils.deadline import Deadline
+from utils.locking import CycleLock
+from monitoring import CycleTrace, span
+from monitoring.metrics import CYCLE_DURATION, CYCLES, LAST_CYCLE_TIMESTAMP, SPOOL_DEPTH, start_metrics_server
 
 class InfoWatchdog:
     """
@@ -30,9 +38,28 @@ class InfoWatchdog:
         # Charge la configuration
         self.config = self._load_config(config_path)
         
-        # Initialise les composants
-        self.collectors = []
+        # Répertoire des états persistés entre les exécutions
+        self.state_dir = self.config.get("app", {}).get("state_dir", "data")
+        
+        # Verrou empêchant deux cycles simultanés (cron, démon, lancement manuel)
+        self._cycle_lock = CycleLock(os.path.join(self.state_dir, "cycle.lock"))
+        
+        # Initialise les composants (collecteurs créés au premier accès)
+        self._collectors = None
         self.storage = None
+        self.polling_scheduler = None
+        
+        # Métriques du dernier cycle (affichées par run.py)
+        self._last_cycle_duration = 0.0
+        self._last_articles_collected = 0
+        
+        # Serveur HTTP des métriques (mode démon)
+        self._metrics_server = None
+        
+        # Signal d'arrêt du mode démon
+        self._stop_event = threading.Event()
+        # Échéance du cycle en cours, expirée par stop()
+        self._active_deadline: Optional[Deadline] = None
         
         self._initialize_components()
         
@@ -72,66 +99,139 @@ class InfoWatchdog:
             return {}
     
     def _initialize_components(self):
-        """Initialise les collecteurs et le système de stockage."""
-        # Initialise les collecteurs
-        self._initialize_collectors()
+        """
+        Initialise le système de stockage et la planification.
         
+        Les collecteurs sont créés au premier accès à `collectors` : --stats
+        et les vérifications de santé n'importent ni praw ni feedparser.
+        """
         # Initialise le stockage
         self._initialize_storage()
+        
+        # Initialise la planification adaptative par source
+        self._initialize_polling_scheduler()
     
-    def _initialize_collectors(self):
-        """Initialise tous les collecteurs configurés."""
-        collectors_config = self.config.get("collectors", {})
+    @property
+    def collectors(self) -> List[Any]:
+        """Collecteurs actifs, initialisés lors du premier accès."""
+        if self._collectors is None:
+            self._collectors = []
+            self._initialize_collectors()
+            
+            # Restaure la santé des sources de chaque collecteur
+            self._attach_source_health()
+        return self._collectors
+    
+    def _configured_collectors(self) -> Dict[str, bool]:
+        """
+        Retourne les collecteurs décrits par la configuration, sans les importer.
         
-        # Collecteur Reddit
-        reddit_config = collectors_config.get("reddit", {})
-        if reddit_config.get("enabled", True):
-            try:
-                reddit_config.update({
-                    "client_id": os.getenv("REDDIT_CLIENT_ID"),
-                    "client_secret": os.getenv("REDDIT_CLIENT_SECRET"),
-                    "user_agent": os.getenv("REDDIT_USER_AGENT", "InfoWatchdog/1.0")
-                })
-                reddit_collector = RedditCollector(reddit_config)
-                self.collectors.append(reddit_collector)
-                logging.info("Reddit collector initialized")
-            except Exception as e:
-                logging.error(f"Failed to initialize Reddit collector: {e}")
+        Returns:
+            Activation de chaque collecteur par nom
+        """
+        return {
+            name: (collector_config or {}).get("enabled", True)
+            for name, collector_config in self.config.get("collectors", {}).items()
+        }
+    
+    def _initialize_collectors(self):
+        """
+        Initialise les collecteurs activés dans la configuration.
         
-        # Collecteur RSS
-        rss_config = collectors_config.get("rss", {})
-        if rss_config.get("enabled", True):
+        Chaque section de `collectors` désigne un type du registre (ou une
+        classe via `class: "module:Classe"`) ; seuls les types activés sont importés.
+        """
+        for name, collector_config in self.config.get("collectors", {}).items():
+            collector_config = collector_config or {}
+            if not collector_config.get("enabled", True):
+                continue
+            
             try:
-                rss_collector = RSSCollector(rss_config)
-                self.collectors.append(rss_collector)
-                logging.info("RSS collector initialized")
+                collector_class = COLLECTORS.load(name, collector_config.get("class"))
+                self._collectors.append(collector_class(collector_config))
+                logging.info(f"{name.title()} collector initialized")
             except Exception as e:
-                logging.error(f"Failed to initialize RSS collector: {e}")
+                logging.error(f"Failed to initialize {name.title()} collector: {e}")
     
     def _initialize_storage(self):
         """Initialise le système de stockage."""
         storage_config = self.config.get("storage", {})
         storage_type = storage_config.get("type", "airtable")
         
-        if storage_type == "airtable":
-            try:
-                airtable_config = {
-                    "api_key": os.getenv("AIRTABLE_API_KEY"),
-                    "base_id": os.getenv("AIRTABLE_BASE_ID"),
-                    "table_name": os.getenv("AIRTABLE_TABLE_NAME", "Environmental_News"),
-                    "enabled": storage_config.get("enabled", True)
-                }
-                self.storage = AirtableStorage(airtable_config)
-                logging.info("Airtable storage initialized")
-            except Exception as e:
-                logging.error(f"Failed to initialize Airtable storage: {e}")
-        else:
-            logging.error(f"Unsupported storage type: {storage_type}")
+        try:
+            self.storage = create_storage(storage_config)
+            self.storage.attach_spool(os.path.join(self.state_dir, "storage_spool.jsonl"))
+            self.storage.stats.attach(os.path.join(self.state_dir, "storage_stats.json"))
+            SPOOL_DEPTH.set_function(self.storage.spool_depth)
+            logging.info(f"{storage_type.title()} storage initialized")
+        except Exception as e:
+            logging.error(f"Failed to initialize {storage_type.title()} storage: {e}")
+            return
+        
+        self._initialize_enrichment()
     
-    def collect_all(self) -> List[Dict[str, Any]]:
+    def _initialize_enrichment(self):
+        """
+        Associe au stockage l'enrichissement en texte intégral si activé.
+        
+        BeautifulSoup n'est importé que dans ce cas.
+        """
+        enrichment_config = self.config.get("enrichment", {}) or {}
+        if not enrichment_config.get("enabled", False):
+            return
+        
+        try:
+            from processors.enrichment import ArticleEnricher
+            self.storage.attach_enricher(
+                ArticleEnricher(enrichment_config, os.path.join(self.state_dir, "page_cache"))
+            )
+            logging.info("Full-text enrichment initialized")
+        except Exception as e:
+            logging.error(f"Failed to initialize full-text enrichment: {e}")
+    
+    def _attach_source_health(self):
+        """Associe à chaque collecteur son fichier d'état de santé des sources et ses états propres."""
+        for collector in self._collectors:
+            collector.health.attach(os.path.join(self.state_dir, f"health_{collector.name}.json"))
+            collector.health.forget_missing(collector.get_sources())
+            collector.attach_state(self.state_dir)
+    
+    def _initialize_polling_scheduler(self):
+        """Initialise le planificateur adaptatif si activé dans la configuration."""
+        schedule_config = self.config.get("schedule", {})
+        adaptive_config = schedule_config.get("adaptive", {})
+        if not adaptive_config.get("enabled", False):
+            return
+        
+        scheduler_config = {"default_interval": schedule_config.get("interval", 3600)}
+        scheduler_config.update(adaptive_config)
+        
+        self.polling_scheduler = AdaptivePollingScheduler(
+            scheduler_config,
+            state_path=os.path.join(self.state_dir, "polling_schedule.json")
+        )
+        self.polling_scheduler.sync_sources(
+            self._source_key(collector, source)
+            for collector in self.collectors
+            for source in collector.get_sources()
+        )
+        logging.info("Adaptive polling scheduler initialized")
+    
+    @staticmethod
+    def _source_key(collector, source: str) -> str:
+        """Identifiant global d'une source : collecteur et source du collecteur."""
+        return f"{collector.name}:{source}"
+    
+    def collect_all(self, sources: Optional[Dict[str, List[str]]] = None,
+                    deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         Lance la collecte depuis tous les collecteurs actifs.
         
+        Args:
+            sources: Sources à collecter par nom de collecteur
+                     (None pour toutes les sources de tous les collecteurs)
+            deadline: Échéance du cycle (collecte partielle une fois atteinte)
+        
         Returns:
             Liste de tous les articles collectés
         """
@@ -142,25 +242,79 @@ class InfoWatchdog:
         for collector in self.collectors:
             if not collector.is_enabled:
                 continue
+            
+            collector_sources = None
+            if sources is not None:
+                collector_sources = sources.get(collector.name)
+                if not collector_sources:
+                    continue
+                
+            if deadline and deadline.expired:
+                self.logger.warning(f"Cycle deadline reached, skipping {collector.name}")
+                self._record_polls(collector, collector_sources, [], polled=[])
+                continue
                 
             try:
                 self.logger.info(f"Collecting from {collector.name}")
-                articles = collector.collect()
+                with span("collector", collector=collector.name) as collector_span:
+                    articles = collector.collect(collector_sources, deadline)
+                    collector_span.set(items=len(articles))
                 all_articles.extend(articles)
                 self.logger.info(f"Collected {len(articles)} articles from {collector.name}")
                 
+                self._record_polls(collector, collector_sources, articles)
+                
             except Exception as e:
                 self.logger.error(f"Error collecting from {collector.name}: {e}")
+                # Replanifie les sources en échec (ralentissement progressif)
+                self._record_polls(collector, collector_sources, [],
+                                   polled=collector_sources or collector.get_sources())
+            
+            collector.health.save()
+        
+        if self.polling_scheduler:
+            self.polling_scheduler.save()
         
         self.logger.info(f"Total articles collected: {len(all_articles)}")
         return all_articles
     
-    def store_articles(self, articles: List[Dict[str, Any]]) -> bool:
+    def _record_polls(self, collector, sources: Optional[List[str]], articles: List[Dict[str, Any]],
+                      polled: Optional[List[str]] = None):
         """
-        Stocke les articles collectés.
+        Transmet au planificateur adaptatif le résultat de la collecte de chaque source.
+        
+        Args:
+            collector: Collecteur interrogé
+            sources: Sources demandées (None pour toutes)
+            articles: Articles retournés par le collecteur
+            polled: Sources effectivement interrogées (par défaut collector.polled_sources) ;
+                    les autres, interrompues par l'échéance, restent dues
+        """
+        if not self.polling_scheduler:
+            return
+        
+        polled = set(collector.polled_sources if polled is None else polled)
+        published_dates = {source: [] for source in (sources or collector.get_sources())}
+        for article in articles:
+            source = collector.get_source_id(article)
+            if source in published_dates:
+                published_dates[source].append(article.get("published_date"))
+        
+        for source, dates in published_dates.items():
+            key = self._source_key(collector, source)
+            if source in polled:
+                self.polling_scheduler.record(key, dates)
+            else:
+                self.polling_scheduler.requeue(key)
+    
+    def store_articles(self, articles: List[Dict[str, Any]], deadline: Optional[Deadline] = None) -> bool:
+        """
+        Stocke les articles collectés, précédés des articles en attente
+        des cycles précédents (insertion ou mise à jour avec storage.upsert).
         
         Args:
             articles: Liste d'articles à stocker
+            deadline: Échéance du cycle (les articles non écrits sont mis en attente)
             
         Returns:
             True si le stockage a réussi
@@ -169,44 +323,169 @@ class InfoWatchdog:
             self.logger.error("No storage system initialized")
             return False
         
-        if not articles:
+        replayed = self.storage.drain_spool()
+        
+        if not replayed and not articles:
+            self.storage.ack_spool()
             self.logger.info("No articles to store")
             return True
         
+        acknowledged = True
         try:
-            self.logger.info(f"Storing {len(articles)} articles")
-            success = self.storage.store(articles)
-            
-            if success:
-                self.logger.info("Articles stored successfully")
+            self.logger.info(f"Storing {len(replayed) + len(articles)} articles")
+            if self.config.get("storage", {}).get("upsert", False):
+                # Les articles déjà stockés sont réécrits au lieu d'être ignorés
+                written = self.storage.upsert_many(replayed + articles, deadline=deadline)
+                success = written["failed"] == 0
+                # Un article ni écrit ni remis en attente ne doit pas quitter le rejeu
+                acknowledged = written["spooled"] >= written["failed"]
             else:
-                self.logger.error("Failed to store some articles")
-            
-            return success
+                success = self.storage.store(replayed + articles, deadline)
             
         except Exception as e:
             self.logger.error(f"Error storing articles: {e}")
+            # Les articles rejoués restent dans le fichier de rejeu
+            self.storage.spool(articles)
             return False
+        
+        # Chaque article a été écrit ou remis en attente par le stockage
+        if acknowledged:
+            self.storage.ack_spool()
+        else:
+            self.logger.warning("Some articles could not be spooled, keeping the replayed spool")
+        
+        if success:
+            self.logger.info("Articles stored successfully")
+        else:
+            self.logger.error("Failed to store some articles")
+        
+        return success
+    
+    def refresh_articles(self, deadline: Optional[Deadline] = None) -> int:
+        """
+        Met à jour les articles déjà stockés dont les métadonnées ont changé
+        (score et commentaires des posts Reddit récents).
+        
+        Args:
+            deadline: Échéance du cycle
+            
+        Returns:
+            Nombre d'articles mis à jour
+        """
+        if not self.storage:
+            return 0
+        
+        updates_by_collector = []
+        for collector in self.collectors:
+            if deadline and deadline.expired:
+                break
+            if collector.is_enabled:
+                updates_by_collector.append((collector, collector.refresh(deadline)))
+        
+        updates = [update for _, collector_updates in updates_by_collector for update in collector_updates]
+        if not updates:
+            return 0
+        
+        try:
+            written = set(self.storage.update_many(updates, deadline=deadline))
+        except Exception as e:
+            self.logger.error(f"Error updating articles: {e}")
+            return 0
+        
+        # Seules les écritures confirmées sont marquées comme synchronisées
+        for collector, collector_updates in updates_by_collector:
+            collector.confirm_refresh([update for update in collector_updates if update.get("hash") in written])
+        return len(written)
     
-    def run_collection_cycle(self) -> Dict[str, Any]:
+    def run_collection_cycle(self, sources: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """
         Exécute un cycle complet de collecte et stockage.
         
+        Le cycle est borné par schedule.cycle_timeout : une fois l'échéance
+        atteinte, la collecte s'arrête avec les articles déjà obtenus et les
+        articles non écrits sont mis en attente pour le cycle suivant. Un
+        verrou empêche l'exécution de deux cycles en parallèle.
+        
+        Chaque étape est mesurée ; la trace du cycle est ajoutée en une
+        ligne JSON à monitoring.trace_file (logs/cycle_trace.jsonl).
+        
+        Args:
+            sources: Sources à collecter par nom de collecteur (None pour toutes)
+        
         Returns:
             Rapport du cycle d'exécution
         """
         start_time = datetime.now()
-        self.logger.info("Starting collection cycle")
         
-        # Collecte les données
-        articles = self.collect_all()
+        if not self._cycle_lock.acquire():
+            owner = self._cycle_lock.owner()
+            self.logger.warning(f"Another collection cycle is running (pid {owner}), skipping")
+            CYCLES.labels("skipped").inc()
+            return {
+                "start_time": start_time.isoformat(),
+                "end_time": datetime.now().isoformat(),
+                "duration_seconds": 0.0,
+                "articles_collected": 0,
+                "storage_success": False,
+                "skipped": True
+            }
         
-        # Stocke les données
-        storage_success = self.store_articles(articles)
+        try:
+            schedule_config = self.config.get("schedule", {})
+            deadline = Deadline(schedule_config.get("cycle_timeout", schedule_config.get("interval", 3600)))
+            self._active_deadline = deadline
+            if self._stop_event.is_set():
+                deadline.expire()
+            self.logger.info(f"Starting collection cycle (time budget {deadline.seconds} seconds)")
+            
+            with CycleTrace() as trace:
+                # Collecte les données
+                with span("collect") as collect_span:
+                    articles = self.collect_all(sources, deadline)
+                    collect_span.set(items=len(articles))
+                
+                # Stocke les données
+                with span("store", items=len(articles)) as store_span:
+                    storage_success = self.store_articles(articles, deadline)
+                    store_span.set(success=storage_success)
+                
+                # Rafraîchit les articles déjà stockés
+                with span("refresh") as refresh_span:
+                    refresh_span.set(updated=self.refresh_articles(deadline))
+                
+                trace.root.set(
+                    articles_collected=len(articles),
+                    storage_success=storage_success,
+                    deadline_expired=deadline.expired
+                )
+        finally:
+            self._active_deadline = None
+            self._cycle_lock.release()
         
         end_time = datetime.now()
         duration = end_time - start_time
         
+        self._last_cycle_duration = duration.total_seconds()
+        self._last_articles_collected = len(articles)
+        
+        if deadline.expired:
+            cycle_status = "deadline"
+        else:
+            cycle_status = "ok" if storage_success else "failed"
+        CYCLES.labels(cycle_status).inc()
+        CYCLE_DURATION.observe(self._last_cycle_duration)
+        LAST_CYCLE_TIMESTAMP.set(time.time())
+        
+        trace_file = self.config.get("monitoring", {}).get("trace_file", "logs/cycle_trace.jsonl")
+        if trace_file:
+            trace.write(trace_file)
+        
+        slowest = sorted(trace.find("source"), key=lambda s: s.duration or 0, reverse=True)[:3]
+        if slowest:
+            self.logger.info("Slowest sources: " + ", ".join(
+                f"{s.attributes.get('source')} ({s.duration:.2f}s)" for s in slowest
+            ))
+        
         # Génère le rapport
         report = {
             "start_time": start_time.isoformat(),
@@ -214,13 +493,163 @@ class InfoWatchdog:
             "duration_seconds": duration.total_seconds(),
             "articles_collected": len(articles),
             "storage_success": storage_success,
+            "deadline_expired": deadline.expired,
+            "stages": {child.name: round(child.duration or 0.0, 3) for child in trace.root.children},
             "collectors_status": [collector.get_status() for collector in self.collectors],
-            "storage_status": self.storage.get_status() if self.storage else None
+            "storage_status": self.storage.get_status() if self.storage else None,
+            "enrichment_status": self.storage.enricher.get_status() if self.storage and self.storage.enricher else None,
+            "polling_status": self.polling_scheduler.get_status() if self.polling_scheduler else None
         }
         
         self.logger.info(f"Collection cycle completed in {duration.total_seconds():.2f} seconds")
         return report
     
+    def run_daemon(self, interval: Optional[int] = None):
+        """
+        Exécute les cycles de collecte en continu (mode démon).
+        
+        Les collecteurs, le stockage, leurs sessions HTTP et leurs caches
+        restent en mémoire d'un cycle à l'autre. SIGINT/SIGTERM interrompent
+        le cycle en cours (échéance expirée, articles non écrits mis en
+        attente) puis arrêtent proprement l'agent.
+        
+        Avec la planification adaptative (schedule.adaptive.enabled), le démon
+        vérifie régulièrement les échéances et ne collecte que les sources dues.
+        
+        Args:
+            interval: Intervalle entre deux cycles en secondes
+                      (par défaut schedule.interval de la configuration)
+        """
+        import schedule
+        
+        interval = interval or self.config.get("schedule", {}).get("interval", 3600)
+        
+        self._stop_event.clear()
+        self._install_signal_handlers()
+        self._start_metrics_server()
+        
+        scheduler = schedule.Scheduler()
+        if self.polling_scheduler:
+            tick = self.config["schedule"]["adaptive"].get("tick", 60)
+            scheduler.every(tick).seconds.do(self._run_adaptive_cycle)
+            self.logger.info(f"Daemon started, adaptive polling checked every {tick} seconds")
+        else:
+            scheduler.every(interval).seconds.do(self._run_scheduled_cycle)
+            self.logger.info(f"Daemon started, collection every {interval} seconds")
+        
+        try:
+            # Premier cycle immédiat, les suivants selon l'intervalle
+            if self.polling_scheduler:
+                self._run_adaptive_cycle()
+            else:
+                self._run_scheduled_cycle()
+            
+            while not self._stop_event.is_set():
+                scheduler.run_pending()
+                idle_seconds = scheduler.idle_seconds
+                self._stop_event.wait(max(idle_seconds, 0) if idle_seconds is not None else interval)
+        finally:
+            self.close()
+            self.logger.info("Daemon stopped")
+    
+    def _start_metrics_server(self):
+        """Expose les métriques en HTTP si monitoring.metrics_port est configuré."""
+        monitoring_config = self.config.get("monitoring", {})
+        port = monitoring_config.get("metrics_port")
+        if not port or self._metrics_server:
+            return
+        
+        try:
+            self._metrics_server = start_metrics_server(
+                port, monitoring_config.get("metrics_host", "127.0.0.1")
+            )
+        except OSError as e:
+            self.logger.error(f"Could not start metrics server on port {port}: {e}")
+    
+    def stop(self):
+        """
+        Demande l'arrêt du mode démon.
+        
+        Le cycle en cours voit son échéance expirer : la collecte s'arrête et
+        les articles non écrits sont mis en attente pour le prochain démarrage.
+        """
+        self._stop_event.set()
+        deadline = self._active_deadline
+        if deadline is not None:
+            deadline.expire()
+    
+    def _run_adaptive_cycle(self):
+        """Collecte uniquement les sources dont l'échéance adaptative est atteinte."""
+        due_sources: Dict[str, List[str]] = {}
+        for key in self.polling_scheduler.due():
+            collector_name, source = key.split(":", 1)
+            due_sources.setdefault(collector_name, []).append(source)
+        
+        if not due_sources:
+            return
+        
+        self.logger.info(f"Sources due: {sum(len(s) for s in due_sources.values())}")
+        try:
+            self._run_scheduled_cycle(due_sources)
+        finally:
+            # Cycle ignoré (verrou) ou interrompu avant l'enregistrement des collectes
+            requeued = self.polling_scheduler.requeue_in_flight()
+            if requeued:
+                self.logger.warning(f"{requeued} due sources were not polled, requeued")
+    
+    def _run_scheduled_cycle(self, sources: Optional[Dict[str, List[str]]] = None):
+        """
+        Exécute un cycle planifié sans interrompre le démon en cas d'erreur.
+        
+        Args:
+            sources: Sources à collecter par nom de collecteur (None pour toutes)
+        """
+        if self._stop_event.is_set():
+            return
+        
+        try:
+            report = self.run_collection_cycle(sources)
+            self.logger.info(
+                f"Cycle report: {report['articles_collected']} articles, "
+                f"storage success: {report['storage_success']}"
+            )
+        except Exception as e:
+            self.logger.error(f"Collection cycle failed: {e}")
+    
+    def _install_signal_handlers(self):
+        """Arrête proprement le démon sur SIGINT/SIGTERM."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        
+        def handle_signal(signum, frame):
+            self.logger.info(f"Received signal {signum}, cancelling the current cycle and stopping")
+            self.stop()
+        
+        signal.signal(signal.SIGINT, handle_signal)
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, handle_signal)
+    
+    def close(self):
+        """Libère les ressources des collecteurs, du stockage et du serveur de métriques."""
+        if self._metrics_server:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+        
+        for collector in self._collectors or []:
+            try:
+                collector.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing collector {collector.name}: {e}")
+        
+        if self.storage:
+            try:
+                self.storage.close()
+                if self.storage.enricher:
+                    self.storage.enricher.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing storage: {e}")
+    
     def test_connections(self) -> Dict[str, bool]:
         """
         Teste toutes les connexions (collecteurs et stockage).
@@ -250,18 +679,20 @@ class InfoWatchdog:
         Returns:
             Dictionnaire avec les statistiques
         """
+        # Compte les collecteurs depuis la configuration : --stats ne les charge pas
+        configured = self._configured_collectors()
         stats = {
             "collectors": {
-                "total": len(self.collectors),
-                "enabled": len([c for c in self.collectors if c.is_enabled]),
-                "details": [c.get_status() for c in self.collectors]
+                "total": len(configured),
+                "enabled": sum(1 for enabled in configured.values() if enabled),
+                "details": [c.get_status() for c in self._collectors or []]
             }
         }
         
         if self.storage:
-            stats["storage"] = self.storage.get_stats() if hasattr(self.storage, 'get_stats') else self.storage.get_status()
+            stats["storage"] = self.storage.get_stats()
         
         return stats
     
     def __str__(self) -> str:
-        return f"InfoWatchdog(collectors={len(self.collectors)}, storage={self.storage.name if self.storage else 'None'})"
\ No newline at end of file
+        return f"InfoWatchdog(collectors={len(self._collectors or [])}, storage={self.storage.name if self.storage else 'None'})"
\ No newline at end of file
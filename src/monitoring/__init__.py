@@ -0,0 +1,17 @@
+"""
+Module monitoring pour InfoWatchdog.
+Contient le suivi de santé des connexions et des sources collectées,
+ainsi que la trace des cycles de collecte.
+"""
+
+from .health import ConnectionHealth, SourceHealthTracker
+from .trace import CycleTrace, attach, current_span, span
+
+__all__ = [
+    'ConnectionHealth',
+    'SourceHealthTracker',
+    'CycleTrace',
+    'attach',
+    'current_span',
+    'span'
+]
\ No newline at end of file
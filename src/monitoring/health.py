@@ -0,0 +1,261 @@
+import time
+import logging
+from typing import Dict, Any, Optional
+
+from utils.state import load_state, save_state
+
+
+class ConnectionHealth:
+    """
+    État de connexion d'un composant (stockage, API), mis en cache.
+
+    L'état est alimenté par le résultat des opérations réelles ; il n'est
+    considéré comme périmé qu'après ttl secondes sans opération, ce qui
+    permet de produire des rapports sans requête supplémentaire.
+    """
+
+    def __init__(self, ttl: float = 300):
+        """
+        Initialise l'état de connexion.
+
+        Args:
+            ttl: Durée de validité d'une observation en secondes
+        """
+        self.ttl = ttl
+        self.healthy: Optional[bool] = None
+        self.last_success: Optional[float] = None
+        self.last_failure: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_latency: Optional[float] = None
+        self.checked_at: Optional[float] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Indique si la dernière observation date de moins de ttl secondes."""
+        return self.checked_at is not None and time.time() - self.checked_at < self.ttl
+
+    def record_success(self, latency: Optional[float] = None):
+        """
+        Enregistre une opération réussie.
+
+        Args:
+            latency: Durée de l'opération en secondes
+        """
+        self.healthy = True
+        self.last_success = self.checked_at = time.time()
+        self.last_latency = latency
+
+    def record_failure(self, error: str, latency: Optional[float] = None):
+        """
+        Enregistre une opération en échec.
+
+        Args:
+            error: Message d'erreur
+            latency: Durée de l'opération en secondes
+        """
+        self.healthy = False
+        self.last_failure = self.checked_at = time.time()
+        self.last_error = error[:200]
+        self.last_latency = latency
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état de connexion mis en cache.
+
+        Returns:
+            Dictionnaire avec l'état, sa fraîcheur et la dernière erreur
+        """
+        return {
+            "healthy": self.healthy,
+            "fresh": self.is_fresh,
+            "checked_at": _format_timestamp(self.checked_at),
+            "last_success": _format_timestamp(self.last_success),
+            "last_error": self.last_error,
+            "last_latency": round(self.last_latency, 3) if self.last_latency is not None else None
+        }
+
+
+class SourceHealthTracker:
+    """
+    Suivi de santé et disjoncteur (circuit breaker) par source.
+
+    Chaque source (flux RSS, subreddit...) conserve son nombre d'échecs
+    consécutifs, sa dernière réussite et sa latence moyenne. Au-delà de
+    failure_threshold échecs consécutifs, le circuit s'ouvre : la source est
+    ignorée pendant un délai qui double à chaque nouvel échec (jusqu'à
+    max_backoff). À l'expiration du délai, une collecte d'essai est
+    autorisée ; une réussite referme le circuit.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, state_path: Optional[str] = None):
+        """
+        Initialise le suivi de santé.
+
+        Args:
+            config: Configuration (failure_threshold, base_backoff, max_backoff)
+            state_path: Fichier JSON de persistance de l'état des sources
+        """
+        config = config or {}
+        self.failure_threshold = config.get("failure_threshold", 3)
+        self.base_backoff = config.get("base_backoff", 300)
+        self.max_backoff = config.get("max_backoff", 86400)
+        self.smoothing = config.get("smoothing", 0.3)  # Poids des nouvelles latences
+
+        self.logger = logging.getLogger("monitoring.health")
+        self.state_path = None
+        self._sources: Dict[str, Dict[str, Any]] = {}
+
+        if state_path:
+            self.attach(state_path)
+
+    def attach(self, state_path: str):
+        """
+        Associe un fichier d'état et charge l'état persisté.
+
+        Args:
+            state_path: Fichier JSON de persistance de l'état des sources
+        """
+        self.state_path = state_path
+        self._sources.update(load_state(state_path, {}) or {})
+
+    def _state(self, source: str) -> Dict[str, Any]:
+        """Retourne (en le créant au besoin) l'état d'une source."""
+        return self._sources.setdefault(source, {
+            "consecutive_failures": 0,
+            "total_failures": 0,
+            "total_successes": 0,
+            "last_success": None,
+            "last_failure": None,
+            "last_error": None,
+            "avg_latency": None,
+            "open_until": None
+        })
+
+    def allow(self, source: str, now: Optional[float] = None) -> bool:
+        """
+        Indique si une source peut être collectée.
+
+        Args:
+            source: Identifiant de la source
+            now: Horodatage de référence (par défaut maintenant)
+
+        Returns:
+            True si le circuit est fermé ou si une collecte d'essai est due
+        """
+        state = self._sources.get(source)
+        if state is None or state["open_until"] is None:
+            return True
+        return (now or time.time()) >= state["open_until"]
+
+    def record_success(self, source: str, latency: float, now: Optional[float] = None):
+        """
+        Enregistre une collecte réussie et referme le circuit.
+
+        Args:
+            source: Identifiant de la source
+            latency: Durée de la collecte en secondes
+            now: Horodatage de la collecte (par défaut maintenant)
+        """
+        state = self._state(source)
+        if state["open_until"] is not None:
+            self.logger.info(f"Source {source} recovered after {state['consecutive_failures']} failures")
+
+        state["consecutive_failures"] = 0
+        state["total_successes"] += 1
+        state["last_success"] = now or time.time()
+        state["open_until"] = None
+        self._record_latency(state, latency)
+
+    def record_failure(self, source: str, error: str, latency: float, now: Optional[float] = None):
+        """
+        Enregistre une collecte en échec et ouvre le circuit si nécessaire.
+
+        Args:
+            source: Identifiant de la source
+            error: Message d'erreur
+            latency: Durée de la tentative en secondes
+            now: Horodatage de la tentative (par défaut maintenant)
+        """
+        now = now or time.time()
+        state = self._state(source)
+        state["consecutive_failures"] += 1
+        state["total_failures"] += 1
+        state["last_failure"] = now
+        state["last_error"] = error[:200]
+        self._record_latency(state, latency)
+
+        excess = state["consecutive_failures"] - self.failure_threshold
+        if excess >= 0:
+            backoff = min(self.base_backoff * 2 ** min(excess, 32), self.max_backoff)
+            state["open_until"] = now + backoff
+            self.logger.warning(
+                f"Circuit open for {source} after {state['consecutive_failures']} failures, "
+                f"next probe in {backoff:.0f} seconds"
+            )
+
+    def _record_latency(self, state: Dict[str, Any], latency: float):
+        """Met à jour la latence moyenne (moyenne mobile exponentielle)."""
+        previous = state["avg_latency"]
+        state["avg_latency"] = latency if previous is None else (
+            self.smoothing * latency + (1 - self.smoothing) * previous
+        )
+
+    def forget_missing(self, sources):
+        """
+        Oublie les sources qui ne sont plus configurées.
+
+        Args:
+            sources: Identifiants des sources configurées
+        """
+        sources = set(sources)
+        for source in list(self._sources):
+            if source not in sources:
+                del self._sources[source]
+
+    def save(self) -> bool:
+        """
+        Persiste l'état des sources.
+
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        return save_state(self.state_path, self._sources)
+
+    def get_status(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Retourne l'état de santé de chaque source.
+
+        Args:
+            now: Horodatage de référence (par défaut maintenant)
+
+        Returns:
+            Dictionnaire par source avec l'état du circuit et les statistiques
+        """
+        now = now or time.time()
+        status = {}
+        for source, state in self._sources.items():
+            if state["open_until"] is None:
+                circuit = "closed"
+            elif now >= state["open_until"]:
+                circuit = "half-open"
+            else:
+                circuit = "open"
+
+            status[source] = {
+                "circuit": circuit,
+                "consecutive_failures": state["consecutive_failures"],
+                "total_failures": state["total_failures"],
+                "total_successes": state["total_successes"],
+                "last_success": _format_timestamp(state["last_success"]),
+                "last_error": state["last_error"],
+                "avg_latency": round(state["avg_latency"], 3) if state["avg_latency"] is not None else None,
+                "next_probe": _format_timestamp(state["open_until"])
+            }
+        return status
+
+
+def _format_timestamp(value: Optional[float]) -> Optional[str]:
+    """Formate un horodatage pour les rapports."""
+    if value is None:
+        return None
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(value))
\ No newline at end of file
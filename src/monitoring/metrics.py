@@ -0,0 +1,355 @@
+"""
+Métriques numériques de l'agent, exposées au format texte Prometheus.
+Les compteurs sont de simples additions sous verrou : leur coût sur le
+chemin critique est négligeable, le formatage n'a lieu qu'à la lecture.
+"""
+
+import bisect
+import logging
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("monitoring.metrics")
+
+# Bornes des histogrammes de latence (secondes)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    """Formate une valeur selon le format d'exposition."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Formate un ensemble de labels ({name="value",...})."""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric(ABC):
+    """Base commune des métriques : nom, aide, labels et valeurs par combinaison de labels."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+
+    def labels(self, *values) -> "_Metric":
+        """
+        Retourne la série correspondant aux valeurs de labels (créée au besoin).
+
+        Args:
+            *values: Valeurs des labels, dans l'ordre de labelnames
+
+        Returns:
+            Série de la métrique, à conserver pour éviter la recherche
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        return type(self)(self.name, self.documentation)
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], "_Metric"]]:
+        """Séries à exposer : une par combinaison de labels, ou la métrique elle-même."""
+        if self.labelnames:
+            return sorted(self._children.items())
+        return [((), self)]
+
+    def collect(self) -> List[str]:
+        """
+        Retourne les lignes d'exposition de la métrique.
+
+        Returns:
+            Lignes HELP, TYPE et échantillons
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, series in self._series():
+            lines.extend(series._samples(self.labelnames, values))
+        return lines
+
+    @abstractmethod
+    def _samples(self, labelnames: Sequence[str], values: Sequence[str]) -> List[str]:
+        """
+        Retourne les échantillons d'une série.
+
+        Args:
+            labelnames: Noms des labels de la métrique
+            values: Valeurs des labels de la série
+
+        Returns:
+            Lignes d'échantillons au format d'exposition
+        """
+        pass
+
+
+class Counter(_Metric):
+    """Compteur croissant (articles, requêtes, erreurs...)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def inc(self, amount: float = 1):
+        """Incrémente le compteur."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self, labelnames, values):
+        return [f"{self.name}{_format_labels(labelnames, values)} {_format_value(self._value)}"]
+
+
+class Gauge(_Metric):
+    """Valeur instantanée (profondeur de file, horodatage...)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        """Fixe la valeur."""
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1):
+        """Augmente la valeur."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1):
+        """Diminue la valeur."""
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """
+        Calcule la valeur à chaque lecture plutôt qu'à chaque événement.
+
+        Args:
+            function: Fonction sans argument retournant la valeur courante
+        """
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception as e:
+                logger.warning(f"Could not evaluate gauge {self.name}: {e}")
+                return math.nan
+        return self._value
+
+    def _samples(self, labelnames, values):
+        return [f"{self.name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution de durées, par intervalles cumulés."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float):
+        """Enregistre une observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def _samples(self, labelnames, values):
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), self._counts):
+            cumulative += count
+            labels = _format_labels(tuple(labelnames) + ("le",), tuple(values) + (_format_value(bound),))
+            samples.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        samples.append(f"{self.name}_sum{labels} {_format_value(self._sum)}")
+        samples.append(f"{self.name}_count{labels} {cumulative}")
+        return samples
+
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Enregistre une métrique (la métrique existante est retournée si le nom est déjà pris).
+
+        Args:
+            metric: Métrique à exposer
+
+        Returns:
+            Métrique enregistrée
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def exposition(self) -> str:
+        """
+        Retourne toutes les métriques au format texte Prometheus.
+
+        Returns:
+            Document d'exposition
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Collecte
+ARTICLES_FETCHED = REGISTRY.counter(
+    "infowatchdog_articles_fetched_total", "Entries returned by a source before filtering",
+    ("collector", "source"))
+ARTICLES_KEPT = REGISTRY.counter(
+    "infowatchdog_articles_kept_total", "Entries kept by the relevance filter",
+    ("collector", "source"))
+FETCH_LATENCY = REGISTRY.histogram(
+    "infowatchdog_fetch_duration_seconds", "Duration of a source fetch",
+    ("collector", "source"))
+FETCH_ERRORS = REGISTRY.counter(
+    "infowatchdog_fetch_errors_total", "Failed source fetches",
+    ("collector", "source"))
+FETCH_BYTES = REGISTRY.counter(
+    "infowatchdog_fetch_bytes_total", "Bytes downloaded from a source (after content decoding)",
+    ("collector", "source"))
+
+# Stockage
+ARTICLES_DEDUPED = REGISTRY.counter(
+    "infowatchdog_articles_deduplicated_total", "Articles dropped as already stored",
+    ("source",))
+ARTICLES_STORED = REGISTRY.counter(
+    "infowatchdog_articles_stored_total", "Articles written to storage",
+    ("source",))
+STORAGE_REQUESTS = REGISTRY.counter(
+    "infowatchdog_storage_requests_total", "Storage API requests",
+    ("storage", "operation", "status"))
+STORAGE_LATENCY = REGISTRY.histogram(
+    "infowatchdog_storage_request_duration_seconds", "Duration of a storage API request",
+    ("storage", "operation"))
+STORAGE_RATE_LIMITED = REGISTRY.counter(
+    "infowatchdog_storage_rate_limited_total", "Storage API requests rejected with HTTP 429",
+    ("storage",))
+SPOOL_DEPTH = REGISTRY.gauge(
+    "infowatchdog_spool_depth", "Articles waiting in the storage spool")
+
+# Cycles
+CYCLES = REGISTRY.counter(
+    "infowatchdog_cycles_total", "Collection cycles",
+    ("status",))
+CYCLE_DURATION = REGISTRY.histogram(
+    "infowatchdog_cycle_duration_seconds", "Duration of a collection cycle",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600))
+LAST_CYCLE_TIMESTAMP = REGISTRY.gauge(
+    "infowatchdog_last_cycle_timestamp_seconds", "Unix time of the last completed cycle")
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY):
+    """
+    Expose les métriques en HTTP dans un thread de fond.
+
+    http.server n'est importé qu'ici : seul le mode démon en a besoin.
+
+    Args:
+        port: Port d'écoute
+        host: Adresse d'écoute (locale par défaut)
+        registry: Registre à exposer
+
+    Returns:
+        Serveur démarré (ThreadingHTTPServer, à arrêter avec shutdown())
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Sert le document d'exposition sur /metrics."""
+
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+
+            body = registry.exposition().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+
+    logger.info(f"Metrics exposed on http://{host}:{server.server_port}/metrics")
+    return server
\ No newline at end of file
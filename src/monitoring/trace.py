@@ -0,0 +1,248 @@
+"""
+Trace structurée d'un cycle de collecte.
+Chaque étape (collecteur, source, téléchargement, parsing, filtrage,
+dédoublonnage, écriture) est mesurée dans un span imbriqué ; la trace
+complète est ajoutée en une ligne JSON au journal des cycles.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("monitoring.trace")
+
+# Trace du cycle en cours (une seule à la fois, cf. CycleLock)
+_active_trace: Optional["CycleTrace"] = None
+
+
+class Span:
+    """
+    Étape mesurée : nom, durée, attributs (octets, nombre d'éléments...) et sous-étapes.
+    """
+
+    def __init__(self, name: str, attributes: Dict[str, Any] = None):
+        """
+        Initialise le span.
+
+        Args:
+            name: Nom de l'étape
+            attributes: Attributs initiaux
+        """
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.children: List["Span"] = []
+        self.start = time.monotonic()
+        self.duration: Optional[float] = None
+
+    def set(self, **attributes):
+        """Ajoute ou remplace des attributs."""
+        self.attributes.update(attributes)
+
+    def finish(self):
+        """Termine la mesure."""
+        self.duration = time.monotonic() - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise le span et ses sous-étapes.
+
+        Returns:
+            Dictionnaire prêt pour JSON
+        """
+        data = {"name": self.name, "duration": round(self.duration or 0.0, 4)}
+        data.update(self.attributes)
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class CycleTrace:
+    """
+    Arbre des spans d'un cycle.
+
+    Activée comme gestionnaire de contexte, la trace reçoit les spans ouverts
+    par span() depuis n'importe quel module ; chaque thread imbrique ses
+    propres spans sous la racine.
+    """
+
+    def __init__(self, name: str = "cycle"):
+        """
+        Initialise la trace.
+
+        Args:
+            name: Nom du span racine
+        """
+        self.root = Span(name, {"started_at": datetime.now().isoformat()})
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CycleTrace":
+        global _active_trace
+        _active_trace = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_trace
+        self.root.finish()
+        if _active_trace is self:
+            _active_trace = None
+        return False
+
+    def _stack(self) -> List[Span]:
+        """Pile des spans ouverts du thread courant."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = [self.root]
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """
+        Mesure une étape, imbriquée sous le span ouvert du thread courant.
+
+        Args:
+            name: Nom de l'étape
+            **attributes: Attributs initiaux
+
+        Yields:
+            Span en cours, pour y ajouter des attributs
+        """
+        stack = self._stack()
+        current = Span(name, attributes)
+        with self._lock:
+            stack[-1].children.append(current)
+
+        stack.append(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.set(error=str(e)[:200])
+            raise
+        finally:
+            current.finish()
+            stack.pop()
+
+    @contextmanager
+    def attach(self, parent: Span) -> Iterator[None]:
+        """
+        Imbrique les spans du thread courant sous un span ouvert par un autre thread.
+
+        Args:
+            parent: Span sous lequel rattacher le travail délégué
+        """
+        previous = getattr(self._local, "stack", None)
+        self._local.stack = [parent]
+        try:
+            yield
+        finally:
+            self._local.stack = previous if previous is not None else [self.root]
+
+    def current(self) -> Span:
+        """Span ouvert le plus récent du thread courant."""
+        return self._stack()[-1]
+
+    def find(self, name: str) -> List[Span]:
+        """
+        Retourne tous les spans d'un nom donné.
+
+        Args:
+            name: Nom de l'étape
+
+        Returns:
+            Spans correspondants, dans l'ordre de l'arbre
+        """
+        found = []
+        pending = [self.root]
+        while pending:
+            current = pending.pop(0)
+            if current.name == name:
+                found.append(current)
+            pending.extend(current.children)
+        return found
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sérialise la trace complète."""
+        return self.root.to_dict()
+
+    def write(self, path: str) -> bool:
+        """
+        Ajoute la trace en une ligne JSON au journal des cycles.
+
+        Args:
+            path: Fichier JSONL
+
+        Returns:
+            True si l'écriture a réussi
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(self.to_dict(), default=str) + "\n")
+            return True
+
+        except OSError as e:
+            logger.error(f"Could not write cycle trace {path}: {e}")
+            return False
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span]:
+    """
+    Mesure une étape dans la trace du cycle en cours.
+
+    Hors cycle (tests de connexion, appels directs), le span est mesuré
+    mais n'est rattaché à aucune trace.
+
+    Args:
+        name: Nom de l'étape
+        **attributes: Attributs initiaux
+
+    Yields:
+        Span en cours
+    """
+    trace = _active_trace
+    if trace is None:
+        current = Span(name, attributes)
+        try:
+            yield current
+        finally:
+            current.finish()
+        return
+
+    with trace.span(name, **attributes) as current:
+        yield current
+
+
+def current_span() -> Optional[Span]:
+    """
+    Retourne le span ouvert du thread courant dans la trace du cycle en cours.
+
+    Returns:
+        Span courant (None hors cycle)
+    """
+    trace = _active_trace
+    return trace.current() if trace is not None else None
+
+
+@contextmanager
+def attach(parent: Optional[Span]) -> Iterator[None]:
+    """
+    Rattache les spans ouverts par un thread de travail sous parent.
+
+    Args:
+        parent: Span retourné par current_span() dans le thread d'origine (None : sans effet)
+    """
+    trace = _active_trace
+    if trace is None or parent is None:
+        yield
+        return
+
+    with trace.attach(parent):
+        yield
\ No newline at end of file
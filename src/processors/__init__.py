@@ -0,0 +1,39 @@
+"""
+Module processors pour InfoWatchdog.
+Contient le traitement et la transformation des données collectées.
+
+Les traitements sont importés à la première utilisation (PEP 562) : importer
+le paquet ne charge ni pandas ni BeautifulSoup.
+"""
+
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_LAZY_EXPORTS = {
+    'ArticleEnricher': '.enrichment',
+    'ArticleRollups': '.rollups',
+    'ArticleSnapshot': '.snapshot',
+    'records_to_dataframe': '.snapshot',
+    'prepare_articles': '.transforms',
+}
+
+__all__ = [
+    'ArticleEnricher',
+    'ArticleRollups',
+    'ArticleSnapshot',
+    'records_to_dataframe',
+    'prepare_articles'
+]
+
+
+def __getattr__(name):
+    """Importe un traitement lors du premier accès."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -0,0 +1,562 @@
+"""
+Enrichissement des nouveaux articles par le texte intégral de leur page.
+
+Les résumés RSS et les textes Reddit sont tronqués à la collecte. Cette
+étape, optionnelle, télécharge la page de chaque article nouvellement
+stocké et en extrait le texte principal. Le texte extrait est conservé dans
+un cache disque adressé par l'empreinte de l'URL canonique, borné en âge et
+en taille : une même page n'est pas téléchargée deux fois, d'une exécution
+ou d'un collecteur à l'autre, tant que son entrée est conservée.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from bs4 import BeautifulSoup, UnicodeDammit
+
+from collectors.politeness import HostLimiter, host_of, parse_retry_after
+from monitoring import attach, current_span, span
+from utils.deadline import Deadline
+
+# Paramètres de suivi retirés des URL canoniques
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+
+# Hôtes et extensions dont la page n'a pas de texte à extraire
+SKIPPED_HOSTS = ("reddit.com", "redd.it", "youtube.com", "youtu.be", "imgur.com")
+SKIPPED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".pdf", ".zip")
+
+# Éléments jamais retenus dans le texte principal
+NOISE_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "svg")
+
+CHUNK_SIZE = 65536
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise une URL pour l'utiliser comme clé de cache.
+
+    Le schéma et l'hôte sont mis en minuscules, le port par défaut, le
+    fragment et les paramètres de suivi sont retirés et les paramètres
+    restants sont triés.
+
+    Args:
+        url: URL de l'article
+
+    Returns:
+        URL canonique
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith(TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def extract_main_text(html: str, max_chars: int = 20000) -> str:
+    """
+    Extrait le texte principal d'une page HTML.
+
+    Le contenu d'un élément <article> (ou <main>) est retenu s'il existe ;
+    sinon, le conteneur dont les paragraphes totalisent le plus de texte.
+
+    Args:
+        html: Document HTML
+        max_chars: Longueur maximale du texte retourné
+
+    Returns:
+        Paragraphes du texte principal séparés par une ligne vide (vide si aucun)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+
+    container = soup.find("article") or soup.find("main")
+    if container is None:
+        scores: Dict[int, Tuple[Any, int]] = {}
+        for paragraph in soup.find_all("p"):
+            parent = paragraph.parent
+            if parent is None:
+                continue
+            _, score = scores.get(id(parent), (parent, 0))
+            scores[id(parent)] = (parent, score + len(paragraph.get_text(strip=True)))
+        if not scores:
+            return ""
+        container = max(scores.values(), key=lambda item: item[1])[0]
+
+    paragraphs = [
+        " ".join(element.get_text(" ", strip=True).split())
+        for element in container.find_all(["p", "h2", "h3", "li", "blockquote"])
+    ]
+    text = "\n\n".join(paragraph for paragraph in paragraphs if len(paragraph) > 1)
+    if not text:
+        text = " ".join(container.get_text(" ", strip=True).split())
+    return text[:max_chars]
+
+
+class PageCache:
+    """
+    Cache disque du texte extrait des pages téléchargées.
+
+    Chaque entrée est un fichier JSON compressé (gzip) nommé d'après le
+    SHA-256 de l'URL canonique, réparti en sous-répertoires de deux
+    caractères. Seul le texte extrait est conservé, jamais le document
+    HTML. Les réponses définitives (2xx, 4xx) sont conservées ; les erreurs
+    transitoires ne le sont pas. Les entrées expirent après ttl secondes et
+    prune() ramène le cache sous max_bytes en retirant les plus anciennes.
+    """
+
+    def __init__(self, directory: str, ttl: float = 30 * 86400,
+                 max_bytes: int = 200 * 1024 * 1024, prune_interval: float = 3600):
+        """
+        Initialise le cache.
+
+        Args:
+            directory: Répertoire du cache
+            ttl: Durée de validité d'une entrée (secondes)
+            max_bytes: Taille maximale du cache sur disque (0 pour illimitée)
+            prune_interval: Délai minimal entre deux parcours du répertoire (secondes)
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self.logger = logging.getLogger("processors.enrichment")
+        self._last_prune: Optional[float] = None
+        self._prune_lock = threading.Lock()
+
+    def path_for(self, url: str) -> str:
+        """
+        Retourne le fichier d'une URL.
+
+        Args:
+            url: URL canonique
+
+        Returns:
+            Chemin du fichier de cache
+        """
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.json.gz")
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Lit une entrée du cache.
+
+        Args:
+            url: URL canonique
+
+        Returns:
+            Entrée (url, status, fetched, text) ou None si absente, expirée ou illisible
+        """
+        path = self.path_for(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                self._remove(path)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        # Les entrées d'un autre format (document HTML) sont ignorées
+        if entry.get("url") != url or "text" not in entry:
+            return None
+        return entry
+
+    def put(self, url: str, status: int, text: str = "") -> bool:
+        """
+        Enregistre le texte d'une page (écriture atomique).
+
+        Args:
+            url: URL canonique
+            status: Code HTTP de la réponse
+            text: Texte extrait (vide pour une réponse en erreur)
+
+        Returns:
+            True si l'entrée a été écrite
+        """
+        path = self.path_for(url)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+                json.dump({"url": url, "status": status, "fetched": time.time(), "text": text}, file)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            self.logger.error(f"Could not write cache entry {path}: {e}")
+            return False
+
+    def prune(self, force: bool = False) -> int:
+        """
+        Retire les entrées expirées puis, au-delà de max_bytes, les plus anciennes.
+
+        Le répertoire n'est parcouru qu'une fois par prune_interval.
+
+        Args:
+            force: Parcourt le répertoire même si le délai n'est pas écoulé
+
+        Returns:
+            Nombre d'entrées retirées
+        """
+        now = time.time()
+        with self._prune_lock:
+            if not force and self._last_prune is not None and now - self._last_prune < self.prune_interval:
+                return 0
+            self._last_prune = now
+
+        entries = []
+        removed = 0
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.ttl:
+                    removed += self._remove(path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if self.max_bytes and total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                removed += self._remove(path)
+                total -= size
+
+        if removed:
+            self.logger.info(f"Pruned {removed} page cache entries")
+        return removed
+
+    def _remove(self, path: str) -> int:
+        """Supprime une entrée ; retourne 1 si elle a été supprimée."""
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+class PageTooLargeError(Exception):
+    """Page dépassant max_bytes."""
+
+
+class ArticleEnricher:
+    """
+    Ajoute aux articles le texte intégral de leur page (champ full_text).
+
+    Les pages sont lues dans le cache ou téléchargées par un pool de
+    threads, en respectant la politesse par hôte (connexions simultanées,
+    espacement, Retry-After). Seuls les documents HTML sont analysés.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, cache_dir: str = "data/page_cache"):
+        """
+        Initialise l'enrichissement.
+
+        Args:
+            config: Configuration (max_workers, timeout, max_bytes, max_chars,
+                    collectors, user_agent, per_host, cache_ttl_days, cache_max_mb)
+            cache_dir: Répertoire du cache des pages (surchargé par config["cache_dir"])
+        """
+        config = config or {}
+        self.max_workers = config.get("max_workers", 4)
+        self.timeout = config.get("timeout", 15)
+        self.max_bytes = config.get("max_bytes", 2 * 1024 * 1024)
+        self.max_chars = config.get("max_chars", 20000)
+        self.collectors = config.get("collectors")  # None pour tous les collecteurs
+        self.user_agent = config.get("user_agent", "InfoWatchdog/1.0 (Environmental News Monitor)")
+        self.cache = PageCache(
+            config.get("cache_dir") or cache_dir,
+            ttl=config.get("cache_ttl_days", 30) * 86400,
+            max_bytes=int(config.get("cache_max_mb", 200) * 1024 * 1024)
+        )
+        self.host_limiter = HostLimiter(config.get("per_host", {}))
+        self.logger = logging.getLogger("processors.enrichment")
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._counts = {"enriched": 0, "cache_hits": 0, "downloads": 0, "failures": 0}
+        self._counts_lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1):
+        """Incrémente un compteur (appelé depuis les threads du pool)."""
+        with self._counts_lock:
+            self._counts[name] += amount
+
+    def wants(self, article: Dict[str, Any]) -> bool:
+        """
+        Indique si la page d'un article doit être enrichie.
+
+        Args:
+            article: Article à stocker
+
+        Returns:
+            True pour une URL HTTP(S) hors hôtes et extensions ignorés
+        """
+        if article.get("full_text"):
+            return False
+        if self.collectors is not None and article.get("collector") not in self.collectors:
+            return False
+        url = article.get("url") or ""
+        if not url.startswith(("http://", "https://")):
+            return False
+        host = host_of(url)
+        if any(host == skipped or host.endswith(f".{skipped}") for skipped in SKIPPED_HOSTS):
+            return False
+        return not urlsplit(url).path.lower().endswith(SKIPPED_EXTENSIONS)
+
+    def enrich(self, articles: List[Dict[str, Any]], deadline: Optional[Deadline] = None) -> int:
+        """
+        Ajoute le texte intégral aux articles (modifiés sur place).
+
+        Les articles dont la page n'a pu être obtenue avant l'échéance sont
+        conservés sans texte intégral.
+
+        Args:
+            articles: Nouveaux articles (déjà dédupliqués)
+            deadline: Échéance du cycle
+
+        Returns:
+            Nombre d'articles enrichis
+        """
+        # Une URL partagée par plusieurs articles n'est traitée qu'une fois
+        by_url: Dict[str, List[Dict[str, Any]]] = {}
+        for article in articles:
+            if self.wants(article):
+                by_url.setdefault(canonical_url(article["url"]), []).append(article)
+        if not by_url:
+            return 0
+
+        self.cache.prune()
+        enriched = 0
+        with span("enrich", items=len(by_url)) as enrich_span:
+            texts = {}
+            for url in by_url:
+                text = self._cached_text(url)
+                if text is not None:
+                    texts[url] = text
+            # Les pages absentes du cache sont téléchargées depuis l'URL d'origine
+            texts.update(self._dispatch(
+                [(url, by_url[url][0]["url"]) for url in by_url if url not in texts], deadline
+            ))
+
+            for url, text in texts.items():
+                if text:
+                    for article in by_url[url]:
+                        article["full_text"] = text
+                        enriched += 1
+            enrich_span.set(enriched=enriched)
+
+        self._count("enriched", enriched)
+        self.logger.info(f"Enriched {enriched}/{len(articles)} articles with their full text")
+        return enriched
+
+    def _cached_text(self, url: str) -> Optional[str]:
+        """
+        Retourne le texte d'une page présent dans le cache.
+
+        Args:
+            url: URL canonique
+
+        Returns:
+            Texte extrait (None si la page n'est pas dans le cache)
+        """
+        entry = self.cache.get(url)
+        if entry is None:
+            return None
+        self._count("cache_hits")
+        with span("page", host=host_of(url), cache="hit", status=entry.get("status")):
+            return entry["text"]
+
+    def _dispatch(self, pending: List[Tuple[str, str]], deadline: Optional[Deadline] = None) -> Dict[str, str]:
+        """
+        Répartit les téléchargements entre les threads du pool.
+
+        Une page part dès que son hôte est disponible (voir HostLimiter) ;
+        les pages d'un hôte qui patiente laissent passer celles des autres
+        hôtes. Les pages d'un hôte disponible seulement après l'échéance ne
+        sont pas téléchargées.
+
+        Args:
+            pending: Pages à télécharger (URL canonique, URL d'origine)
+            deadline: Échéance du cycle (plus aucune page lancée une fois atteinte)
+
+        Returns:
+            Texte extrait par URL canonique (pages obtenues uniquement)
+        """
+        results = {}
+        pending = list(pending)
+        parent = current_span()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich") as pool:
+            running = {}
+            while pending or running:
+                if pending and deadline and deadline.expired:
+                    self.logger.warning(f"Cycle deadline reached, {len(pending)} pages not fetched")
+                    pending = []
+
+                next_wait = None
+                for page in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+
+                    host = host_of(page[1])
+                    if self.host_limiter.try_acquire(host):
+                        pending.remove(page)
+                        running[pool.submit(self._fetch, page[0], page[1], host, deadline, parent)] = page[0]
+                        continue
+
+                    wait_time = self.host_limiter.wait_time(host)
+                    if deadline and math.isfinite(wait_time) and wait_time > deadline.remaining():
+                        pending.remove(page)
+                    elif math.isfinite(wait_time):
+                        next_wait = wait_time if next_wait is None else min(next_wait, wait_time)
+
+                if running:
+                    timeout = next_wait if pending and len(running) < self.max_workers else None
+                    done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url = running.pop(future)
+                        text = future.result()
+                        if text is not None:
+                            results[url] = text
+                elif pending:
+                    # Tous les hôtes restants patientent : attend le premier disponible
+                    delay = next_wait if next_wait is not None else 0.05
+                    remaining = deadline.remaining() if deadline else None
+                    time.sleep(delay if remaining is None else min(delay, remaining))
+
+        return results
+
+    def _fetch(self, url: str, source_url: str, host: str,
+               deadline: Optional[Deadline], parent) -> Optional[str]:
+        """
+        Télécharge une page dans un thread du pool, en extrait le texte et
+        l'enregistre dans le cache, puis libère son hôte.
+
+        Args:
+            url: URL canonique (clé du cache)
+            source_url: URL d'origine de l'article, téléchargée telle quelle
+            host: Hôte réservé par le répartiteur
+            deadline: Échéance du cycle
+            parent: Span parent (le worker s'exécute dans un autre thread)
+
+        Returns:
+            Texte extrait (None si la page n'a pas pu être obtenue)
+        """
+        with attach(parent), span("page", host=host, cache="miss") as page_span:
+            try:
+                timeout = deadline.timeout(self.timeout) if deadline else self.timeout
+                status, html = self._download(source_url, timeout, host)
+                self._count("downloads")
+            except (requests.RequestException, PageTooLargeError) as e:
+                self._count("failures")
+                page_span.set(error=str(e)[:200])
+                self.logger.warning(f"Could not fetch {source_url}: {e}")
+                return None
+            finally:
+                self.host_limiter.release(host)
+
+            page_span.set(status=status, bytes=len(html))
+            # Les erreurs serveur et les limitations sont réessayées au prochain cycle
+            if status >= 500 or status == 429:
+                return None
+
+            text = ""
+            if html:
+                try:
+                    text = extract_main_text(html, self.max_chars)
+                except Exception as e:
+                    # Erreur d'analyse : la page est retentée plutôt que mise en cache vide
+                    self._count("failures")
+                    page_span.set(error=str(e)[:200])
+                    self.logger.warning(f"Could not extract text from {source_url}: {e}")
+                    return None
+            self.cache.put(url, status, text)
+            return text
+
+    def _download(self, url: str, timeout: float, host: str) -> Tuple[int, str]:
+        """
+        Télécharge une page HTML par morceaux, dans la limite de max_bytes.
+
+        Args:
+            url: URL de la page
+            timeout: Durée maximale du téléchargement (secondes)
+            host: Hôte de la page
+
+        Returns:
+            Code HTTP et document (vide si la réponse n'est pas du HTML en succès)
+
+        Raises:
+            PageTooLargeError: Si la page dépasse max_bytes
+            requests.Timeout: Si le téléchargement dépasse timeout
+        """
+        started = time.monotonic()
+        headers = {"User-Agent": self.user_agent, "Accept": "text/html,application/xhtml+xml"}
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is None and response.status_code == 429:
+                    retry_after = 60.0
+                if retry_after is not None:
+                    self.host_limiter.throttle(host, retry_after)
+
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code >= 400 or "html" not in content_type.lower():
+                return response.status_code, ""
+
+            declared = response.headers.get("Content-Length", "")
+            if self.max_bytes and declared.isdigit() and int(declared) > self.max_bytes:
+                raise PageTooLargeError(f"Content-Length {declared} exceeds max_bytes ({self.max_bytes})")
+
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                received += len(chunk)
+                if self.max_bytes and received > self.max_bytes:
+                    raise PageTooLargeError(f"more than max_bytes ({self.max_bytes}) received")
+                if time.monotonic() - started > timeout:
+                    raise requests.Timeout(f"Download exceeded {timeout:.0f}s")
+                chunks.append(chunk)
+
+            # Sans charset déclaré, l'encodage est déduit du document (balise meta, BOM)
+            declared_encoding = response.encoding if "charset" in content_type.lower() else None
+            html = UnicodeDammit(b"".join(chunks), [declared_encoding] if declared_encoding else []).unicode_markup
+            return response.status_code, html or ""
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs de l'enrichissement.
+
+        Returns:
+            Articles enrichis, pages lues dans le cache, téléchargées et en échec
+        """
+        with self._counts_lock:
+            return dict(self._counts)
+
+    def close(self):
+        """Ferme la session HTTP."""
+        self.session.close()
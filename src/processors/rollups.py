@@ -0,0 +1,192 @@
+"""
+Agrégats pré-calculés pour les graphiques du dashboard.
+Les compteurs sont maintenus de manière incrémentale à chaque synchronisation
+du snapshot, afin que le rendu ne parcoure plus les articles bruts.
+"""
+
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+class ArticleRollups:
+    """
+    Tables d'agrégats journaliers des articles.
+
+    Toutes les tables sont indexées par jour de collecte, ce qui permet de
+    filtrer par période sans revenir aux lignes brutes :
+    - nombre d'articles par (jour, source, collecteur)
+    - nombre d'articles par (jour, heure), projeté en matrice jour de semaine × heure
+    - nombre d'articles et somme des scores par (jour, subreddit)
+    """
+
+    def __init__(self):
+        """Initialise des agrégats vides."""
+        self._daily: Counter = Counter()
+        self._hourly: Dict[date, np.ndarray] = {}
+        self._subreddits: Dict[Tuple[date, str], np.ndarray] = {}
+        self._score_max: Dict[Tuple[date, str], float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ArticleRollups":
+        """
+        Construit les agrégats à partir d'un DataFrame complet.
+
+        Args:
+            df: DataFrame du snapshot
+
+        Returns:
+            Agrégats correspondants
+        """
+        rollups = cls()
+        rollups.add(df)
+        return rollups
+
+    @property
+    def is_empty(self) -> bool:
+        """Indique si aucun article n'a été agrégé."""
+        return not self._daily
+
+    def add(self, df: pd.DataFrame, sign: int = 1):
+        """
+        Ajoute (ou retire avec sign=-1) des articles aux agrégats.
+
+        Args:
+            df: Articles à agréger (préparés par prepare_articles)
+            sign: 1 pour ajouter, -1 pour retirer des versions remplacées
+        """
+        dated = df[df['hour'] >= 0]
+        if dated.empty:
+            return
+
+        daily = dated.groupby(['day', 'source', 'collector'], observed=True).size()
+
+        # Histogramme (jour, heure) en un seul bincount
+        codes, days = pd.factorize(dated['day'])
+        hourly = np.bincount(
+            codes * 24 + dated['hour'].to_numpy(dtype=np.int64),
+            minlength=len(days) * 24
+        ).reshape(len(days), 24)
+
+        reddit = dated[dated['collector'] == 'reddit']
+        subreddits = reddit.groupby(['day', 'subreddit'], observed=True)['reddit_score'].agg(['size', 'sum', 'max'])
+
+        with self._lock:
+            for (day, source, collector), count in daily.items():
+                key = (day.date(), source, collector)
+                self._daily[key] += sign * int(count)
+                if self._daily[key] <= 0:
+                    del self._daily[key]
+
+            for day, counts in zip(days, hourly):
+                day_counts = self._hourly.setdefault(day.date(), np.zeros(24, dtype=np.int64))
+                day_counts += sign * counts
+                if not day_counts.any():
+                    del self._hourly[day.date()]
+
+            for (day, subreddit), row in subreddits.iterrows():
+                if not subreddit:
+                    continue
+                key = (day.date(), subreddit)
+                totals = self._subreddits.setdefault(key, np.zeros(2, dtype=np.float64))
+                totals += sign * np.array([row['size'], row['sum']], dtype=np.float64)
+                if totals[0] <= 0:
+                    del self._subreddits[key]
+                    self._score_max.pop(key, None)
+                elif sign > 0:
+                    # Maximum observé : non décrémenté lors des remplacements
+                    self._score_max[key] = max(self._score_max.get(key, 0), float(row['max']))
+
+    def daily_counts(self, after: Optional[date] = None) -> pd.DataFrame:
+        """
+        Retourne le nombre d'articles par jour, source et collecteur.
+
+        Args:
+            after: Ne garde que les jours strictement postérieurs (None pour tout)
+
+        Returns:
+            DataFrame (date, source, collector, articles)
+        """
+        with self._lock:
+            rows = [
+                (day, source, collector, count)
+                for (day, source, collector), count in self._daily.items()
+                if after is None or day > after
+            ]
+        return pd.DataFrame(rows, columns=['date', 'source', 'collector', 'articles'])
+
+    def count_since(self, cutoff: datetime, after: Optional[date] = None) -> int:
+        """
+        Compte les articles collectés depuis une date, à l'heure près.
+
+        Les tranches horaires sont retenues dès qu'elles se terminent après
+        cutoff : la tranche en cours au moment de cutoff est incluse.
+
+        Args:
+            cutoff: Début de la période (naïf, en UTC)
+            after: Ne garde que les jours strictement postérieurs (None pour tout)
+
+        Returns:
+            Nombre d'articles
+        """
+        first_hour = cutoff.replace(minute=0, second=0, microsecond=0)
+        total = 0
+        with self._lock:
+            for day, counts in self._hourly.items():
+                if after is not None and day <= after:
+                    continue
+                start = int((datetime.combine(day, datetime.min.time()) - first_hour) / timedelta(hours=1))
+                if start >= 0:
+                    total += int(counts.sum())
+                elif start > -24:
+                    total += int(counts[-start:].sum())
+        return total
+
+    def heatmap(self, after: Optional[date] = None) -> pd.DataFrame:
+        """
+        Retourne la matrice jour de semaine × heure.
+
+        Args:
+            after: Ne garde que les jours strictement postérieurs (None pour tout)
+
+        Returns:
+            DataFrame 7 × 24 indexé par nom de jour
+        """
+        matrix = np.zeros((7, 24), dtype=np.int64)
+        with self._lock:
+            for day, counts in self._hourly.items():
+                if after is None or day > after:
+                    matrix[day.weekday()] += counts
+        return pd.DataFrame(matrix, index=DAYS_OF_WEEK, columns=range(24))
+
+    def subreddit_stats(self, after: Optional[date] = None) -> pd.DataFrame:
+        """
+        Retourne le nombre d'articles et les scores par subreddit.
+
+        Args:
+            after: Ne garde que les jours strictement postérieurs (None pour tout)
+
+        Returns:
+            DataFrame (subreddit, articles, score_sum, score_max) trié par articles
+        """
+        totals: Dict[str, np.ndarray] = {}
+        score_max: Dict[str, float] = {}
+        with self._lock:
+            for (day, subreddit), values in self._subreddits.items():
+                if after is None or day > after:
+                    totals[subreddit] = totals.get(subreddit, 0) + values
+                    score_max[subreddit] = max(score_max.get(subreddit, 0), self._score_max.get((day, subreddit), 0))
+
+        rows = [
+            (subreddit, int(values[0]), float(values[1]), score_max.get(subreddit, 0))
+            for subreddit, values in totals.items()
+        ]
+        stats = pd.DataFrame(rows, columns=['subreddit', 'articles', 'score_sum', 'score_max'])
+        return stats.sort_values('articles', ascending=False, ignore_index=True)
@@ -0,0 +1,342 @@
+"""
+Snapshot incrémental des articles pour le dashboard.
+Conserve une copie locale des enregistrements et ne récupère que ceux
+créés ou modifiés depuis la dernière synchronisation. Le snapshot peut
+être persisté dans un fichier Feather compressé pour un démarrage instantané.
+"""
+
+import os
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .rollups import ArticleRollups
+from .transforms import prepare_articles
+
+# Champs d'article utilisés par le dashboard (projection côté stockage)
+SNAPSHOT_FIELDS = [
+    "title",
+    "url",
+    "source",
+    "collector",
+    "collected_date",
+    "reddit_score",
+    "reddit_comments",
+    "subreddit",
+]
+
+# Valeurs par défaut des champs absents d'un article
+COLUMN_DEFAULTS = {
+    "title": "",
+    "url": "",
+    "source": "Unknown",
+    "collector": "Unknown",
+    "reddit_score": 0,
+    "reddit_comments": 0,
+    "subreddit": "",
+}
+
+# Colonnes à faible cardinalité stockées en catégories
+CATEGORICAL_COLUMNS = ["source", "collector", "subreddit"]
+
+
+def utc_now() -> datetime:
+    """Retourne l'heure courante en UTC, naïve comme les colonnes de dates."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def empty_frame() -> pd.DataFrame:
+    """Retourne un DataFrame vide avec les colonnes du snapshot."""
+    return records_to_dataframe([])
+
+
+def records_to_dataframe(articles: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convertit des articles du stockage en DataFrame en une seule passe.
+
+    Args:
+        articles: Articles retournés par BaseStorage.get_recent_articles
+
+    Returns:
+        DataFrame normalisé (dates naïves en UTC) avec ses colonnes dérivées
+    """
+    df = pd.DataFrame.from_records(articles, columns=["id"] + SNAPSHOT_FIELDS)
+
+    df = df.fillna(COLUMN_DEFAULTS)
+    df["collected_date"] = pd.to_datetime(
+        df["collected_date"], errors="coerce", utc=True, format="ISO8601"
+    ).dt.tz_localize(None)
+
+    return prepare_articles(_with_categories(df))
+
+
+def _with_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convertit les colonnes à faible cardinalité en catégories.
+
+    Args:
+        df: DataFrame à convertir
+
+    Returns:
+        DataFrame avec les colonnes catégorielles
+    """
+    return df.astype({column: "category" for column in CATEGORICAL_COLUMNS})
+
+
+class ArticleSnapshot:
+    """
+    Copie locale des articles, synchronisée de manière incrémentale.
+
+    Les articles sont lus via l'API BaseStorage, limités à la fenêtre de
+    jours demandée et aux champs utilisés par le dashboard. Le premier
+    chargement récupère toute la fenêtre ; les suivants ne demandent que les
+    articles modifiés depuis le dernier filigrane (watermark) et les
+    fusionnent dans le DataFrame existant. Une resynchronisation complète
+    périodique prend en compte les suppressions.
+    """
+
+    def __init__(self, storage, days: Optional[int] = None,
+                 path: Optional[str] = None,
+                 full_resync_interval: timedelta = timedelta(hours=6),
+                 overlap: timedelta = timedelta(minutes=2)):
+        """
+        Initialise le snapshot.
+
+        Args:
+            storage: Système de stockage (BaseStorage)
+            days: Fenêtre de jours conservée (None pour tous les articles)
+            path: Fichier Feather de persistance (None pour rester en mémoire)
+            full_resync_interval: Délai entre deux resynchronisations complètes
+            overlap: Marge appliquée au filigrane pour absorber les décalages d'horloge
+        """
+        self.storage = storage
+        self.days = days
+        self.path = path
+        self.full_resync_interval = full_resync_interval
+        self.overlap = overlap
+        self.logger = logging.getLogger("processors.snapshot")
+
+        self.frame = empty_frame()
+        self.rollups = ArticleRollups()
+        self.watermark: Optional[datetime] = None
+        self.last_full_sync: Optional[datetime] = None
+        self.last_refresh: Optional[datetime] = None
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indique si le snapshot contient des données (disque ou synchronisation)."""
+        return self.watermark is not None
+
+    def is_stale(self, ttl: timedelta) -> bool:
+        """
+        Indique si le snapshot doit être rafraîchi.
+
+        Args:
+            ttl: Durée de validité d'une synchronisation
+
+        Returns:
+            True si la dernière synchronisation est plus ancienne que ttl
+        """
+        if self.last_refresh is None:
+            return True
+        return datetime.now(timezone.utc) - self.last_refresh >= ttl
+
+    def refresh(self) -> Optional[int]:
+        """
+        Synchronise le snapshot avec la source.
+
+        Si la lecture échoue, le DataFrame, le filigrane et le fichier
+        persisté sont conservés tels quels.
+
+        Returns:
+            Nombre d'enregistrements récupérés, None si la lecture a échoué
+        """
+        with self._lock:
+            sync_start = datetime.now(timezone.utc)
+            full_sync = (
+                self.watermark is None
+                or self.last_full_sync is None
+                or sync_start - self.last_full_sync >= self.full_resync_interval
+            )
+
+            since = None if full_sync else self.watermark - self.overlap
+            articles = self.storage.get_recent_articles(
+                days=self.days,
+                fields=SNAPSHOT_FIELDS,
+                modified_since=since
+            )
+            if articles is None:
+                self.logger.warning("Snapshot refresh failed, keeping the previous data")
+                return None
+
+            delta = records_to_dataframe(articles)
+
+            changed = full_sync or not delta.empty
+            if full_sync:
+                self.frame = delta
+                self.rollups = ArticleRollups.from_frame(delta)
+                self.last_full_sync = sync_start
+            else:
+                if not delta.empty:
+                    replaced = self.frame["id"].isin(delta["id"])
+                    self.rollups.add(self.frame[replaced], sign=-1)
+                    self.rollups.add(delta)
+                    self.frame = _with_categories(pd.concat([self.frame[~replaced], delta], ignore_index=True))
+                changed = self._prune_expired() or changed
+
+            if changed:
+                self.version += 1
+
+            self.watermark = sync_start
+            self.last_refresh = sync_start
+
+            if self.path and changed:
+                self.save()
+
+            return len(delta)
+
+    def _prune_expired(self) -> bool:
+        """
+        Retire les articles sortis de la fenêtre de jours.
+
+        Returns:
+            True si des articles ont été retirés
+        """
+        if self.days is None:
+            return False
+
+        cutoff = pd.Timestamp(utc_now().date() - timedelta(days=self.days))
+        expired = ~(self.frame["day"] > cutoff)
+        if not expired.any():
+            return False
+
+        self.rollups.add(self.frame[expired], sign=-1)
+        self.frame = self.frame[~expired].reset_index(drop=True)
+        return True
+
+    def load(self) -> bool:
+        """
+        Charge le snapshot persisté.
+
+        Le fichier est compressé (zstd) : il est lu et décompressé en mémoire,
+        sans memory-mapping.
+
+        Returns:
+            True si un snapshot a été chargé
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+
+        try:
+            from pyarrow import feather
+
+            table = feather.read_table(self.path)
+            metadata = {
+                key.decode(): value.decode()
+                for key, value in (table.schema.metadata or {}).items()
+            }
+
+            frame = prepare_articles(_with_categories(table.to_pandas()))
+            with self._lock:
+                self.frame = frame
+                self.rollups = ArticleRollups.from_frame(frame)
+                self.watermark = _parse_metadata_date(metadata.get("watermark"))
+                self.last_full_sync = _parse_metadata_date(metadata.get("last_full_sync"))
+                self.version += 1
+
+            self.logger.info(f"Loaded snapshot with {len(frame)} records from {self.path}")
+            return True
+
+        except ImportError:
+            self.logger.warning("pyarrow is not installed, snapshot persistence disabled")
+        except Exception as e:
+            self.logger.error(f"Error loading snapshot {self.path}: {str(e)}")
+
+        return False
+
+    def save(self) -> bool:
+        """
+        Persiste le snapshot dans un fichier Feather compressé (écriture atomique).
+
+        Returns:
+            True si le snapshot a été sauvegardé
+        """
+        if not self.path:
+            return False
+
+        try:
+            import pyarrow as pa
+            from pyarrow import feather
+
+            table = pa.Table.from_pandas(self.frame, preserve_index=False)
+            table = table.replace_schema_metadata({
+                "watermark": _format_metadata_date(self.watermark),
+                "last_full_sync": _format_metadata_date(self.last_full_sync),
+            })
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            tmp_path = f"{self.path}.tmp"
+            feather.write_feather(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, self.path)
+            return True
+
+        except ImportError:
+            self.logger.warning("pyarrow is not installed, snapshot persistence disabled")
+        except Exception as e:
+            self.logger.error(f"Error saving snapshot {self.path}: {str(e)}")
+
+        return False
+
+    def start_background_refresh(self, interval: timedelta):
+        """
+        Lance la synchronisation périodique dans un thread de fond.
+
+        Args:
+            interval: Délai entre deux synchronisations
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval,),
+            name="snapshot-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """Arrête le thread de synchronisation."""
+        self._stop_event.set()
+
+    def _refresh_loop(self, interval: timedelta):
+        """Boucle du thread de synchronisation."""
+        while not self._stop_event.is_set():
+            if self.is_stale(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    self.logger.error(f"Background snapshot refresh failed: {str(e)}")
+            self._stop_event.wait(interval.total_seconds())
+
+
+def _format_metadata_date(value: Optional[datetime]) -> str:
+    """Sérialise une date pour les métadonnées du fichier."""
+    return value.isoformat() if value else ""
+
+
+def _parse_metadata_date(value: Optional[str]) -> Optional[datetime]:
+    """Désérialise une date des métadonnées du fichier."""
+    return datetime.fromisoformat(value) if value else None
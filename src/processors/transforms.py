@@ -0,0 +1,93 @@
+"""
+Transformations vectorisées des articles pour le dashboard.
+Les colonnes dérivées sont calculées une seule fois par version des données,
+sans jamais modifier le DataFrame d'origine.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def prepare_articles(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ajoute les colonnes dérivées de la date de collecte.
+
+    Args:
+        df: Articles normalisés
+
+    Returns:
+        Nouveau DataFrame avec day (jour), hour et dayofweek (-1 si date absente)
+    """
+    collected = df["collected_date"].dt
+    return df.assign(
+        day=collected.normalize(),
+        hour=collected.hour.fillna(-1).astype("int8"),
+        dayofweek=collected.dayofweek.fillna(-1).astype("int8"),
+    )
+
+
+def sort_recent(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Trie les articles du plus récent au plus ancien (dates absentes en fin).
+
+    Args:
+        df: Articles préparés
+
+    Returns:
+        Nouveau DataFrame trié
+    """
+    return df.sort_values("collected_date", ascending=False, na_position="last", ignore_index=True)
+
+
+def count_recent(sorted_df: pd.DataFrame, cutoff: Optional[datetime] = None) -> int:
+    """
+    Compte les articles collectés après une date.
+
+    Args:
+        sorted_df: Articles triés par sort_recent
+        cutoff: Date limite exclue (None pour tous les articles datés)
+
+    Returns:
+        Nombre d'articles, qui forment le préfixe de sorted_df
+    """
+    dates = sorted_df["collected_date"]
+    if cutoff is None:
+        return int(dates.notna().sum())
+    return int((dates > cutoff).sum())
+
+
+def render_articles_markdown(page: pd.DataFrame) -> str:
+    """
+    Construit le Markdown d'une page d'articles en une passe vectorisée.
+
+    Args:
+        page: Tranche d'articles à afficher
+
+    Returns:
+        Bloc Markdown prêt à être rendu
+    """
+    if page.empty:
+        return ""
+
+    is_reddit = (page["collector"] == "reddit").to_numpy()
+    icons = pd.Series(np.where(is_reddit, "🔴", "🟠"), index=page.index, dtype=object)
+    titles = page["title"].astype(str).str.slice(0, 100)
+    dates = page["collected_date"].dt.strftime("%d/%m/%Y %H:%M").fillna("N/A")
+
+    blocks = (
+        "**" + icons + " [" + titles + "...](" + page["url"].astype(str) + ")**  \n"
+        + "📰 *" + page["source"].astype(str) + "* • 📅 " + dates
+    )
+
+    scores = page["reddit_score"].fillna(0).astype(int)
+    comments = page["reddit_comments"].fillna(0).astype(int)
+    captions = (
+        "  \n⬆️ " + scores.astype(str) + " points • 💬 " + comments.astype(str)
+        + " commentaires • r/" + page["subreddit"].astype(str)
+    )
+    blocks = blocks + captions.where(is_reddit & (scores > 0).to_numpy(), "")
+
+    return "\n\n---\n\n".join(blocks)
@@ -0,0 +1,145 @@
+"""
+Registre des collecteurs et des systèmes de stockage.
+
+Chaque type est associé à un chemin "module:Classe" et n'est importé que
+lorsqu'il est référencé par la configuration. Trois sources, par priorité :
+- le champ `class:` de la section de configuration ("paquet.module:Classe") ;
+- les types enregistrés (intégrés ou via `register`) ;
+- les points d'entrée des paquets installés (groupes `infowatchdog.collectors`
+  et `infowatchdog.storage`), consultés uniquement pour un nom inconnu.
+"""
+
+import importlib
+import logging
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger("registry")
+
+COLLECTORS_GROUP = "infowatchdog.collectors"
+STORAGE_GROUP = "infowatchdog.storage"
+
+
+def load_class(path: str) -> type:
+    """
+    Importe une classe désignée par son chemin.
+
+    Args:
+        path: "paquet.module:Classe" (ou "paquet.module.Classe")
+
+    Returns:
+        Classe importée
+
+    Raises:
+        ValueError: Si le chemin est mal formé
+        ImportError: Si le module ou la classe est introuvable
+    """
+    module_name, separator, class_name = path.partition(":")
+    if not separator:
+        module_name, _, class_name = path.rpartition(".")
+    if not module_name or not class_name:
+        raise ValueError(f"Invalid class path: {path!r} (expected 'module:Class')")
+
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, class_name)
+    except AttributeError:
+        raise ImportError(f"{module_name} has no attribute {class_name!r}") from None
+
+
+class Registry:
+    """
+    Correspondance nom -> classe, résolue paresseusement.
+    """
+
+    def __init__(self, kind: str, group: str, builtins: Optional[Dict[str, str]] = None):
+        """
+        Initialise le registre.
+
+        Args:
+            kind: Nature des composants ("collector", "storage"), pour les messages
+            group: Groupe de points d'entrée des plugins installés
+            builtins: Types intégrés (nom -> "module:Classe")
+        """
+        self.kind = kind
+        self.group = group
+        self._targets: Dict[str, Union[str, type]] = dict(builtins or {})
+        self._entry_points_loaded = False
+
+    def register(self, name: str, target: Union[str, type]):
+        """
+        Enregistre un type.
+
+        Args:
+            name: Nom utilisé dans la configuration
+            target: Classe ou chemin "module:Classe" (importé au premier usage)
+        """
+        self._targets[name] = target
+
+    def names(self) -> List[str]:
+        """
+        Retourne les types connus, plugins installés compris (sans les importer).
+
+        Returns:
+            Noms triés
+        """
+        self._load_entry_points()
+        return sorted(self._targets)
+
+    def load(self, name: str, class_path: Optional[str] = None) -> type:
+        """
+        Retourne la classe d'un type, en l'important si nécessaire.
+
+        Args:
+            name: Nom du type
+            class_path: Chemin explicite "module:Classe" (prioritaire)
+
+        Returns:
+            Classe du composant
+
+        Raises:
+            ValueError: Si le type est inconnu
+            ImportError: Si le module du type est introuvable
+        """
+        if class_path:
+            return load_class(class_path)
+
+        if name not in self._targets:
+            self._load_entry_points()
+        if name not in self._targets:
+            raise ValueError(f"Unsupported {self.kind} type: {name}")
+
+        target = self._targets[name]
+        if isinstance(target, str):
+            target = load_class(target)
+            self._targets[name] = target
+        return target
+
+    def _load_entry_points(self):
+        """Ajoute les plugins déclarés par les paquets installés (lecture des métadonnées seulement)."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        try:
+            from importlib.metadata import entry_points
+            try:
+                found = entry_points(group=self.group)
+            except TypeError:  # Python < 3.10
+                found = entry_points().get(self.group, [])
+        except Exception as e:
+            logger.warning(f"Could not read {self.group} entry points: {e}")
+            return
+
+        for entry_point in found:
+            # Les types intégrés et enregistrés restent prioritaires
+            self._targets.setdefault(entry_point.name, entry_point.value)
+
+
+COLLECTORS = Registry("collector", COLLECTORS_GROUP, {
+    "reddit": "collectors.reddit_collector:RedditCollector",
+    "rss": "collectors.rss_collector:RSSCollector",
+})
+
+STORAGE = Registry("storage", STORAGE_GROUP, {
+    "airtable": "storage.airtable_storage:AirtableStorage",
+})
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Module scheduling pour InfoWatchdog.
+Contient la planification des collectes par source.
+"""
+
+from .adaptive_scheduler import AdaptivePollingScheduler
+
+__all__ = [
+    'AdaptivePollingScheduler'
+]
\ No newline at end of file
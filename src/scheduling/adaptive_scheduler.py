@@ -0,0 +1,235 @@
+import heapq
+import random
+import statistics
+import time
+import logging
+from typing import List, Dict, Any, Iterable, Optional, Set
+
+from utils.dates import to_epoch
+from utils.state import load_state, save_state
+
+
+class AdaptivePollingScheduler:
+    """
+    Planificateur de collecte adaptatif par source.
+
+    Chaque source (flux RSS, subreddit...) a son propre intervalle de
+    collecte, ajusté à partir de son rythme de publication observé :
+    nombre de nouveaux articles depuis la dernière collecte et écarts entre
+    les dates de publication. Les sources actives sont interrogées souvent,
+    les sources dormantes de plus en plus rarement, dans les bornes
+    [min_interval, max_interval].
+
+    Les échéances sont gérées dans un tas : trouver les sources à collecter
+    coûte O(k log n) pour k sources dues parmi n.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, state_path: Optional[str] = None):
+        """
+        Initialise le planificateur.
+
+        Args:
+            config: Configuration (min_interval, max_interval, default_interval,
+                    target_items, smoothing, backoff, jitter)
+            state_path: Fichier JSON de persistance de l'état des sources
+        """
+        config = config or {}
+        self.min_interval = config.get("min_interval", 300)
+        self.max_interval = config.get("max_interval", 86400)
+        self.default_interval = config.get("default_interval", 3600)
+        self.target_items = config.get("target_items", 2)  # Nouveaux articles visés par collecte
+        self.smoothing = config.get("smoothing", 0.3)  # Poids des nouvelles observations
+        self.backoff = config.get("backoff", 1.5)  # Ralentissement si aucune activité
+        self.jitter = config.get("jitter", 0.1)  # Étale les échéances des sources
+
+        self.state_path = state_path
+        self.logger = logging.getLogger("scheduling.adaptive")
+
+        self._sources: Dict[str, Dict[str, Any]] = load_state(state_path, {}) or {}
+        self._heap = [(state["next_poll"], key) for key, state in self._sources.items()]
+        heapq.heapify(self._heap)
+        # Sources retournées par due() dont le résultat n'est pas encore enregistré
+        self._in_flight: Set[str] = set()
+
+    def sync_sources(self, keys: Iterable[str]):
+        """
+        Aligne le planificateur sur les sources configurées.
+
+        Les nouvelles sources sont dues immédiatement, celles qui ont disparu
+        de la configuration sont oubliées.
+
+        Args:
+            keys: Identifiants des sources configurées
+        """
+        keys = set(keys)
+        now = time.time()
+
+        for key in list(self._sources):
+            if key not in keys:
+                del self._sources[key]
+
+        for key in keys:
+            if key not in self._sources:
+                self._sources[key] = {
+                    "interval": self.default_interval,
+                    "next_poll": now,
+                    "last_poll": None,
+                    "rate": None,
+                    "last_published": None
+                }
+                heapq.heappush(self._heap, (now, key))
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """
+        Retourne les sources dont l'échéance est atteinte.
+
+        Args:
+            now: Horodatage de référence (par défaut maintenant)
+
+        Returns:
+            Identifiants des sources à collecter
+        """
+        now = now or time.time()
+        due_sources = []
+
+        while self._heap and self._heap[0][0] <= now:
+            next_poll, key = heapq.heappop(self._heap)
+            state = self._sources.get(key)
+            # Entrée obsolète : source supprimée ou replanifiée depuis
+            if state is None or state["next_poll"] != next_poll:
+                continue
+            due_sources.append(key)
+
+        self._in_flight.update(due_sources)
+        return due_sources
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Retourne le délai avant la prochaine échéance.
+
+        Args:
+            now: Horodatage de référence (par défaut maintenant)
+
+        Returns:
+            Délai en secondes (None si aucune source)
+        """
+        now = now or time.time()
+        while self._heap:
+            next_poll, key = self._heap[0]
+            state = self._sources.get(key)
+            if state is not None and state["next_poll"] == next_poll:
+                return max(next_poll - now, 0)
+            heapq.heappop(self._heap)
+        return None
+
+    def record(self, key: str, published_dates: List[Any], now: Optional[float] = None):
+        """
+        Enregistre le résultat d'une collecte et replanifie la source.
+
+        Args:
+            key: Identifiant de la source
+            published_dates: Dates de publication des articles retournés (horodatages Unix)
+            now: Horodatage de la collecte (par défaut maintenant)
+        """
+        state = self._sources.get(key)
+        if state is None:
+            return
+
+        now = now or time.time()
+        published = sorted(ts for ts in map(to_epoch, published_dates) if ts is not None)
+
+        samples = []
+
+        # Nouveaux articles depuis la dernière collecte
+        if state["last_poll"] is not None and state["last_published"] is not None:
+            new_items = sum(1 for ts in published if ts > state["last_published"])
+            elapsed = max(now - state["last_poll"], 1)
+            samples.append(new_items / elapsed)
+
+        # Écart médian entre publications successives
+        gaps = [later - earlier for earlier, later in zip(published, published[1:]) if later > earlier]
+        if gaps:
+            samples.append(1 / statistics.median(gaps))
+
+        if samples:
+            sample = sum(samples) / len(samples)
+            previous = state["rate"]
+            state["rate"] = sample if previous is None else (
+                self.smoothing * sample + (1 - self.smoothing) * previous
+            )
+
+        if state["rate"]:
+            interval = self.target_items / state["rate"]
+        else:
+            interval = state["interval"] * self.backoff
+
+        if published:
+            state["last_published"] = max(published[-1], state["last_published"] or 0)
+
+        self._reschedule(key, interval, now)
+
+    def requeue(self, key: str, now: Optional[float] = None):
+        """
+        Remet une source due sans modifier son intervalle (collecte interrompue).
+
+        Args:
+            key: Identifiant de la source
+            now: Horodatage de référence (par défaut maintenant)
+        """
+        state = self._sources.get(key)
+        if state is None:
+            return
+
+        self._in_flight.discard(key)
+        state["next_poll"] = now or time.time()
+        heapq.heappush(self._heap, (state["next_poll"], key))
+
+    def requeue_in_flight(self, now: Optional[float] = None) -> int:
+        """
+        Remet les sources retournées par due() dont aucun résultat n'a été
+        enregistré (cycle ignoré ou échoué avant record/requeue).
+
+        Args:
+            now: Horodatage de référence (par défaut maintenant)
+
+        Returns:
+            Nombre de sources remises
+        """
+        keys = list(self._in_flight)
+        for key in keys:
+            self.requeue(key, now)
+        self._in_flight.clear()
+        return len(keys)
+
+    def _reschedule(self, key: str, interval: float, now: float):
+        """Borne l'intervalle et programme la prochaine collecte."""
+        state = self._sources[key]
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        self._in_flight.discard(key)
+
+        state["interval"] = interval
+        state["last_poll"] = now
+        state["next_poll"] = now + interval * (1 + random.uniform(-self.jitter, self.jitter))
+        heapq.heappush(self._heap, (state["next_poll"], key))
+
+    def save(self) -> bool:
+        """
+        Persiste l'état des sources.
+
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        return save_state(self.state_path, self._sources)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du planificateur.
+
+        Returns:
+            Dictionnaire avec l'intervalle et l'échéance de chaque source
+        """
+        return {
+            "sources": len(self._sources),
+            "next_due_in": self.next_due_in(),
+            "intervals": {key: round(state["interval"]) for key, state in self._sources.items()}
+        }
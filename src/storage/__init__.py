@@ -1,12 +1,38 @@
 """
 Module storage pour InfoWatchdog.
 Contient les systèmes de stockage pour les données collectées.
+
+Les systèmes de stockage sont importés à la première utilisation (PEP 562) :
+importer le paquet ne charge pas le client Airtable.
 """
 
+import importlib
+
 from .base_storage import BaseStorage
-from .airtable_storage import AirtableStorage
+from .factory import create_storage
+from .stats import StorageStats
+
+# Nom exporté -> sous-module qui le définit
+_LAZY_EXPORTS = {
+    'AirtableStorage': '.airtable_storage',
+}
 
 __all__ = [
     'BaseStorage',
-    'AirtableStorage'
-]
\ No newline at end of file
+    'AirtableStorage',
+    'create_storage',
+    'StorageStats'
+]
+
+
+def __getattr__(name):
+    """Importe un système de stockage lors du premier accès."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,7 +1,43 @@
+import os
+import time
+import requests
+from collections import Counter
 from airtable import Airtable
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Callable
 from .base_storage import BaseStorage
+from monitoring import span
+from monitoring.metrics import ARTICLES_STORED, STORAGE_LATENCY, STORAGE_RATE_LIMITED, STORAGE_REQUESTS
+from utils.dates import isoformat_utc
+from utils.deadline import Deadline
+
+# Correspondance clés d'article -> champs Airtable
+AIRTABLE_FIELDS = {
+    "title": "Title",
+    "url": "URL",
+    "source": "Source",
+    "content": "Content",
+    "author": "Author",
+    "published_date": "Published_Date",
+    "collected_date": "Collected_Date",
+    "collector": "Collector",
+    "hash": "Hash",
+    "tags": "Tags",
+    "reddit_score": "Reddit_Score",
+    "reddit_comments": "Reddit_Comments",
+    "subreddit": "Subreddit",
+    "reddit_id": "Reddit_ID",
+    "full_text": "Full_Text",
+}
+
+# Longueur maximale d'un champ texte long Airtable
+MAX_LONG_TEXT = 100000
+
+# Nombre maximal d'enregistrements par requête d'écriture de l'API Airtable
+MAX_RECORDS_PER_REQUEST = 10
+
+# Hash recherchés par requête lors de la résolution des identifiants d'enregistrement
+LOOKUP_CHUNK_SIZE = 50
 
 class AirtableStorage(BaseStorage):
     """
@@ -13,30 +49,43 @@ class AirtableStorage(BaseStorage):
         Initialise le stockage Airtable.
         
         Args:
-            config: Configuration avec api_key, base_id, table_name
+            config: Configuration (api_key, base_id et table_name, par défaut
+                    AIRTABLE_API_KEY, AIRTABLE_BASE_ID et AIRTABLE_TABLE_NAME)
         """
         super().__init__("airtable", config)
         
-        self.api_key = config.get("api_key")
-        self.base_id = config.get("base_id")
-        self.table_name = config.get("table_name", "Environmental_News")
+        # Identifiants : configuration, sinon variables d'environnement
+        self.api_key = config.get("api_key") or os.getenv("AIRTABLE_API_KEY")
+        self.base_id = config.get("base_id") or os.getenv("AIRTABLE_BASE_ID")
+        self.table_name = config.get("table_name") or os.getenv("AIRTABLE_TABLE_NAME", "Environmental_News")
+        self.timeout = config.get("timeout", 30)  # Timeout par requête (secondes)
         
         if not self.api_key or not self.base_id:
             raise ValueError("Airtable API key and base ID are required")
         
-        self.airtable = Airtable(self.base_id, self.table_name, api_key=self.api_key)
+        self.airtable = Airtable(self.base_id, self.table_name, api_key=self.api_key, timeout=self.timeout)
         
         # Cache pour éviter les doublons
         self._hash_cache = set()
+        # Index local hash -> identifiant d'enregistrement (mises à jour sans recherche)
+        self._record_ids: Dict[str, str] = {}
+        # Empreinte des derniers champs écrits par identifiant d'enregistrement (upsert)
+        self._record_fields: Dict[str, int] = {}
         self._last_cache_update = None
+        self._last_cache_attempt = None
         self._cache_ttl = timedelta(hours=1)  # Cache valide 1 heure
+        self._cache_retry_delay = timedelta(minutes=5)  # Délai avant de retenter un rechargement échoué
     
-    def store(self, articles: List[Dict[str, Any]]) -> bool:
+    def store(self, articles: List[Dict[str, Any]], deadline: Optional[Deadline] = None) -> bool:
         """
         Stocke les articles dans Airtable.
         
+        Chaque requête est bornée par le temps restant ; les articles non
+        insérés (échéance ou erreur) sont mis en attente pour le cycle suivant.
+        
         Args:
             articles: Liste d'articles à stocker
+            deadline: Échéance du cycle (None pour illimitée)
             
         Returns:
             True si le stockage a réussi, False sinon
@@ -44,9 +93,11 @@ class AirtableStorage(BaseStorage):
         if not articles:
             return True
         
+        stored = []
         try:
             # Filtre les nouveaux articles (réactivé)
-            new_articles = self.filter_new_articles(articles)
+            self._bound_timeout(deadline)
+            new_articles = self.filter_new_articles(articles, deadline)
             
             if not new_articles:
                 self.logger.info("No new articles to store")
@@ -54,27 +105,91 @@ class AirtableStorage(BaseStorage):
             
             self.logger.info(f"Filtered {len(articles)} articles to {len(new_articles)} new articles")
             
+            # Texte intégral des seuls articles nouveaux
+            self.enrich_new_articles(new_articles, deadline)
+            
             # Stocke article par article pour éviter les problèmes de batch
             success_count = 0
+            failed = []
             
-            for article in new_articles:
-                try:
-                    record = self._convert_to_airtable_format(article)
-                    result = self.airtable.insert(record)
-                    if result:
-                        success_count += 1
-                        self._hash_cache.add(article.get("hash", ""))
-                except Exception as e:
-                    self.logger.error(f"Failed to insert article '{article.get('title', 'Unknown')}': {str(e)}")
-                    continue
+            with span("storage_batch", items=len(new_articles)) as batch_span:
+                for index, article in enumerate(new_articles):
+                    if deadline and deadline.expired:
+                        self.logger.warning("Cycle deadline reached, spooling remaining articles")
+                        failed.extend(new_articles[index:])
+                        break
+                    
+                    try:
+                        self._bound_timeout(deadline)
+                        record = self._convert_to_airtable_format(article)
+                        result = self._call(self.airtable.insert, record)
+                        if result:
+                            success_count += 1
+                            stored.append(article)
+                            self._hash_cache.add(article.get("hash", ""))
+                            if article.get("hash") and result.get("id"):
+                                self._record_ids[article["hash"]] = result["id"]
+                            if result.get("id"):
+                                self._record_fields[result["id"]] = self._fingerprint(record)
+                        else:
+                            failed.append(article)
+                    except Exception as e:
+                        self.logger.error(f"Failed to insert article '{article.get('title', 'Unknown')}': {str(e)}")
+                        failed.append(article)
+                        continue
+                batch_span.set(stored=success_count, spooled=self.spool(failed))
+            
+            if stored:
+                self.stats.record(stored)
+                self.stats.save()
+                for source, count in Counter(article.get("source", "Unknown") for article in stored).items():
+                    ARTICLES_STORED.labels(source).inc(count)
             
             self.logger.info(f"Successfully stored {success_count}/{len(new_articles)} articles")
             return success_count > 0  # Succès si au moins un article est stocké
             
         except Exception as e:
             self.logger.error(f"Error storing articles in Airtable: {str(e)}")
+            # Seuls les articles confirmés sont écartés ; les doublons sont filtrés au rejeu
+            stored_ids = {id(article) for article in stored}
+            self.spool([article for article in articles if id(article) not in stored_ids])
             return False
     
+    def _call(self, operation: Callable, *args, **kwargs):
+        """
+        Exécute une requête Airtable et enregistre son résultat dans l'état de connexion.
+        
+        Args:
+            operation: Méthode du client Airtable
+            *args, **kwargs: Arguments de la méthode
+            
+        Returns:
+            Résultat de la requête (les exceptions sont propagées)
+        """
+        operation_name = operation.__name__
+        start = time.monotonic()
+        try:
+            result = operation(*args, **kwargs)
+        except Exception as e:
+            latency = time.monotonic() - start
+            STORAGE_LATENCY.labels(self.name, operation_name).observe(latency)
+            STORAGE_REQUESTS.labels(self.name, operation_name, "error").inc()
+            response = getattr(e, "response", None) if isinstance(e, requests.RequestException) else None
+            if response is not None and response.status_code == 429:
+                STORAGE_RATE_LIMITED.labels(self.name).inc()
+            self.health.record_failure(str(e), latency)
+            raise
+        
+        latency = time.monotonic() - start
+        STORAGE_LATENCY.labels(self.name, operation_name).observe(latency)
+        STORAGE_REQUESTS.labels(self.name, operation_name, "ok").inc()
+        self.health.record_success(latency)
+        return result
+    
+    def _bound_timeout(self, deadline: Optional[Deadline]):
+        """Borne le timeout des prochaines requêtes par le temps restant du cycle."""
+        self.airtable.timeout = deadline.timeout(self.timeout) if deadline else self.timeout
+    
     def _convert_to_airtable_format(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convertit un article au format Airtable avec tous les champs nécessaires.
@@ -103,6 +218,9 @@ class AirtableStorage(BaseStorage):
         if article.get("author"):
             airtable_record["Author"] = str(article["author"])
         
+        if article.get("full_text"):
+            airtable_record["Full_Text"] = str(article["full_text"])[:MAX_LONG_TEXT]
+        
         if article.get("collector"):
             airtable_record["Collector"] = str(article["collector"])
         
@@ -114,61 +232,56 @@ class AirtableStorage(BaseStorage):
         if article.get("tags"):
             airtable_record["Tags"] = ", ".join(article["tags"])
         
-        # Dates avec format adapté pour Airtable
-        if article.get("published_date"):
-            try:
-                formatted_date = self._format_date_for_airtable(article["published_date"])
+        # Dates complètes (UTC) pour conserver l'heure
+        for key in ("published_date", "collected_date"):
+            if article.get(key):
+                formatted_date = self._format_date_for_airtable(article[key])
                 if formatted_date:
-                    airtable_record["Published_Date"] = formatted_date
-            except Exception as e:
-                self.logger.warning(f"Failed to format published_date: {e}")
+                    airtable_record[AIRTABLE_FIELDS[key]] = formatted_date
+                else:
+                    self.logger.warning(f"Could not format {key}: {article[key]!r}")
         
-        if article.get("collected_date"):
-            try:
-                formatted_date = self._format_date_for_airtable(article["collected_date"])
-                if formatted_date:
-                    airtable_record["Collected_Date"] = formatted_date
-            except Exception as e:
-                self.logger.warning(f"Failed to format collected_date: {e}")
+        # Métadonnées Reddit (présentes aussi dans les mises à jour partielles)
+        if article.get("reddit_score") is not None:
+            airtable_record["Reddit_Score"] = int(article["reddit_score"])
         
-        # Métadonnées Reddit
-        if article.get("collector") == "reddit":
-            if article.get("reddit_score") is not None:
-                airtable_record["Reddit_Score"] = int(article["reddit_score"])
-            
-            if article.get("reddit_comments") is not None:
-                airtable_record["Reddit_Comments"] = int(article["reddit_comments"])
-            
-            if article.get("subreddit"):
-                airtable_record["Subreddit"] = str(article["subreddit"])
+        if article.get("reddit_comments") is not None:
+            airtable_record["Reddit_Comments"] = int(article["reddit_comments"])
+        
+        if article.get("subreddit"):
+            airtable_record["Subreddit"] = str(article["subreddit"])
+        
+        if article.get("reddit_id"):
+            airtable_record["Reddit_ID"] = str(article["reddit_id"])
         
         return airtable_record
     
+    def _convert_from_airtable_format(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convertit un enregistrement Airtable en article.
+        
+        Args:
+            record: Enregistrement Airtable ({"id": ..., "fields": {...}})
+            
+        Returns:
+            Article avec les clés standard et l'identifiant de l'enregistrement
+        """
+        fields = record.get("fields", {})
+        article = {key: fields[name] for key, name in AIRTABLE_FIELDS.items() if name in fields}
+        article["id"] = record.get("id")
+        return article
+    
     def _format_date_for_airtable(self, date_obj) -> str:
         """
         Formate une date pour Airtable (format compatible).
         
         Args:
-            date_obj: Objet datetime ou string
+            date_obj: Horodatage Unix, datetime ou chaîne
             
         Returns:
-            Date formatée pour Airtable (YYYY-MM-DD ou YYYY-MM-DDTHH:MM:SS.000Z)
+            Date formatée pour Airtable (YYYY-MM-DDTHH:MM:SS.000Z, vide si invalide)
         """
-        if not date_obj:
-            return ""
-        
-        if isinstance(date_obj, str):
-            try:
-                from dateutil import parser
-                parsed_date = parser.parse(date_obj)
-                return parsed_date.strftime("%Y-%m-%d")
-            except:
-                return date_obj
-        
-        if isinstance(date_obj, datetime):
-            return date_obj.strftime("%Y-%m-%d")
-        
-        return ""
+        return isoformat_utc(date_obj) or ""
     
     def check_duplicate(self, article_hash: str) -> bool:
         """
@@ -183,20 +296,24 @@ class AirtableStorage(BaseStorage):
         if not article_hash:
             return False
         
-        # Utilise le cache si il est récent
-        if self._is_cache_valid() and article_hash in self._hash_cache:
+        # Recharge le cache des hash récents en une seule requête s'il a expiré
+        if self._cache_refresh_due():
+            self._refresh_hash_cache()
+        
+        if article_hash in self._hash_cache:
             return True
         
         try:
             # Recherche par hash dans Airtable
             formula = f"{{Hash}} = '{article_hash}'"
-            records = self.airtable.search("Hash", article_hash)
+            records = self._call(self.airtable.search, "Hash", article_hash)
             
             exists = len(records) > 0
             
             # Met à jour le cache
             if exists:
                 self._hash_cache.add(article_hash)
+                self._record_ids[article_hash] = records[0]["id"]
             
             return exists
             
@@ -216,17 +333,38 @@ class AirtableStorage(BaseStorage):
         
         return datetime.now() - self._last_cache_update < self._cache_ttl
     
+    def _cache_refresh_due(self) -> bool:
+        """
+        Vérifie si le cache doit être rechargé.
+        
+        Après un échec, le rechargement n'est retenté qu'une fois le délai
+        _cache_retry_delay écoulé, pour ne pas relancer une lecture complète
+        à chaque article pendant une panne d'Airtable.
+        
+        Returns:
+            True si un rechargement doit être tenté
+        """
+        if self._is_cache_valid():
+            return False
+        if not self._last_cache_attempt:
+            return True
+        return datetime.now() - self._last_cache_attempt >= self._cache_retry_delay
+    
     def _refresh_hash_cache(self):
         """
         Actualise le cache des hash depuis Airtable.
         """
+        self._last_cache_attempt = datetime.now()
         try:
             # Récupère tous les hash récents
             formula = f"IS_AFTER({{Collected_Date}}, DATEADD(TODAY(), -7, 'days'))"
-            records = self.airtable.get_all(formula=formula, fields=["Hash"])
+            records = self._call(self.airtable.get_all, formula=formula, fields=["Hash"])
             
             self._hash_cache = {record["fields"].get("Hash") for record in records 
                               if record["fields"].get("Hash")}
+            self._record_ids.update(
+                (record["fields"]["Hash"], record["id"]) for record in records if record["fields"].get("Hash")
+            )
             self._last_cache_update = datetime.now()
             
             self.logger.info(f"Refreshed hash cache with {len(self._hash_cache)} entries")
@@ -234,37 +372,295 @@ class AirtableStorage(BaseStorage):
         except Exception as e:
             self.logger.error(f"Error refreshing hash cache: {str(e)}")
     
-    def get_recent_articles(self, days: int = 7) -> List[Dict[str, Any]]:
+    def update_many(self, updates: List[Dict[str, Any]], key: str = "hash",
+                    deadline: Optional[Deadline] = None) -> List[Any]:
+        """
+        Met à jour des articles par lots de 10 enregistrements.
+        
+        Les identifiants d'enregistrement sont lus dans l'index local
+        hash -> id ; les hash absents de l'index sont résolus en quelques
+        requêtes groupées, jamais par une recherche par article.
+        
+        Args:
+            updates: Champs à modifier, avec la clé d'identification
+            key: Clé d'article identifiant l'enregistrement
+            deadline: Échéance du cycle (les lots restants sont abandonnés)
+            
+        Returns:
+            Valeurs de la clé des articles mis à jour (lots confirmés par Airtable)
+        """
+        if not updates:
+            return []
+        if key not in AIRTABLE_FIELDS:
+            raise ValueError(f"Unsupported update key: {key}")
+        
+        with span("storage_update", items=len(updates)) as update_span:
+            record_ids = self._resolve_record_ids([update.get(key) for update in updates], key, deadline)
+            
+            records, values = [], []
+            for update in updates:
+                record_id = record_ids.get(update.get(key))
+                if not record_id:
+                    continue
+                fields = self._convert_to_airtable_format({k: v for k, v in update.items() if k != key})
+                if fields:
+                    records.append({"id": record_id, "fields": fields})
+                    values.append(update[key])
+            
+            updated = []
+            for index, batch in enumerate(self._write_batches(self.airtable.batch_update, records, deadline)):
+                if batch is not None:
+                    updated.extend(values[index * MAX_RECORDS_PER_REQUEST:(index + 1) * MAX_RECORDS_PER_REQUEST])
+                    # Mise à jour partielle : l'empreinte des champs n'est plus connue
+                    for record in batch:
+                        self._record_fields.pop(record.get("id"), None)
+            update_span.set(updated=len(updated), unknown=len(updates) - len(records))
+        
+        self.logger.info(f"Updated {len(updated)}/{len(updates)} records")
+        return updated
+    
+    def upsert_many(self, articles: List[Dict[str, Any]], key: str = "hash",
+                    deadline: Optional[Deadline] = None) -> Dict[str, int]:
+        """
+        Insère ou met à jour des articles par lots de 10 enregistrements.
+        
+        Les enregistrements existants sont identifiés par l'index local
+        hash -> id (complété par des recherches groupées) ; seuls ceux dont
+        les champs diffèrent des derniers écrits par ce processus sont
+        réécrits par batch_update. Les autres articles sont insérés par
+        batch_insert. Les articles non écrits (lot en échec ou échéance)
+        sont mis en attente.
+        
+        Args:
+            articles: Articles complets à écrire
+            key: Clé d'article identifiant l'enregistrement
+            deadline: Échéance du cycle (None pour illimitée)
+            
+        Returns:
+            Nombre d'articles insérés ("inserted"), mis à jour ("updated"),
+            inchangés ("unchanged"), non écrits ("failed") et mis en attente
+            parmi ces derniers ("spooled")
+        """
+        if key not in AIRTABLE_FIELDS:
+            raise ValueError(f"Unsupported upsert key: {key}")
+        
+        # Une seule écriture par clé : la dernière version l'emporte
+        by_key = {article[key]: article for article in articles if article.get(key)}
+        if not by_key:
+            return {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0, "spooled": 0}
+        
+        with span("storage_upsert", items=len(by_key)) as upsert_span:
+            if key == "hash" and self._cache_refresh_due():
+                self._bound_timeout(deadline)
+                self._refresh_hash_cache()
+            record_ids = self._resolve_record_ids(list(by_key), key, deadline)
+            
+            existing = [article for value, article in by_key.items() if value in record_ids]
+            new = [article for value, article in by_key.items() if value not in record_ids]
+            self.enrich_new_articles(new, deadline)
+            
+            # La date de collecte d'un article existant reste celle de sa première écriture
+            changed, updates = [], []
+            for article in existing:
+                record_id = record_ids[article[key]]
+                fields = self._convert_to_airtable_format(article)
+                fields.pop(AIRTABLE_FIELDS["collected_date"], None)
+                if self._record_fields.get(record_id) == self._fingerprint(fields):
+                    continue
+                changed.append(article)
+                updates.append({"id": record_id, "fields": fields})
+            update_batches = self._write_batches(self.airtable.batch_update, updates, deadline)
+            updated = 0
+            for index, batch in enumerate(update_batches):
+                if batch is None:
+                    continue
+                for update in updates[index * MAX_RECORDS_PER_REQUEST:(index + 1) * MAX_RECORDS_PER_REQUEST]:
+                    self._record_fields[update["id"]] = self._fingerprint(update["fields"])
+                    updated += 1
+            
+            records = [self._convert_to_airtable_format(article) for article in new]
+            insert_batches = self._write_batches(self.airtable.batch_insert, records, deadline)
+            inserted = []
+            for index, batch in enumerate(insert_batches):
+                chunk = slice(index * MAX_RECORDS_PER_REQUEST, (index + 1) * MAX_RECORDS_PER_REQUEST)
+                for article, fields, record in zip(new[chunk], records[chunk], batch or []):
+                    inserted.append(article)
+                    self._record_fields[record["id"]] = self._fingerprint(fields)
+                    if article.get("hash"):
+                        self._hash_cache.add(article["hash"])
+                        self._record_ids[article["hash"]] = record["id"]
+            
+            # Articles des lots en échec ou non tentés avant l'échéance
+            unwritten = self._unwritten(changed, update_batches) + self._unwritten(new, insert_batches)
+            spooled = self.spool(unwritten)
+            unchanged = len(existing) - len(changed)
+            upsert_span.set(inserted=len(inserted), updated=updated, unchanged=unchanged, spooled=spooled)
+        
+        if inserted:
+            self.stats.record(inserted)
+            self.stats.save()
+            for source, count in Counter(article.get("source", "Unknown") for article in inserted).items():
+                ARTICLES_STORED.labels(source).inc(count)
+        
+        self.logger.info(
+            f"Upserted {len(by_key)} articles: {len(inserted)} inserted, {updated} updated, "
+            f"{unchanged} unchanged, {len(unwritten)} failed"
+        )
+        return {
+            "inserted": len(inserted), "updated": updated, "unchanged": unchanged,
+            "failed": len(unwritten), "spooled": spooled
+        }
+    
+    @staticmethod
+    def _fingerprint(fields: Dict[str, Any]) -> int:
+        """
+        Empreinte des champs Airtable d'un enregistrement, hors date de
+        collecte (conservée lors des mises à jour).
+        
+        Args:
+            fields: Champs au format Airtable
+            
+        Returns:
+            Empreinte comparable au sein du processus
+        """
+        return hash(tuple(sorted(
+            (name, value) for name, value in fields.items() if name != AIRTABLE_FIELDS["collected_date"]
+        )))
+    
+    @staticmethod
+    def _unwritten(articles: List[Dict[str, Any]],
+                   batches: List[Optional[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Retourne les articles non écrits par _write_batches.
+        
+        Args:
+            articles: Articles dans l'ordre des enregistrements envoyés
+            batches: Résultat de _write_batches pour ces enregistrements
+            
+        Returns:
+            Articles des lots en échec (None) et des lots non envoyés
+        """
+        unwritten = []
+        for index, batch in enumerate(batches):
+            if batch is None:
+                unwritten.extend(articles[index * MAX_RECORDS_PER_REQUEST:(index + 1) * MAX_RECORDS_PER_REQUEST])
+        unwritten.extend(articles[len(batches) * MAX_RECORDS_PER_REQUEST:])
+        return unwritten
+    
+    def _write_batches(self, operation: Callable, records: List[Dict[str, Any]],
+                       deadline: Optional[Deadline] = None) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Envoie des enregistrements par lots de MAX_RECORDS_PER_REQUEST.
+        
+        Args:
+            operation: Méthode d'écriture groupée du client (batch_insert, batch_update)
+            records: Enregistrements au format attendu par la méthode
+            deadline: Échéance du cycle (les lots suivants ne sont pas envoyés)
+            
+        Returns:
+            Enregistrements retournés par lot envoyé, dans l'ordre (None pour un
+            lot en échec) ; les lots non envoyés à l'échéance sont absents
+        """
+        results = []
+        for start in range(0, len(records), MAX_RECORDS_PER_REQUEST):
+            if deadline and deadline.expired:
+                self.logger.warning(f"Cycle deadline reached, {len(records) - start} records not written")
+                break
+            try:
+                self._bound_timeout(deadline)
+                results.append(self._call(operation, records[start:start + MAX_RECORDS_PER_REQUEST]))
+            except Exception as e:
+                self.logger.error(f"Failed to write records with {operation.__name__}: {str(e)}")
+                results.append(None)
+        return results
+    
+    def _resolve_record_ids(self, values: List[Any], key: str = "hash",
+                            deadline: Optional[Deadline] = None) -> Dict[Any, str]:
+        """
+        Retourne les identifiants d'enregistrement correspondant à des valeurs de clé.
+        
+        Args:
+            values: Valeurs de la clé (hash par défaut)
+            key: Clé d'article recherchée
+            deadline: Échéance du cycle
+            
+        Returns:
+            Identifiant d'enregistrement par valeur (valeurs inconnues absentes)
+        """
+        field = AIRTABLE_FIELDS[key]
+        index = self._record_ids if key == "hash" else {}
+        missing = sorted({str(value) for value in values if value and value not in index})
+        
+        for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+            if deadline and deadline.expired:
+                break
+            chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+            formula = "OR(" + ", ".join(
+                "{%s} = '%s'" % (field, value.replace("'", "\\'")) for value in chunk
+            ) + ")"
+            try:
+                self._bound_timeout(deadline)
+                records = self._call(self.airtable.get_all, formula=formula, fields=[field])
+            except Exception as e:
+                self.logger.error(f"Error resolving record ids: {str(e)}")
+                continue
+            for record in records:
+                value = record["fields"].get(field)
+                if value is not None:
+                    index[str(value)] = record["id"]
+        
+        return {value: index[value] for value in values if value in index}
+    
+    def get_recent_articles(self, days: Optional[int] = 7, fields: Optional[List[str]] = None,
+                            modified_since: Optional[datetime] = None) -> Optional[List[Dict[str, Any]]]:
         """
         Récupère les articles récents d'Airtable.
         
         Args:
-            days: Nombre de jours dans le passé
+            days: Nombre de jours dans le passé (None pour tous les articles)
+            fields: Clés d'article à retourner (None pour toutes)
+            modified_since: Ne retourne que les articles créés ou modifiés depuis cette date
             
         Returns:
-            Liste des articles récents
+            Liste des articles récents, None en cas d'erreur
         """
         try:
-            # Formule Airtable pour les articles récents
-            formula = f"IS_AFTER({{Collected_Date}}, DATEADD(TODAY(), -{days}, 'days'))"
+            # Formule Airtable pour la fenêtre demandée
+            conditions = []
+            if days is not None:
+                conditions.append(f"IS_AFTER({{Collected_Date}}, DATEADD(TODAY(), -{days}, 'days'))")
+            if modified_since is not None:
+                if modified_since.tzinfo:
+                    modified_since = modified_since.astimezone(timezone.utc)
+                conditions.append(
+                    f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{modified_since.strftime('%Y-%m-%dT%H:%M:%SZ')}'))"
+                )
             
-            records = self.airtable.get_all(
-                formula=formula,
-                sort=[("Collected_Date", "desc")]
-            )
+            options = {"sort": [("Collected_Date", "desc")]}
+            if len(conditions) == 1:
+                options["formula"] = conditions[0]
+            elif conditions:
+                options["formula"] = f"AND({', '.join(conditions)})"
             
-            articles = []
-            for record in records:
-                article = record["fields"]
-                article["airtable_id"] = record["id"]
-                articles.append(article)
+            # Projection : seuls les champs demandés sont transférés
+            if fields:
+                options["fields"] = [AIRTABLE_FIELDS[field] for field in fields if field in AIRTABLE_FIELDS]
+            
+            records = self._call(self.airtable.get_all, **options)
+            articles = [self._convert_from_airtable_format(record) for record in records]
             
             self.logger.info(f"Retrieved {len(articles)} recent articles")
             return articles
             
         except Exception as e:
             self.logger.error(f"Error retrieving recent articles: {str(e)}")
-            return []
+            return None
+    
+    def close(self):
+        """
+        Ferme la session HTTP du client Airtable.
+        """
+        self.airtable.session.close()
     
     def test_connection(self) -> bool:
         """
@@ -275,7 +671,7 @@ class AirtableStorage(BaseStorage):
         """
         try:
             # Test simple en récupérant les métadonnées de la table
-            records = self.airtable.get_all(max_records=1)
+            records = self._call(self.airtable.get_all, max_records=1)
             self.logger.info("Airtable connection test successful")
             return True
             
@@ -283,35 +679,39 @@ class AirtableStorage(BaseStorage):
             self.logger.error(f"Airtable connection test failed: {str(e)}")
             return False
     
-    def get_stats(self) -> Dict[str, Any]:
+    def reconcile_stats(self) -> bool:
         """
-        Retourne des statistiques sur les données stockées.
+        Recalcule les compteurs à partir de la table Airtable complète.
+        
+        Seuls les champs Source et Collected_Date sont transférés ; en cas
+        d'erreur, les compteurs existants sont conservés.
         
         Returns:
-            Dictionnaire avec les statistiques
+            True si la réconciliation a réussi
         """
         try:
-            # Total d'articles
-            total_records = len(self.airtable.get_all(fields=["Hash"]))
-            
-            # Articles récents (7 derniers jours)
-            recent_articles = self.get_recent_articles(7)
-            recent_count = len(recent_articles)
-            
-            # Articles par source
-            source_stats = {}
-            for article in recent_articles:
-                source = article.get("Source", "Unknown")
-                source_stats[source] = source_stats.get(source, 0) + 1
-            
-            return {
-                "total_articles": total_records,
-                "recent_articles_7days": recent_count,
-                "articles_by_source": source_stats,
-                "cache_size": len(self._hash_cache),
-                "last_cache_update": self._last_cache_update
-            }
-            
+            records = self._call(self.airtable.get_all, fields=["Source", "Collected_Date"])
         except Exception as e:
-            self.logger.error(f"Error getting stats: {str(e)}")
-            return {}
\ No newline at end of file
+            self.logger.error(f"Error reconciling stats: {str(e)}")
+            return False
+        
+        self.stats.rebuild(self._convert_from_airtable_format(record) for record in records)
+        self.stats.save()
+        return True
+    
+    def get_stats(self, reconcile: bool = False) -> Dict[str, Any]:
+        """
+        Retourne des statistiques sur les données stockées.
+        
+        Args:
+            reconcile: Force la réconciliation avec Airtable
+        
+        Returns:
+            Dictionnaire avec les statistiques
+        """
+        stats = super().get_stats(reconcile)
+        stats.update({
+            "cache_size": len(self._hash_cache),
+            "last_cache_update": self._last_cache_update
+        })
+        return stats
\ No newline at end of file
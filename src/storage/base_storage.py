@@ -1,6 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import Counter
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import os
+import json
 import logging
+import shutil
+
+from monitoring import ConnectionHealth, span
+from monitoring.metrics import ARTICLES_DEDUPED
+from utils.deadline import Deadline
+from .stats import StorageStats
 
 class BaseStorage(ABC):
     """
@@ -20,14 +30,30 @@ class BaseStorage(ABC):
         self.config = config or {}
         self.logger = logging.getLogger(f"storage.{name}")
         self.is_enabled = self.config.get("enabled", True)
+        
+        # Fichier JSONL des articles non écrits avant l'échéance d'un cycle
+        self.spool_path: Optional[str] = None
+        
+        # État de connexion, alimenté par les opérations réelles
+        self.health = ConnectionHealth(self.config.get("health_ttl", 300))
+        
+        # Compteurs d'articles maintenus à chaque écriture (persistés via stats.attach)
+        self.stats = StorageStats(self.config.get("stats_reconcile_interval", 86400))
+        
+        # Enrichissement optionnel des nouveaux articles (voir attach_enricher)
+        self.enricher = None
     
     @abstractmethod
-    def store(self, articles: List[Dict[str, Any]]) -> bool:
+    def store(self, articles: List[Dict[str, Any]], deadline: Optional[Deadline] = None) -> bool:
         """
         Stocke une liste d'articles.
         
+        Les articles qui n'ont pas pu être écrits (échéance ou erreur) sont
+        mis en attente (spool) et rejoués au cycle suivant.
+        
         Args:
             articles: Liste d'articles à stocker
+            deadline: Échéance du cycle (None pour illimitée)
             
         Returns:
             True si le stockage a réussi, False sinon
@@ -48,24 +74,34 @@ class BaseStorage(ABC):
         pass
     
     @abstractmethod
-    def get_recent_articles(self, days: int = 7) -> List[Dict[str, Any]]:
+    def get_recent_articles(self, days: Optional[int] = 7, fields: Optional[List[str]] = None,
+                            modified_since: Optional[datetime] = None) -> Optional[List[Dict[str, Any]]]:
         """
         Récupère les articles récents.
         
+        Le filtrage et la projection sont faits côté stockage : seuls les
+        articles de la fenêtre et les champs demandés sont transférés.
+        
         Args:
-            days: Nombre de jours dans le passé
+            days: Nombre de jours dans le passé (None pour tous les articles)
+            fields: Clés d'article à retourner (None pour toutes)
+            modified_since: Ne retourne que les articles créés ou modifiés depuis cette date
             
         Returns:
-            Liste des articles récents
+            Liste des articles récents (clés d'article et "id" de l'enregistrement),
+            None si la lecture a échoué
         """
         pass
     
-    def filter_new_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_new_articles(self, articles: List[Dict[str, Any]],
+                            deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         Filtre les articles pour ne garder que les nouveaux.
         
         Args:
             articles: Liste d'articles à filtrer
+            deadline: Échéance du cycle ; les articles non vérifiés à
+                      l'échéance sont conservés tels quels
             
         Returns:
             Liste des articles non-dupliqués
@@ -74,21 +110,109 @@ class BaseStorage(ABC):
             return []
         
         new_articles = []
-        for article in articles:
-            article_hash = article.get("hash")
-            if article_hash and not self.check_duplicate(article_hash):
-                new_articles.append(article)
+        duplicates = Counter()
+        with span("dedupe", items_in=len(articles)) as dedupe_span:
+            for index, article in enumerate(articles):
+                if deadline and deadline.expired:
+                    self.logger.warning(f"Cycle deadline reached, {len(articles) - index} articles not checked for duplicates")
+                    new_articles.extend(a for a in articles[index:] if a.get("hash"))
+                    break
+                
+                article_hash = article.get("hash")
+                if not article_hash:
+                    continue
+                if self.check_duplicate(article_hash):
+                    duplicates[article.get("source", "Unknown")] += 1
+                else:
+                    new_articles.append(article)
+            dedupe_span.set(items_out=len(new_articles))
+        
+        for source, count in duplicates.items():
+            ARTICLES_DEDUPED.labels(source).inc(count)
         
         self.logger.info(f"Filtered {len(articles)} articles to {len(new_articles)} new articles")
         return new_articles
     
-    def batch_store(self, articles: List[Dict[str, Any]], batch_size: int = 10) -> bool:
+    def update_many(self, updates: List[Dict[str, Any]], key: str = "hash",
+                    deadline: Optional[Deadline] = None) -> List[Any]:
+        """
+        Met à jour des articles déjà stockés.
+        
+        Chaque mise à jour est partielle : seuls ses champs sont modifiés,
+        l'article étant identifié par la clé `key`. Les stockages qui ne
+        savent pas modifier un article ignorent les mises à jour.
+        
+        Args:
+            updates: Champs à modifier, avec la clé d'identification
+            key: Clé d'article identifiant l'enregistrement
+            deadline: Échéance du cycle (None pour illimitée)
+        
+        Returns:
+            Valeurs de la clé des articles effectivement mis à jour
+        """
+        if updates:
+            self.logger.warning(f"{self.name} storage does not support updates, {len(updates)} ignored")
+        return []
+    
+    def upsert_many(self, articles: List[Dict[str, Any]], key: str = "hash",
+                    deadline: Optional[Deadline] = None) -> Dict[str, int]:
+        """
+        Insère les nouveaux articles et met à jour ceux déjà stockés.
+        
+        Implémentation générique : les articles existants sont repérés en
+        une seule lecture des clés stockées (get_recent_articles) puis
+        transmis à update_many, les autres à store. Les stockages distants
+        la remplacent par des écritures groupées.
+        
+        Args:
+            articles: Articles complets à écrire
+            key: Clé d'article identifiant l'enregistrement
+            deadline: Échéance du cycle (None pour illimitée)
+        
+        Returns:
+            Nombre d'articles insérés ("inserted"), mis à jour ("updated"),
+            inchangés ("unchanged"), non écrits ("failed") et mis en attente
+            parmi ces derniers ("spooled")
+        """
+        # Une seule écriture par clé : la dernière version l'emporte
+        by_key = {article[key]: article for article in articles if article.get(key)}
+        if not by_key:
+            return {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0, "spooled": 0}
+        
+        stored = self.get_recent_articles(days=None, fields=[key])
+        if stored is None:
+            self.logger.error(f"Could not read stored {key} values, spooling {len(by_key)} articles")
+            unwritten = list(by_key.values())
+            return {"inserted": 0, "updated": 0, "unchanged": 0,
+                    "failed": len(unwritten), "spooled": self.spool(unwritten)}
+        
+        stored_keys = {article.get(key) for article in stored}
+        existing = [article for value, article in by_key.items() if value in stored_keys]
+        new = [article for value, article in by_key.items() if value not in stored_keys]
+        
+        # La date de collecte d'un article existant reste celle de sa première écriture
+        written = set(self.update_many(
+            [{k: v for k, v in article.items() if k != "collected_date"} for article in existing], key, deadline
+        ))
+        unwritten = [article for article in existing if article[key] not in written]
+        spooled = self.spool(unwritten)
+        
+        # store met lui-même en attente les articles qu'il n'a pas écrits
+        inserted = len(new) if self.store(new, deadline) else 0
+        return {
+            "inserted": inserted, "updated": len(written), "unchanged": 0,
+            "failed": len(unwritten) + len(new) - inserted, "spooled": spooled + len(new) - inserted
+        }
+    
+    def batch_store(self, articles: List[Dict[str, Any]], batch_size: int = 10,
+                    deadline: Optional[Deadline] = None) -> bool:
         """
         Stocke les articles par lots pour améliorer les performances.
         
         Args:
             articles: Liste d'articles à stocker
             batch_size: Taille des lots
+            deadline: Échéance du cycle ; les lots restants sont mis en attente
             
         Returns:
             True si tous les lots ont été stockés avec succès
@@ -100,8 +224,12 @@ class BaseStorage(ABC):
         total_batches = (len(articles) + batch_size - 1) // batch_size
         
         for i in range(0, len(articles), batch_size):
+            if deadline and deadline.expired:
+                self.spool(articles[i:])
+                break
+            
             batch = articles[i:i + batch_size]
-            if self.store(batch):
+            if self.store(batch, deadline):
                 success_count += 1
             else:
                 self.logger.error(f"Failed to store batch {i//batch_size + 1}/{total_batches}")
@@ -111,27 +239,240 @@ class BaseStorage(ABC):
         
         return success_rate == 1.0
     
+    def get_stats(self, reconcile: bool = False) -> Dict[str, Any]:
+        """
+        Retourne des statistiques sur les données stockées.
+        
+        Les statistiques proviennent des compteurs locaux ; le stockage
+        distant n'est parcouru que lors d'une réconciliation périodique.
+        
+        Args:
+            reconcile: Force la réconciliation avec le stockage
+            
+        Returns:
+            Dictionnaire avec les statistiques
+        """
+        if reconcile or self.stats.needs_reconcile:
+            self.reconcile_stats()
+        return self.stats.summary()
+    
+    def reconcile_stats(self) -> bool:
+        """
+        Recalcule les compteurs à partir du stockage complet.
+        
+        En cas d'échec de la lecture, les compteurs existants sont conservés.
+        
+        Returns:
+            True si la réconciliation a réussi
+        """
+        articles = self.get_recent_articles(days=None, fields=["source", "collected_date"])
+        if articles is None:
+            self.logger.error("Error reconciling stats: could not read stored articles")
+            return False
+        
+        self.stats.rebuild(articles)
+        self.stats.save()
+        return True
+    
+    def attach_enricher(self, enricher):
+        """
+        Définit l'enrichissement appliqué aux articles nouveaux, après déduplication.
+        
+        Args:
+            enricher: Objet exposant enrich(articles, deadline) (None pour désactiver)
+        """
+        self.enricher = enricher
+    
+    def enrich_new_articles(self, articles: List[Dict[str, Any]],
+                            deadline: Optional[Deadline] = None) -> int:
+        """
+        Enrichit les articles qui vont être insérés (les doublons sont déjà écartés).
+        
+        Une erreur d'enrichissement n'empêche pas le stockage.
+        
+        Args:
+            articles: Nouveaux articles, modifiés sur place
+            deadline: Échéance du cycle
+            
+        Returns:
+            Nombre d'articles enrichis
+        """
+        if not self.enricher or not articles:
+            return 0
+        try:
+            return self.enricher.enrich(articles, deadline)
+        except Exception as e:
+            self.logger.error(f"Error enriching articles: {e}")
+            return 0
+    
+    def attach_spool(self, path: str):
+        """
+        Définit le fichier d'attente des articles non écrits.
+        
+        Args:
+            path: Fichier JSONL d'attente
+        """
+        self.spool_path = path
+    
+    def spool(self, articles: List[Dict[str, Any]]) -> int:
+        """
+        Met en attente des articles non écrits (ajout au fichier JSONL).
+        
+        Args:
+            articles: Articles à rejouer au prochain cycle
+            
+        Returns:
+            Nombre d'articles mis en attente
+        """
+        if not articles:
+            return 0
+        
+        if not self.spool_path:
+            self.logger.warning(f"No spool configured, {len(articles)} articles dropped")
+            return 0
+        
+        try:
+            directory = os.path.dirname(self.spool_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            with open(self.spool_path, 'a', encoding='utf-8') as file:
+                for article in articles:
+                    file.write(json.dumps(article, default=str) + "\n")
+            
+            self.logger.warning(f"Spooled {len(articles)} articles for the next cycle")
+            return len(articles)
+            
+        except OSError as e:
+            self.logger.error(f"Could not spool articles: {e}")
+            return 0
+    
+    def spool_depth(self) -> int:
+        """
+        Retourne le nombre d'articles en attente.
+        
+        Returns:
+            Nombre de lignes des fichiers d'attente et de rejeu
+        """
+        if not self.spool_path:
+            return 0
+        
+        depth = 0
+        for path in (self.spool_path, self._replay_path()):
+            try:
+                with open(path, 'rb') as file:
+                    depth += sum(1 for line in file if line.strip())
+            except OSError:
+                continue
+        return depth
+    
+    def _replay_path(self) -> str:
+        """Fichier des articles en cours de rejeu."""
+        return f"{self.spool_path}.replay"
+    
+    def drain_spool(self) -> List[Dict[str, Any]]:
+        """
+        Récupère les articles en attente.
+        
+        Le fichier d'attente est déplacé vers un fichier de rejeu, supprimé
+        par ack_spool() une fois le stockage terminé : si l'écriture lève une
+        exception ou si le processus s'arrête, les articles sont relus au
+        cycle suivant.
+        
+        Returns:
+            Articles mis en attente lors des cycles précédents
+        """
+        if not self.spool_path:
+            return []
+        
+        replay_path = self._replay_path()
+        articles = []
+        try:
+            if os.path.exists(self.spool_path):
+                if os.path.exists(replay_path):
+                    # Rejeu précédent non confirmé : les deux fichiers sont fusionnés
+                    with open(self.spool_path, 'rb') as source, open(replay_path, 'ab') as target:
+                        shutil.copyfileobj(source, target)
+                    os.remove(self.spool_path)
+                else:
+                    os.replace(self.spool_path, replay_path)
+            
+            if not os.path.exists(replay_path):
+                return []
+            
+            with open(replay_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        articles.append(json.loads(line))
+                    except ValueError:
+                        self.logger.warning("Skipping corrupted spool entry")
+            
+        except OSError as e:
+            self.logger.error(f"Could not read spool: {e}")
+            return []
+        
+        if articles:
+            self.logger.info(f"Replaying {len(articles)} spooled articles")
+        return articles
+    
+    def ack_spool(self):
+        """
+        Supprime le fichier de rejeu une fois ses articles écrits ou remis en attente.
+        """
+        if not self.spool_path:
+            return
+        
+        try:
+            os.remove(self._replay_path())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"Could not remove replayed spool: {e}")
+    
     @abstractmethod
     def test_connection(self) -> bool:
         """
         Teste la connexion au système de stockage.
         
+        Le résultat doit être enregistré dans self.health, comme celui de
+        toute opération réelle.
+        
         Returns:
             True si la connexion fonctionne, False sinon
         """
         pass
     
-    def get_status(self) -> Dict[str, Any]:
+    def close(self):
+        """
+        Libère les ressources du système de stockage (connexions, sessions).
+        """
+        pass
+    
+    def get_status(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Retourne le statut du système de stockage.
         
+        L'état de connexion provient des dernières opérations ; un test de
+        connexion n'est lancé que si cet état est périmé (health_ttl) ou
+        sur demande.
+        
+        Args:
+            refresh: Force un test de connexion
+        
         Returns:
             Dictionnaire avec les informations de statut
         """
+        if refresh or not self.health.is_fresh:
+            self.test_connection()
+        
         return {
             "name": self.name,
             "enabled": self.is_enabled,
-            "connection": self.test_connection(),
+            "connection": self.health.healthy,
+            "health": self.health.get_status(),
             "config": self.config
         }
     
@@ -0,0 +1,29 @@
+"""
+Construction du système de stockage à partir de la configuration.
+"""
+
+from typing import Any, Dict
+
+from registry import STORAGE
+from .base_storage import BaseStorage
+
+
+def create_storage(storage_config: Dict[str, Any]) -> BaseStorage:
+    """
+    Crée le système de stockage décrit par la configuration.
+    
+    Le type est résolu par le registre (ou par `class: "module:Classe"`) ;
+    seul son module est importé.
+    
+    Args:
+        storage_config: Section "storage" de la configuration
+        
+    Returns:
+        Système de stockage initialisé
+        
+    Raises:
+        ValueError: Si le type de stockage n'est pas supporté
+    """
+    storage_type = storage_config.get("type", "airtable")
+    storage_class = STORAGE.load(storage_type, storage_config.get("class"))
+    return storage_class(dict(storage_config))
\ No newline at end of file
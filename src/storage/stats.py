@@ -0,0 +1,175 @@
+"""
+Statistiques de stockage maintenues localement.
+Les compteurs sont mis à jour à chaque écriture réussie et persistés, ce qui
+évite de parcourir la table distante à chaque consultation.
+"""
+
+import time
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from utils.dates import to_epoch
+from utils.state import load_state, save_state
+
+
+def _day_key(value: Any) -> Optional[str]:
+    """
+    Retourne le jour UTC (YYYY-MM-DD) d'une date de collecte.
+
+    Args:
+        value: Horodatage Unix, datetime, date ou chaîne ISO
+
+    Returns:
+        Jour au format ISO (None si la date est absente ou invalide)
+    """
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value.isoformat()
+    timestamp = to_epoch(value)
+    if timestamp is None:
+        return None
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def _utc_today() -> date:
+    """Jour courant en UTC, comme les clés de _day_key."""
+    return datetime.now(timezone.utc).date()
+
+
+class StorageStats:
+    """
+    Compteurs d'articles stockés : total, par source et par (jour, source).
+
+    Les compteurs journaliers sont conservés retention_days jours. Une
+    réconciliation avec le stockage distant, seule opération coûteuse, n'est
+    nécessaire que toutes les reconcile_interval secondes.
+    """
+
+    def __init__(self, reconcile_interval: float = 86400, retention_days: int = 90):
+        """
+        Initialise des compteurs vides.
+
+        Args:
+            reconcile_interval: Délai entre deux réconciliations en secondes
+            retention_days: Nombre de jours de compteurs journaliers conservés
+        """
+        self.reconcile_interval = reconcile_interval
+        self.retention_days = retention_days
+        self.state_path: Optional[str] = None
+        self.logger = logging.getLogger("storage.stats")
+        self._lock = threading.Lock()
+        self._state = self._empty_state()
+
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        """Retourne un état sans compteur."""
+        return {"total": 0, "by_source": {}, "by_day": {}, "last_reconciled": None}
+
+    def attach(self, state_path: str):
+        """
+        Associe un fichier d'état et charge les compteurs persistés.
+
+        Args:
+            state_path: Fichier JSON des compteurs
+        """
+        self.state_path = state_path
+        state = load_state(state_path)
+        if state:
+            with self._lock:
+                self._state.update(state)
+
+    @property
+    def needs_reconcile(self) -> bool:
+        """Indique si les compteurs doivent être réconciliés avec le stockage."""
+        last = self._state["last_reconciled"]
+        return last is None or time.time() - last >= self.reconcile_interval
+
+    def record(self, articles: Iterable[Dict[str, Any]]):
+        """
+        Ajoute des articles écrits avec succès aux compteurs.
+
+        Args:
+            articles: Articles stockés
+        """
+        with self._lock:
+            for article in articles:
+                self._add(article)
+            self._prune()
+
+    def rebuild(self, articles: Iterable[Dict[str, Any]]):
+        """
+        Recalcule les compteurs à partir de tous les articles du stockage.
+
+        Args:
+            articles: Articles du stockage (source et collected_date suffisent)
+        """
+        with self._lock:
+            self._state = self._empty_state()
+            for article in articles:
+                self._add(article)
+            self._prune()
+            self._state["last_reconciled"] = time.time()
+
+        self.logger.info(f"Reconciled storage stats: {self._state['total']} articles")
+
+    def _add(self, article: Dict[str, Any]):
+        """Incrémente les compteurs pour un article (verrou détenu)."""
+        source = article.get("source") or "Unknown"
+        self._state["total"] += 1
+        self._state["by_source"][source] = self._state["by_source"].get(source, 0) + 1
+
+        day = _day_key(article.get("collected_date"))
+        if day:
+            day_counts = self._state["by_day"].setdefault(day, {})
+            day_counts[source] = day_counts.get(source, 0) + 1
+
+    def _prune(self):
+        """Retire les compteurs journaliers hors rétention (verrou détenu)."""
+        cutoff = (_utc_today() - timedelta(days=self.retention_days)).isoformat()
+        for day in [day for day in self._state["by_day"] if day < cutoff]:
+            del self._state["by_day"][day]
+
+    def summary(self, days: int = 7) -> Dict[str, Any]:
+        """
+        Retourne les statistiques à partir des compteurs.
+
+        Args:
+            days: Fenêtre des statistiques récentes en jours
+
+        Returns:
+            Dictionnaire avec le total, les articles récents par source et par jour
+        """
+        cutoff = (_utc_today() - timedelta(days=days)).isoformat()
+        recent_by_source: Dict[str, int] = {}
+        recent_by_day: Dict[str, int] = {}
+
+        with self._lock:
+            for day, counts in self._state["by_day"].items():
+                if day <= cutoff:
+                    continue
+                recent_by_day[day] = sum(counts.values())
+                for source, count in counts.items():
+                    recent_by_source[source] = recent_by_source.get(source, 0) + count
+
+            last_reconciled = self._state["last_reconciled"]
+            return {
+                "total_articles": self._state["total"],
+                f"recent_articles_{days}days": sum(recent_by_day.values()),
+                "articles_by_source": recent_by_source,
+                "articles_by_day": dict(sorted(recent_by_day.items())),
+                "total_by_source": dict(self._state["by_source"]),
+                "last_reconciled": (
+                    datetime.fromtimestamp(last_reconciled).isoformat() if last_reconciled else None
+                )
+            }
+
+    def save(self) -> bool:
+        """
+        Persiste les compteurs.
+
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        with self._lock:
+            return save_state(self.state_path, self._state)
\ No newline at end of file
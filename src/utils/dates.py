@@ -0,0 +1,145 @@
+"""
+Normalisation des dates : toutes les dates manipulées par l'agent sont
+converties une seule fois en UTC, puis transportées sous forme d'horodatage
+Unix (secondes, float) jusqu'au stockage.
+"""
+
+import calendar
+import time
+from datetime import date, datetime, timezone
+from email.utils import mktime_tz, parsedate_tz
+from functools import lru_cache
+from typing import Any, Optional
+
+# Analyseur de secours, importé à la première date non standard
+_dateutil_parser = None
+
+
+def _fallback_parse(value: str) -> Optional[datetime]:
+    """Analyse une date de format libre avec dateutil (import différé, une seule fois)."""
+    global _dateutil_parser
+    if _dateutil_parser is None:
+        try:
+            from dateutil import parser
+        except ImportError:
+            return None
+        _dateutil_parser = parser
+    try:
+        return _dateutil_parser.parse(value)
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def parse_epoch(value: str) -> Optional[float]:
+    """
+    Convertit une date textuelle en horodatage Unix.
+
+    ISO 8601 et RFC 822 sont analysés sans dépendance externe ; les autres
+    formats passent par dateutil. Une date sans fuseau est considérée en UTC.
+    Le résultat est mémorisé : un flux republie souvent les mêmes dates.
+
+    Args:
+        value: Date brute
+
+    Returns:
+        Horodatage Unix (None si la date n'est pas reconnue)
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    parsed = None
+    if value[:1].isdigit() and "-" in value[:10]:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00").replace("z", "+00:00"))
+        except ValueError:
+            parsed = None
+    else:
+        parts = parsedate_tz(value)
+        if parts is not None:
+            if parts[9] is None:
+                parts = parts[:9] + (0,)
+            try:
+                return float(mktime_tz(parts))
+            except (OverflowError, ValueError):
+                return None
+
+    if parsed is None:
+        parsed = _fallback_parse(value)
+        if parsed is None:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    try:
+        return parsed.timestamp()
+    except (OverflowError, ValueError, OSError):
+        return None
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """
+    Convertit une date quelconque en horodatage Unix.
+
+    Args:
+        value: Horodatage, datetime (naïf = UTC), date, struct_time (UTC) ou chaîne
+
+    Returns:
+        Horodatage Unix (None si la valeur est absente ou invalide)
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc).timestamp()
+    if isinstance(value, time.struct_time):
+        try:
+            return float(calendar.timegm(value))
+        except (OverflowError, ValueError):
+            return None
+    if isinstance(value, str):
+        return parse_epoch(value)
+    return None
+
+
+def to_utc(value: Any) -> Optional[datetime]:
+    """
+    Convertit une date quelconque en datetime UTC.
+
+    Args:
+        value: Valeur acceptée par to_epoch
+
+    Returns:
+        Datetime avec fuseau UTC (None si la valeur est absente ou invalide)
+    """
+    epoch = to_epoch(value)
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+
+def now_epoch() -> float:
+    """Retourne l'horodatage Unix courant."""
+    return time.time()
+
+
+def isoformat_utc(value: Any) -> Optional[str]:
+    """
+    Formate une date en ISO 8601 UTC, au format attendu par Airtable.
+
+    Args:
+        value: Valeur acceptée par to_epoch
+
+    Returns:
+        Date au format YYYY-MM-DDTHH:MM:SS.000Z (None si la valeur est invalide)
+    """
+    moment = to_utc(value)
+    if moment is None:
+        return None
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
\ No newline at end of file
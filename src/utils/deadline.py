@@ -0,0 +1,73 @@
+"""
+Échéance d'un cycle de collecte, transmise aux collecteurs et au stockage.
+"""
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    Budget de temps d'un cycle.
+
+    Chaque étape consulte le temps restant pour borner ses requêtes et
+    s'arrête proprement une fois l'échéance atteinte. Un budget None est
+    illimité.
+    """
+
+    # Timeout minimal accordé à une requête lancée juste avant l'échéance
+    MIN_TIMEOUT = 1.0
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Initialise l'échéance.
+
+        Args:
+            seconds: Budget en secondes à partir de maintenant (None pour illimité)
+        """
+        self.seconds = seconds
+        self._expires_at = time.monotonic() + seconds if seconds is not None else None
+
+    def expire(self):
+        """
+        Avance l'échéance à maintenant (arrêt demandé).
+
+        Les étapes en cours s'arrêtent à leur prochaine vérification ; les
+        requêtes déjà lancées se terminent dans leur propre timeout.
+        """
+        self._expires_at = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        """
+        Retourne le temps restant.
+
+        Returns:
+            Secondes restantes (0 si expirée, None si illimitée)
+        """
+        if self._expires_at is None:
+            return None
+        return max(self._expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Indique si l'échéance est atteinte."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: float) -> float:
+        """
+        Borne un timeout de requête par le temps restant.
+
+        Args:
+            default: Timeout habituel de la requête
+
+        Returns:
+            Timeout à utiliser
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(min(default, remaining), self.MIN_TIMEOUT)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining()})"
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Verrou inter-processus empêchant deux cycles de collecte simultanés.
+"""
+
+import os
+import logging
+from typing import Optional
+
+logger = logging.getLogger("utils.locking")
+
+
+class CycleLock:
+    """
+    Verrou exclusif non bloquant basé sur un fichier.
+
+    Le verrou est posé par le système (fcntl sous Unix, msvcrt sous Windows)
+    et libéré automatiquement si le processus se termine brutalement.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialise le verrou.
+
+        Args:
+            path: Fichier de verrou
+        """
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        """
+        Tente de prendre le verrou sans attendre.
+
+        Returns:
+            True si le verrou a été obtenu
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        lock_file = open(self.path, "a+")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        """Libère le verrou."""
+        if self._file is None:
+            return
+
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning(f"Could not release lock {self.path}: {e}")
+        finally:
+            self._file.close()
+            self._file = None
+
+    def owner(self) -> Optional[str]:
+        """
+        Retourne le PID inscrit dans le fichier de verrou.
+
+        Returns:
+            PID du détenteur (None si inconnu)
+        """
+        try:
+            with open(self.path, "r") as lock_file:
+                return lock_file.read().strip() or None
+        except OSError:
+            return None
\ No newline at end of file
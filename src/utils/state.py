@@ -0,0 +1,62 @@
+"""
+Persistance locale de l'état de l'agent (fichiers JSON).
+"""
+
+import os
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger("utils.state")
+
+
+def load_state(path: str, default: Any = None) -> Any:
+    """
+    Charge un état JSON depuis le disque.
+    
+    Args:
+        path: Chemin du fichier d'état
+        default: Valeur retournée si le fichier est absent ou illisible
+        
+    Returns:
+        État chargé ou valeur par défaut
+    """
+    if not path or not os.path.exists(path):
+        return default
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load state file {path}: {e}")
+        return default
+
+
+def save_state(path: str, data: Any) -> bool:
+    """
+    Sauvegarde un état JSON de manière atomique.
+    
+    Args:
+        path: Chemin du fichier d'état
+        data: Données sérialisables en JSON
+        
+    Returns:
+        True si la sauvegarde a réussi
+    """
+    if not path:
+        return False
+    
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, default=str)
+        os.replace(tmp_path, path)
+        return True
+        
+    except OSError as e:
+        logger.error(f"Could not save state file {path}: {e}")
+        return False
\ No newline at end of file